@@ -25,7 +25,7 @@ def get_property_usage_frequency(folio: FOLIO) -> List[Tuple[str, int]]:
     property_counter = Counter()
     
     # Go through all triples and count property usage
-    for triple in folio._cached_triples:
+    for triple in folio.triples:
         # If the predicate matches a property label, count it
         if triple[1] in prop_label_to_iri:
             property_counter[triple[1]] += 1
@@ -16,7 +16,10 @@ __url__ = "https://openlegalstandard.org/"
 
 # import graph to re-export
 from .graph import FOLIO, FOLIOTypes, FOLIO_TYPE_IRIS
-from .models import OWLClass, OWLObjectProperty, NSMAP
+from .columns import ClassColumns
+from .hierarchy import ClassAdjacency
+from .models import ChangeSet, OWLClass, OWLObjectProperty, NSMAP, QueryPlan
+from .triples import TripleStore
 
 __all__ = [
     "FOLIO",
@@ -24,5 +27,10 @@ __all__ = [
     "FOLIO_TYPE_IRIS",
     "OWLClass",
     "OWLObjectProperty",
+    "ChangeSet",
+    "QueryPlan",
     "NSMAP",
+    "TripleStore",
+    "ClassColumns",
+    "ClassAdjacency",
 ]
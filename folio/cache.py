@@ -0,0 +1,624 @@
+"""
+Local ontology cache store for the FOLIO (Federated Open Legal Information Ontology) Python library.
+
+Cached OWL files are stored under a configurable cache directory, keyed by a blake2b hash of the
+ontology source.  Each OWL cache file may have a JSON sidecar file recording the HTTP validators
+(ETag, Last-Modified) and GitHub commit SHA of the cached ontology, which are used to issue
+conditional requests when revalidating the cache, along with a content digest that is checked
+on every read.  Cache files are handled as bytes throughout, and are memory-mapped where the
+platform allows so that they are verified and parsed without being copied into memory.
+
+Writes go to a temporary file that is atomically renamed into place while holding an
+inter-process lock, and are skipped entirely if the content is unchanged, so that many
+processes starting at once neither rewrite the cache nor observe a partially-written file.
+"""
+
+# annotations
+from __future__ import annotations
+
+# imports
+import hashlib
+import mmap
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+# packages
+import httpx
+from pydantic import BaseModel, Field, ValidationError
+
+# project imports
+from folio.config import DEFAULT_CACHE_DIR
+from folio.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None  # type: ignore[assignment]
+
+# cache metadata sidecar file extension
+METADATA_SUFFIX: str = ".json"
+
+# cache lock file extension
+LOCK_SUFFIX: str = ".lock"
+
+# seconds between lock attempts on platforms without blocking locks
+LOCK_RETRY_INTERVAL: float = 0.1
+
+# whether cache files are memory-mapped; Windows cannot replace a file while it is mapped
+MAP_CACHE_FILES: bool = os.name != "nt"
+
+# number of characters or bytes digested at a time from strings and files
+DIGEST_CHUNK_SIZE: int = 1 << 20
+
+# set up logger
+LOGGER = get_logger(__name__)
+
+
+class CacheMetadata(BaseModel):
+    """
+    HTTP validators, source information, and content digest for a cached ontology file.
+    """
+
+    url: Optional[str] = Field(None, description="The URL the ontology was loaded from.")
+    etag: Optional[str] = Field(None, description="The ETag response header.")
+    last_modified: Optional[str] = Field(
+        None, description="The Last-Modified response header."
+    )
+    commit_sha: Optional[str] = Field(
+        None, description="The GitHub commit SHA of the branch head, if known."
+    )
+    digest: Optional[str] = Field(
+        None, description="The blake2b hex digest of the cached ontology file."
+    )
+
+    @staticmethod
+    def from_response(
+        response: httpx.Response, commit_sha: Optional[str] = None
+    ) -> CacheMetadata:
+        """
+        Create cache metadata from an HTTP response.
+
+        Args:
+            response (httpx.Response): The HTTP response.
+            commit_sha (Optional[str]): The GitHub commit SHA, if known.
+
+        Returns:
+            CacheMetadata: The cache metadata.
+        """
+        return CacheMetadata(
+            url=str(response.url),
+            etag=response.headers.get("ETag", None),
+            last_modified=response.headers.get("Last-Modified", None),
+            commit_sha=commit_sha,
+        )
+
+    def get_conditional_headers(self) -> Dict[str, str]:
+        """
+        Get the conditional request headers for these validators.
+
+        Returns:
+            Dict[str, str]: The If-None-Match and If-Modified-Since headers, when available.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def get_digest(data: str | bytes | mmap.mmap | Path) -> str:
+    """
+    Get the content digest for a cached file.
+
+    Strings and files are digested a chunk at a time, so neither is copied into memory whole.
+
+    Args:
+        data (str | bytes | mmap.mmap | Path): The file contents, or the path to the file;
+            strings are digested as UTF-8, the encoding they are cached in.
+
+    Returns:
+        str: The blake2b hex digest.
+    """
+    if isinstance(data, Path):
+        with data.open("rb") as input_file:
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(input_file, hashlib.blake2b).hexdigest()
+
+            # hashlib.file_digest() is only available from Python 3.11
+            digest = hashlib.blake2b()
+            for chunk in iter(lambda: input_file.read(DIGEST_CHUNK_SIZE), b""):
+                digest.update(chunk)
+            return digest.hexdigest()
+
+    if isinstance(data, str):
+        digest = hashlib.blake2b()
+        for start in range(0, len(data), DIGEST_CHUNK_SIZE):
+            digest.update(data[start : start + DIGEST_CHUNK_SIZE].encode("utf-8"))
+        return digest.hexdigest()
+
+    return hashlib.blake2b(data).hexdigest()
+
+
+class SourceDigest:
+    """
+    Content digest of the OWL buffer a parsed ontology state was built from.
+
+    The digest is either known up front, such as one already verified against the cache
+    metadata, or computed from an immutable in-memory buffer the first time it is needed, after
+    which the buffer is released.  Pickling stores only the digest.
+    """
+
+    __slots__ = ("_value", "_buffer")
+
+    def __init__(
+        self, value: Optional[str] = None, buffer: Optional[str | bytes] = None
+    ) -> None:
+        """
+        Initialize the digest.
+
+        Args:
+            value (Optional[str]): The digest, if known.
+            buffer (Optional[str | bytes]): The buffer to digest on first use otherwise.
+
+        Returns:
+            None
+        """
+        if value is None and buffer is None:
+            raise ValueError("Either a digest or a buffer is required.")
+        self._value: Optional[str] = value
+        self._buffer: Optional[str | bytes] = None if value is not None else buffer
+
+    def get(self) -> str:
+        """
+        Get the digest, computing it from the buffer if necessary.
+
+        Returns:
+            str: The blake2b hex digest.
+        """
+        if self._value is None:
+            self._value = get_digest(self._buffer)  # type: ignore[arg-type]
+            self._buffer = None
+        return self._value
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SourceDigest):
+            return self.get() == other.get()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.get())
+
+    def __repr__(self) -> str:
+        return f"SourceDigest({self._value or 'deferred'})"
+
+    def __getstate__(self) -> str:
+        return self.get()
+
+    def __setstate__(self, state: str) -> None:
+        self._value = state
+        self._buffer = None
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Atomically write a file by writing a temporary file in the same directory and renaming it.
+
+    Args:
+        path (Path): The destination path.
+        data (bytes): The file contents.
+
+    Returns:
+        None
+    """
+    file_descriptor, temp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, "wb") as output_file:
+            output_file.write(data)
+            output_file.flush()
+            os.fsync(output_file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def get_metadata_path(cache_file_path: Path) -> Path:
+    """
+    Get the metadata sidecar path for an OWL cache file.
+
+    Args:
+        cache_file_path (Path): The path to the OWL cache file.
+
+    Returns:
+        Path: The metadata sidecar path.
+    """
+    return cache_file_path.with_suffix(METADATA_SUFFIX)
+
+
+def read_cache_metadata(cache_file_path: Path) -> Optional[CacheMetadata]:
+    """
+    Read the metadata sidecar for an OWL cache file.
+
+    Args:
+        cache_file_path (Path): The path to the OWL cache file.
+
+    Returns:
+        CacheMetadata | None: The cache metadata, or None if the sidecar is missing or invalid.
+    """
+    metadata_path = get_metadata_path(cache_file_path)
+    if not metadata_path.exists():
+        return None
+
+    try:
+        return CacheMetadata.model_validate_json(
+            metadata_path.read_text(encoding="utf-8")
+        )
+    except (OSError, ValidationError):
+        LOGGER.warning("Invalid cache metadata: %s", metadata_path)
+        return None
+
+
+def write_cache_metadata(cache_file_path: Path, metadata: CacheMetadata) -> None:
+    """
+    Atomically write the metadata sidecar for an OWL cache file.
+
+    Args:
+        cache_file_path (Path): The path to the OWL cache file.
+        metadata (CacheMetadata): The cache metadata.
+
+    Returns:
+        None
+    """
+    metadata_path = get_metadata_path(cache_file_path)
+    LOGGER.info("Saving cache metadata: %s", metadata_path)
+    atomic_write_bytes(metadata_path, metadata.model_dump_json().encode("utf-8"))
+
+
+class CacheStore:
+    """
+    File-based store for cached ontology files and their metadata sidecars.
+    """
+
+    def __init__(self, cache_path: str | Path = DEFAULT_CACHE_DIR) -> None:
+        """
+        Initialize the cache store.
+
+        Args:
+            cache_path (str | Path): The path to the cache directory.
+
+        Returns:
+            None
+        """
+        self.cache_path: Path = Path(cache_path)
+
+    def get_path(self, source_type: str, cache_key: str) -> Path:
+        """
+        Get the OWL cache file path for a cache key, creating the cache directory if needed.
+
+        Args:
+            source_type (str): The source type for loading the ontology. Either "github" or "http".
+            cache_key (str): The unhashed cache key.
+
+        Returns:
+            Path: The cache file path.
+        """
+        cache_key_hash = hashlib.blake2b(cache_key.encode()).hexdigest()
+        cache_file_path = self.cache_path / source_type / f"{cache_key_hash}.owl"
+
+        # create the cache directory if it does not exist
+        cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        return cache_file_path
+
+    @contextmanager
+    def lock(self, cache_file_path: Path, shared: bool = False) -> Iterator[None]:
+        """
+        Hold an inter-process lock on a cache file.
+
+        Uses flock() on POSIX systems and msvcrt.locking() on Windows, where locks are always
+        exclusive.  On other platforms, no lock is taken and only atomic renames protect readers.
+
+        Args:
+            cache_file_path (Path): The path to the OWL cache file.
+            shared (bool): Whether to take a shared (read) lock instead of an exclusive one.
+
+        Yields:
+            None
+        """
+        lock_path = cache_file_path.with_suffix(LOCK_SUFFIX)
+        with lock_path.open("a+b") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                lock_file.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                        break
+                    except OSError:
+                        time.sleep(LOCK_RETRY_INTERVAL)
+                try:
+                    yield
+                finally:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                yield
+
+    @staticmethod
+    def _check_digest(
+        cache_file_path: Path, data: bytes | mmap.mmap
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Check cache file contents against the digest in its metadata, if one was recorded.
+
+        Args:
+            cache_file_path (Path): The path to the OWL cache file.
+            data (bytes | mmap.mmap): The cache file contents.
+
+        Returns:
+            Tuple[bool, Optional[str]]: True if the contents match the recorded digest or no
+                digest was recorded, and the verified digest, if any.
+        """
+        metadata = read_cache_metadata(cache_file_path)
+        if metadata is None or metadata.digest is None:
+            return True, None
+
+        if get_digest(data) != metadata.digest:
+            LOGGER.warning("Cache file failed digest check: %s", cache_file_path)
+            return False, None
+        return True, metadata.digest
+
+    def _read_unlocked(
+        self, cache_file_path: Path
+    ) -> Optional[Tuple[bytes, Optional[str]]]:
+        """
+        Read a cache file and verify its digest without taking a lock.
+
+        Args:
+            cache_file_path (Path): The path to the OWL cache file.
+
+        Returns:
+            Tuple[bytes, Optional[str]] | None: The cached buffer and its verified digest, if
+                one was recorded, or None if it is missing or fails its digest check.
+        """
+        if not cache_file_path.exists():
+            LOGGER.info("Cache file does not exist: %s", cache_file_path)
+            return None
+
+        data = cache_file_path.read_bytes()
+        valid, digest = self._check_digest(cache_file_path, data)
+        if not valid:
+            return None
+
+        LOGGER.info("Loaded ontology from cache: %s", cache_file_path)
+        return data, digest
+
+    def _write_unlocked(
+        self,
+        cache_file_path: Path,
+        data: bytes,
+        metadata: Optional[CacheMetadata] = None,
+    ) -> bool:
+        """
+        Write a cache file and its metadata without taking a lock.
+
+        Args:
+            cache_file_path (Path): The path to the OWL cache file.
+            data (bytes): The raw ontology buffer.
+            metadata (Optional[CacheMetadata]): The cache metadata; validators from the
+                existing metadata are kept if None.
+
+        Returns:
+            bool: True if the cache file was written, False if its content was unchanged.
+        """
+        digest = get_digest(data)
+
+        # skip the write if the content on disk is unchanged
+        existing_metadata = read_cache_metadata(cache_file_path)
+        unchanged = (
+            cache_file_path.exists()
+            and get_digest(cache_file_path) == digest
+        )
+        if not unchanged:
+            LOGGER.info("Saving to cache: %s", cache_file_path)
+            atomic_write_bytes(cache_file_path, data)
+
+        # record the digest with the new or existing validators
+        new_metadata = (metadata or existing_metadata or CacheMetadata()).model_copy(
+            update={"digest": digest}
+        )
+        if new_metadata != existing_metadata:
+            write_cache_metadata(cache_file_path, new_metadata)
+
+        return not unchanged
+
+    def read(self, cache_file_path: Path) -> Optional[bytes]:
+        """
+        Read a cache file and verify its digest.
+
+        Args:
+            cache_file_path (Path): The path to the OWL cache file.
+
+        Returns:
+            bytes | None: The cached buffer, or None if it is missing or fails its digest check.
+        """
+        with self.lock(cache_file_path, shared=True):
+            result = self._read_unlocked(cache_file_path)
+        return result[0] if result is not None else None
+
+    @contextmanager
+    def open(self, cache_file_path: Path) -> Iterator[Optional[bytes | mmap.mmap]]:
+        """
+        Memory-map a cache file read-only and verify its digest.
+
+        The file is mapped under a shared lock.  On POSIX systems, the mapping remains valid and
+        unchanged if the cache file is atomically replaced while it is open.  Windows cannot
+        replace a file while it is mapped, so there the file is read into memory instead and
+        writers are never blocked by an open mapping.
+
+        Args:
+            cache_file_path (Path): The path to the OWL cache file.
+
+        Yields:
+            bytes | mmap.mmap | None: The mapped cache file, or its contents if cache files are
+                not mapped on this platform, or None if it is missing, empty, or fails its
+                digest check.
+        """
+        with self.open_verified(cache_file_path) as (mapped, _):
+            yield mapped
+
+    @contextmanager
+    def open_verified(
+        self, cache_file_path: Path
+    ) -> Iterator[Tuple[Optional[bytes | mmap.mmap], Optional[str]]]:
+        """
+        Memory-map a cache file read-only like open(), along with the digest it was verified
+        against, so that callers keying data on the file contents need not digest it again.
+
+        Args:
+            cache_file_path (Path): The path to the OWL cache file.
+
+        Yields:
+            Tuple[bytes | mmap.mmap | None, Optional[str]]: The mapped cache file or its
+                contents, or None, and the verified digest, or None if no digest was recorded.
+        """
+        if not MAP_CACHE_FILES:
+            with self.lock(cache_file_path, shared=True):
+                result = self._read_unlocked(cache_file_path)
+            yield result if result is not None and result[0] else (None, None)
+            return
+
+        mapped: Optional[mmap.mmap] = None
+        digest: Optional[str] = None
+        with self.lock(cache_file_path, shared=True):
+            if not cache_file_path.exists():
+                LOGGER.info("Cache file does not exist: %s", cache_file_path)
+            else:
+                with cache_file_path.open("rb") as cache_file:
+                    if os.fstat(cache_file.fileno()).st_size > 0:
+                        mapped = mmap.mmap(
+                            cache_file.fileno(), 0, access=mmap.ACCESS_READ
+                        )
+                if mapped is not None:
+                    valid, digest = self._check_digest(cache_file_path, mapped)
+                    if not valid:
+                        mapped.close()
+                        mapped = None
+
+        if mapped is None:
+            yield None, None
+            return
+
+        LOGGER.info("Mapped ontology from cache: %s", cache_file_path)
+        try:
+            yield mapped, digest
+        finally:
+            mapped.close()
+
+    def write(
+        self,
+        cache_file_path: Path,
+        data: bytes,
+        metadata: Optional[CacheMetadata] = None,
+    ) -> bool:
+        """
+        Atomically write a cache file and its metadata, skipping the write if unchanged.
+
+        Args:
+            cache_file_path (Path): The path to the OWL cache file.
+            data (bytes): The raw ontology buffer.
+            metadata (Optional[CacheMetadata]): The cache metadata; validators from the
+                existing metadata are kept if None.
+
+        Returns:
+            bool: True if the cache file was written, False if its content was unchanged.
+        """
+        with self.lock(cache_file_path):
+            return self._write_unlocked(cache_file_path, data, metadata)
+
+    def write_metadata(self, cache_file_path: Path, metadata: CacheMetadata) -> None:
+        """
+        Atomically write the metadata for a cache file.
+
+        Args:
+            cache_file_path (Path): The path to the OWL cache file.
+            metadata (CacheMetadata): The cache metadata.
+
+        Returns:
+            None
+        """
+        with self.lock(cache_file_path):
+            write_cache_metadata(cache_file_path, metadata)
+
+    def read_or_fetch(
+        self,
+        cache_file_path: Path,
+        fetch: Callable[[], Tuple[bytes, CacheMetadata]],
+    ) -> bytes:
+        """
+        Read a cache file, or fetch and store it if missing.
+
+        The cache is re-checked after the exclusive lock is acquired, so when many processes
+        miss the cache at once, only the first one fetches the ontology.
+
+        Args:
+            cache_file_path (Path): The path to the OWL cache file.
+            fetch (Callable[[], Tuple[bytes, CacheMetadata]]): Function returning the raw
+                ontology buffer and its cache metadata.
+
+        Returns:
+            bytes: The raw ontology buffer.
+        """
+        return self.read_or_fetch_verified(cache_file_path, fetch)[0]
+
+    def read_or_fetch_verified(
+        self,
+        cache_file_path: Path,
+        fetch: Callable[[], Tuple[bytes, CacheMetadata]],
+    ) -> Tuple[bytes, Optional[str]]:
+        """
+        Read a cache file, or fetch and store it if missing, like read_or_fetch(), along with
+        its verified or newly recorded digest.
+
+        Args:
+            cache_file_path (Path): The path to the OWL cache file.
+            fetch (Callable[[], Tuple[bytes, CacheMetadata]]): Function returning the raw
+                ontology buffer and its cache metadata.
+
+        Returns:
+            Tuple[bytes, Optional[str]]: The raw ontology buffer and its digest, or None if the
+                cache file has no recorded digest.
+        """
+        with self.lock(cache_file_path, shared=True):
+            result = self._read_unlocked(cache_file_path)
+        if result is not None:
+            return result
+
+        with self.lock(cache_file_path):
+            result = self._read_unlocked(cache_file_path)
+            if result is None:
+                data, metadata = fetch()
+                self._write_unlocked(cache_file_path, data, metadata)
+                written_metadata = read_cache_metadata(cache_file_path)
+                result = data, (
+                    written_metadata.digest if written_metadata is not None else None
+                )
+
+        return result
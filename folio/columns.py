@@ -0,0 +1,348 @@
+"""
+Columnar storage for parsed OWL classes in the FOLIO (Federated Open Legal Information Ontology)
+Python library.
+
+In lazy mode, parsed class fields are kept in one list per OWLClass field, indexed by class
+index, with None marking fields left at their default.  OWLClass models are only constructed
+when a class is first accessed, and are then cached, so processes that only look classes up by
+IRI or search labels never build models for the rest of the ontology.
+"""
+
+# annotations
+from __future__ import annotations
+
+# imports
+import threading
+from collections.abc import Sequence
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, overload
+
+# project imports
+from folio.models import OWLClass
+
+# OWLClass field names, in model order
+CLASS_FIELDS: Tuple[str, ...] = tuple(OWLClass.model_fields)
+
+# shared read-only values for unset list and dict fields
+EMPTY_LIST: Tuple[Any, ...] = ()
+EMPTY_DICT: MappingProxyType = MappingProxyType({})
+
+
+def _get_empty_value(field: str) -> Any:
+    """
+    Get the shared read-only value returned for an unset OWLClass field.
+
+    Args:
+        field (str): The field name.
+
+    Returns:
+        Any: An empty tuple for list fields, an empty mapping for dict fields, or the field
+            default otherwise.
+    """
+    field_info = OWLClass.model_fields[field]
+    if field_info.default_factory is list:
+        return EMPTY_LIST
+    if field_info.default_factory is dict:
+        return EMPTY_DICT
+    return field_info.default
+
+
+# read-only values for unset fields, keyed by field name
+CLASS_EMPTY_VALUES: Dict[str, Any] = {
+    field: _get_empty_value(field) for field in CLASS_FIELDS if field != "iri"
+}
+
+# serializes model construction, so concurrent first reads of a class share one model
+_MATERIALIZE_LOCK = threading.Lock()
+
+# fields whose default is falsy but not None (lists, dicts, and booleans)
+_FALSY_DEFAULT_FIELDS: frozenset = frozenset(
+    field for field, value in CLASS_EMPTY_VALUES.items() if value is not None
+)
+
+
+class ClassRecord:
+    """
+    Mutable record of the fields of an OWL class, filled in while parsing in lazy mode.
+
+    Unset fields are created with their OWLClass default on first access, so parse handlers can
+    set and append to fields exactly as they would on an OWLClass.
+    """
+
+    def __init__(self, iri: str, **values: Any) -> None:
+        """
+        Initialize the record.
+
+        Args:
+            iri (str): The class IRI.
+            **values (Any): Any other field values.
+
+        Returns:
+            None
+        """
+        self.iri = iri
+        self.__dict__.update(values)
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for fields that have not been set yet
+        if name not in CLASS_EMPTY_VALUES:
+            raise AttributeError(name)
+
+        field_info = OWLClass.model_fields[name]
+        value = (
+            field_info.default_factory()  # type: ignore[call-arg]
+            if field_info.default_factory is not None
+            else field_info.default
+        )
+        setattr(self, name, value)
+        return value
+
+    def is_valid(self) -> bool:
+        """
+        Check if the OWL class is valid.
+
+        Returns:
+            bool: True if the OWL class is valid, False otherwise.
+        """
+        return self.label is not None
+
+    def __str__(self) -> str:
+        return f"ClassRecord(label={self.label}, iri={self.iri})"
+
+
+class ClassColumns(Sequence):
+    """
+    Columnar, lazily-materialized list of OWL classes.
+
+    The store supports the list operations the ontology uses (indexing, iteration, append, pop,
+    item assignment, and copy); indexing or iterating constructs and caches OWLClass models.
+    """
+
+    def __init__(self, classes: Iterable[OWLClass | ClassRecord] = ()) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            classes (Iterable[OWLClass | ClassRecord]): The initial classes or records.  The
+                field values of OWLClass models are moved into the columns.
+
+        Returns:
+            None
+        """
+        self._columns: Dict[str, List[Any]] = {field: [] for field in CLASS_FIELDS}
+        self._materialized: List[Optional[OWLClass]] = []
+        for owl_class in classes:
+            self.append(
+                ClassRecord(**owl_class.__dict__)
+                if isinstance(owl_class, OWLClass)
+                else owl_class
+            )
+
+    def append(self, owl_class: OWLClass | ClassRecord) -> None:
+        """
+        Append a class.  Records are stored in the columns; models are stored as-is.
+
+        Args:
+            owl_class (OWLClass | ClassRecord): The class or record.
+
+        Returns:
+            None
+        """
+        index = len(self._materialized)
+        for column in self._columns.values():
+            column.append(None)
+
+        if isinstance(owl_class, OWLClass):
+            self._materialized.append(owl_class)
+            return
+
+        for field, value in owl_class.__dict__.items():
+            # leave None, empty lists and dicts, and deprecated=False unset
+            if value is None or (not value and field in _FALSY_DEFAULT_FIELDS):
+                continue
+            self._columns[field][index] = value
+        self._materialized.append(None)
+
+    def extend_columns(self, other: ClassColumns) -> None:
+        """
+        Append the classes of another store, moving its columns rather than its records.
+
+        Args:
+            other (ClassColumns): The store whose classes to append.
+
+        Returns:
+            None
+        """
+        for field, column in self._columns.items():
+            column.extend(other._columns[field])
+        self._materialized.extend(other._materialized)
+
+    def materialize(self, index: int) -> OWLClass:
+        """
+        Get the OWLClass model for a class index, constructing and caching it on first access.
+
+        Args:
+            index (int): The class index.
+
+        Returns:
+            OWLClass: The OWL class.
+        """
+        owl_class = self._materialized[index]
+        if owl_class is not None:
+            return owl_class
+
+        with _MATERIALIZE_LOCK:
+            owl_class = self._materialized[index]
+            if owl_class is not None:
+                return owl_class
+
+            # build the model from the column values, leaving them in place for readers
+            # that checked the cache before it was published
+            owl_class = OWLClass(
+                **{
+                    field: column[index]
+                    for field, column in self._columns.items()
+                    if column[index] is not None
+                }
+            )
+            self._materialized[index] = owl_class
+        return owl_class
+
+    def get_value(self, index: int, field: str) -> Any:
+        """
+        Get a field value for a class index without constructing its model.
+
+        Args:
+            index (int): The class index.
+            field (str): The field name.
+
+        Returns:
+            Any: The field value; unset list and dict fields are returned as shared read-only
+                empty values.
+        """
+        owl_class = self._materialized[index]
+        if owl_class is not None:
+            return getattr(owl_class, field)
+
+        value = self._columns[field][index]
+        return CLASS_EMPTY_VALUES[field] if value is None else value
+
+    def append_value(self, index: int, field: str, value: Any) -> None:
+        """
+        Append a value to a list field for a class index without constructing its model.
+
+        Args:
+            index (int): The class index.
+            field (str): The list field name.
+            value (Any): The value to append.
+
+        Returns:
+            None
+        """
+        owl_class = self._materialized[index]
+        if owl_class is not None:
+            getattr(owl_class, field).append(value)
+            return
+
+        column = self._columns[field]
+        if column[index] is None:
+            column[index] = []
+        column[index].append(value)
+
+    def get_record(self, index: int) -> ClassRecord:
+        """
+        Get a record of the field values for a class index without constructing its model.
+
+        Args:
+            index (int): The class index.
+
+        Returns:
+            ClassRecord: The class record.
+        """
+        owl_class = self._materialized[index]
+        if owl_class is not None:
+            return ClassRecord(**owl_class.__dict__)
+
+        return ClassRecord(
+            **{
+                field: column[index]
+                for field, column in self._columns.items()
+                if column[index] is not None
+            }
+        )
+
+    def num_materialized(self) -> int:
+        """
+        Get the number of classes whose OWLClass models have been constructed.
+
+        Returns:
+            int: The number of materialized classes.
+        """
+        return sum(owl_class is not None for owl_class in self._materialized)
+
+    def pop(self, index: int = -1) -> OWLClass:
+        """
+        Remove and return the class at an index.
+
+        Args:
+            index (int): The class index; defaults to the last class.
+
+        Returns:
+            OWLClass: The removed OWL class.
+        """
+        owl_class = self.materialize(index)
+        for column in self._columns.values():
+            del column[index]
+        del self._materialized[index]
+        return owl_class
+
+    def copy(self) -> ClassColumns:
+        """
+        Get a shallow copy of the store; materialized models are shared, as with list.copy().
+
+        Returns:
+            ClassColumns: The copy.
+        """
+        columns = ClassColumns()
+        columns._columns = {
+            field: list(column) for field, column in self._columns.items()
+        }
+        columns._materialized = list(self._materialized)
+        return columns
+
+    def __setitem__(self, index: int, owl_class: OWLClass) -> None:
+        for column in self._columns.values():
+            column[index] = None
+        self._materialized[index] = owl_class
+
+    @overload
+    def __getitem__(self, index: int) -> OWLClass: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[OWLClass]: ...
+
+    def __getitem__(self, index: int | slice) -> OWLClass | List[OWLClass]:
+        if isinstance(index, slice):
+            return [self.materialize(i) for i in range(len(self))[index]]
+        return self.materialize(index)
+
+    def __len__(self) -> int:
+        return len(self._materialized)
+
+    def __iter__(self) -> Iterator[OWLClass]:
+        for index in range(len(self._materialized)):
+            yield self.materialize(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ClassColumns, list, tuple)):
+            return len(self) == len(other) and all(
+                left == right for left, right in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"ClassColumns({len(self)} classes, {self.num_materialized()} materialized)"
+        )
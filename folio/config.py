@@ -7,6 +7,7 @@ from __future__ import annotations
 
 # imports
 import json
+import os
 from pathlib import Path
 from typing import Literal, Optional
 
@@ -19,6 +20,11 @@ from folio.logger import get_logger
 # Default configuration path
 DEFAULT_CONFIG_PATH: Path = Path.home() / ".folio/config.json"
 
+# Default cache directory for the ontology, which can be overridden by the FOLIO_CACHE_DIR environment variable
+DEFAULT_CACHE_DIR: Path = Path(
+    os.environ.get("FOLIO_CACHE_DIR", Path.home() / ".folio" / "cache")
+)
+
 # Default GitHub API URL
 DEFAULT_GITHUB_API_URL: str = "https://api.github.com"
 DEFAULT_GITHUB_OBJECT_URL: str = "https://raw.githubusercontent.com"
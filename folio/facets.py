@@ -0,0 +1,161 @@
+"""
+Structural query facets for the FOLIO (Federated Open Legal Information Ontology) Python library.
+
+Each structural filter of a class query (deprecation, having subclasses, branch membership,
+and country) is precomputed as a bitmap over class indices, stored as a Python int with bit i
+set for class index i.  Combining filters is then a few bitwise operations over whole
+bitmaps, and only the classes that survive them are visited.
+"""
+
+# annotations
+from __future__ import annotations
+
+# imports
+from typing import Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+# set bit positions of each byte value, lowest first
+_BYTE_BITS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)
+)
+
+
+def bitmap_from_indices(indices: Iterable[int], size: int) -> int:
+    """
+    Build a bitmap from class indices.
+
+    Args:
+        indices (Iterable[int]): The class indices.
+        size (int): The number of classes.
+
+    Returns:
+        int: The bitmap, with the bit of each index set.
+    """
+    data = bytearray((size + 7) // 8)
+    for index in indices:
+        data[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(data, "little")
+
+
+class BitmapView:
+    """
+    Byte view of a bitmap for constant-time membership checks and ordered iteration.
+    """
+
+    def __init__(self, bitmap: int, size: int) -> None:
+        """
+        Initialize the view.
+
+        Args:
+            bitmap (int): The bitmap.
+            size (int): The number of classes.
+
+        Returns:
+            None
+        """
+        self._data: bytes = bitmap.to_bytes((size + 7) // 8, "little")
+
+    def __contains__(self, index: int) -> bool:
+        return bool(self._data[index >> 3] >> (index & 7) & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        for byte_index, value in enumerate(self._data):
+            if value:
+                offset = byte_index << 3
+                for bit in _BYTE_BITS[value]:
+                    yield offset + bit
+
+
+class ClassFacets:
+    """
+    Bitmaps of the classes matching each structural query filter.
+    """
+
+    def __init__(
+        self,
+        size: int = 0,
+        deprecated: Iterable[int] = (),
+        has_children: Iterable[int] = (),
+        branches: Optional[Dict[str, Iterable[int]]] = None,
+        countries: Optional[Dict[str, Iterable[int]]] = None,
+    ) -> None:
+        """
+        Build the facet bitmaps.
+
+        Args:
+            size (int): The number of classes.
+            deprecated (Iterable[int]): The indices of deprecated classes.
+            has_children (Iterable[int]): The indices of classes with subclasses.
+            branches (Optional[Dict[str, Iterable[int]]]): The member class indices of each
+                branch, by branch name.
+            countries (Optional[Dict[str, Iterable[int]]]): The class indices with each
+                country value.
+
+        Returns:
+            None
+        """
+        self.size: int = size
+        self.all: int = (1 << size) - 1
+        self.deprecated: int = bitmap_from_indices(deprecated, size)
+        self.has_children: int = bitmap_from_indices(has_children, size)
+        self.branches: Dict[str, int] = {
+            branch: bitmap_from_indices(indices, size)
+            for branch, indices in (branches or {}).items()
+        }
+        self.countries: Dict[str, int] = {
+            country: bitmap_from_indices(indices, size)
+            for country, indices in (countries or {}).items()
+        }
+
+    def replace(
+        self, values: Mapping[int, Tuple[bool, bool, Optional[str]]]
+    ) -> ClassFacets:
+        """
+        Get a copy of the facets with the deprecation, subclass, and country values of some
+        classes replaced; the branch bitmaps are kept.
+
+        Args:
+            values (Mapping[int, Tuple[bool, bool, Optional[str]]]): The deprecated flag,
+                has-subclasses flag, and country of each changed class index.
+
+        Returns:
+            ClassFacets: The new facets.
+        """
+        facets = ClassFacets.__new__(ClassFacets)
+        facets.size = self.size
+        facets.all = self.all
+        facets.branches = self.branches
+        changed = bitmap_from_indices(values, self.size)
+        facets.deprecated = self.deprecated & ~changed | bitmap_from_indices(
+            (index for index, (deprecated, _, _) in values.items() if deprecated),
+            self.size,
+        )
+        facets.has_children = self.has_children & ~changed | bitmap_from_indices(
+            (index for index, (_, has_children, _) in values.items() if has_children),
+            self.size,
+        )
+        countries: Dict[str, int] = {
+            country: bitmap & ~changed for country, bitmap in self.countries.items()
+        }
+        for index, (_, _, country) in values.items():
+            if country is not None:
+                countries[country] = countries.get(country, 0) | 1 << index
+        facets.countries = {
+            country: bitmap for country, bitmap in countries.items() if bitmap
+        }
+        return facets
+
+    def match_countries(self, predicate: Callable[[str], bool]) -> int:
+        """
+        Get the classes whose country matches a predicate.
+
+        Args:
+            predicate (Callable[[str], bool]): The predicate, called once per distinct country.
+
+        Returns:
+            int: The bitmap of the matching classes.
+        """
+        bitmap = 0
+        for country, country_bitmap in self.countries.items():
+            if predicate(country):
+                bitmap |= country_bitmap
+        return bitmap
@@ -16,16 +16,40 @@ from __future__ import annotations
 # imports
 import asyncio
 import base64
+import gc
 import hashlib
 import importlib.util
+import io
 import json
+import mmap
+import multiprocessing
+import pickle
+import tempfile
+import threading
 import time
 import traceback
 import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
 from functools import cache
+from itertools import repeat
+from operator import add, attrgetter
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 # packages
 import httpx
@@ -38,6 +62,7 @@ except ImportError:
 
 # project imports
 from folio.config import (
+    DEFAULT_CACHE_DIR,
     DEFAULT_GITHUB_API_URL,
     DEFAULT_GITHUB_OBJECT_URL,
     DEFAULT_GITHUB_REPO_BRANCH,
@@ -46,8 +71,34 @@ from folio.config import (
     DEFAULT_HTTP_URL,
     DEFAULT_SOURCE_TYPE,
 )
+from folio.cache import (
+    CacheMetadata,
+    CacheStore,
+    SourceDigest,
+    get_digest,
+    read_cache_metadata,
+)
+from folio.columns import ClassColumns, ClassRecord
+from folio.facets import BitmapView, ClassFacets, bitmap_from_indices
+from folio.hierarchy import (
+    Ancestors,
+    BranchMembership,
+    ClassAdjacency,
+    ClassHierarchy,
+    trace_ancestor_path,
+)
 from folio.logger import get_logger
-from folio.models import OWLClass, OWLObjectProperty, NSMAP
+from folio.models import (
+    ChangeSet,
+    OWLClass,
+    OWLObjectProperty,
+    NSMAP,
+    QueryPlan,
+    QueryStage,
+)
+from folio.snapshot import read_snapshot, write_snapshot
+from folio.text_index import TEXT_FIELDS, SearchCorpus, TextIndex
+from folio.triples import TripleStore
 
 
 class FOLIOTypes(Enum):
@@ -110,9 +161,6 @@ FOLIO_TYPE_IRIS = {
 
 OWL_THING = "http://www.w3.org/2002/07/owl#Thing"
 
-# Default cache directory for the ontology
-DEFAULT_CACHE_DIR: Path = Path.home() / ".folio" / "cache"
-
 # Default maximum depth for subgraph traversal safety
 DEFAULT_MAX_DEPTH: int = 16
 
@@ -128,6 +176,51 @@ DEFAULT_SEARCH_MAX_DEPTH = 2
 # minimum length for prefix search
 MIN_PREFIX_LENGTH: int = 3
 
+# default minimum rapidfuzz partial_ratio score for fuzzy query matches
+DEFAULT_FUZZY_SCORE_CUTOFF: float = 70.0
+
+# fraction of the classes below which fuzzy queries only score the strings of the classes
+# left by the structural filters, instead of scoring the whole field corpus
+FUZZY_SUBSET_FRACTION: float = 0.1
+
+# GitHub API headers requesting only the commit SHA
+GITHUB_SHA_HEADERS: Dict[str, str] = {"Accept": "application/vnd.github.sha"}
+
+# parsed ontology state attributes persisted in snapshots
+STATE_ATTRIBUTES: Tuple[str, ...] = (
+    "title",
+    "description",
+    "classes",
+    "object_properties",
+    "iri_to_index",
+    "iri_to_property_index",
+    "label_to_index",
+    "alt_label_to_index",
+    "property_label_to_index",
+    "class_edges",
+    "class_adjacency",
+    "triples",
+    "_label_trie",
+    "_lowercase_label_trie",
+    "_lowercase_to_original",
+    "_class_fingerprints",
+    "_property_fingerprints",
+    "_class_hierarchy",
+    "_branch_membership",
+    "_text_index",
+    "_class_facets",
+    "_label_search_corpus",
+    "_all_label_search_corpus",
+    "_definition_search_corpus",
+    "_source_digest",
+)
+
+# traversal depths whose branch members are precomputed; negative for no limit
+BRANCH_MEMBERSHIP_DEPTHS: Tuple[int, ...] = (-1, DEFAULT_MAX_DEPTH, DEFAULT_SEARCH_MAX_DEPTH)
+
+# bytes read at a time when splitting an OWL file into parallel parse partitions
+PARSE_CHUNK_SIZE: int = 1 << 20
+
 # Set up logger
 LOGGER = get_logger(__name__)
 
@@ -156,10 +249,586 @@ try:
         LOGGER.warning("Disabling search functionality: alea_llm_client not found.")
         alea_llm_client = None
         get_llm_kwargs = None
+
+    # numpy is optional and only used to batch fuzzy scoring across all cores
+    if importlib.util.find_spec("numpy") is not None:
+        import numpy
+    else:
+        numpy = None
 except ImportError as e:
     LOGGER.warning("Failed to check for search functionality: %s", e)
     rapidfuzz = None
     marisa_trie = None
+    numpy = None
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector while building or unpickling many parsed objects.
+
+    Yields:
+        None
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _get_parse_pool_context() -> multiprocessing.context.BaseContext:
+    """
+    Get the multiprocessing context for parallel parse workers.
+
+    Workers are never forked, since forking a process while another of its threads (such as
+    the auto-refresh thread) holds a lock can deadlock the worker; forkserver is used where it
+    is available, and spawn otherwise.
+
+    Returns:
+        multiprocessing.context.BaseContext: The multiprocessing context.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _ns_tag(ns: str, tag: str) -> str:
+    """
+    Get the namespace tag for an XML element, as used in the tag dispatch tables.
+
+    Args:
+        ns (str): The namespace.
+        tag (str): The tag name.
+
+    Returns:
+        str: The namespace tag.
+    """
+    return "{%s}%s" % (NSMAP[ns], tag)
+
+
+# rdf:resource attribute
+RDF_RESOURCE: str = _ns_tag("rdf", "resource")
+
+# xml:lang attribute
+XML_LANG: str = _ns_tag("xml", "lang")
+
+# child element handlers take the FOLIO instance, the entity being parsed, and the child element
+TagHandler = Callable[[Any, Any, lxml.etree._Element], None]
+
+
+def _text_field(field: str, predicate: Optional[str]) -> TagHandler:
+    """
+    Get a handler that sets a scalar field to the child element text.
+
+    Args:
+        field (str): The entity field name.
+        predicate (Optional[str]): The triple predicate, or None to not add a triple.
+
+    Returns:
+        TagHandler: The tag handler.
+    """
+
+    def handler(folio: Any, entity: Any, child: lxml.etree._Element) -> None:
+        setattr(entity, field, child.text)
+        if predicate is not None:
+            folio.triples.append((entity.iri, predicate, child.text))
+
+    return handler
+
+
+def _text_list_field(field: str, predicate: str) -> TagHandler:
+    """
+    Get a handler that appends the child element text to a list field.
+
+    Args:
+        field (str): The entity field name.
+        predicate (str): The triple predicate.
+
+    Returns:
+        TagHandler: The tag handler.
+    """
+
+    def handler(folio: Any, entity: Any, child: lxml.etree._Element) -> None:
+        getattr(entity, field).append(child.text)
+        folio.triples.append((entity.iri, predicate, child.text))
+
+    return handler
+
+
+def _resource_field(
+    field: str, predicate: str, text_fallback: bool = False
+) -> TagHandler:
+    """
+    Get a handler that sets a scalar field to the child element rdf:resource attribute.
+
+    Args:
+        field (str): The entity field name.
+        predicate (str): The triple predicate.
+        text_fallback (bool): Whether to use the child element text if it has no rdf:resource.
+
+    Returns:
+        TagHandler: The tag handler.
+    """
+
+    def handler(folio: Any, entity: Any, child: lxml.etree._Element) -> None:
+        value = child.attrib.get(RDF_RESOURCE, None)
+        if not value and text_fallback:
+            value = child.text
+        if value:
+            setattr(entity, field, value)
+            folio.triples.append((entity.iri, predicate, value))
+
+    return handler
+
+
+def _resource_list_field(
+    field: str, predicate: str, text_fallback: bool = False
+) -> TagHandler:
+    """
+    Get a handler that appends the child element rdf:resource attribute to a list field.
+
+    Args:
+        field (str): The entity field name.
+        predicate (str): The triple predicate.
+        text_fallback (bool): Whether to use the child element text if it has no rdf:resource.
+
+    Returns:
+        TagHandler: The tag handler.
+    """
+
+    def handler(folio: Any, entity: Any, child: lxml.etree._Element) -> None:
+        value = child.attrib.get(RDF_RESOURCE, None)
+        if not value and text_fallback:
+            value = child.text
+        if value:
+            getattr(entity, field).append(value)
+            folio.triples.append((entity.iri, predicate, value))
+
+    return handler
+
+
+def _class_sub_class_of(folio: Any, owl_class: OWLClass, child: lxml.etree._Element) -> None:
+    """
+    Handle rdfs:subClassOf, including owl:Restriction elements with an rdfs:seeAlso relation.
+
+    Args:
+        folio (FOLIO): The FOLIO instance.
+        owl_class (OWLClass): The OWL class.
+        child (lxml.etree._Element): The child element.
+
+    Returns:
+        None
+    """
+    # set parent class
+    parent_class = child.attrib.get(RDF_RESOURCE, None)
+    if parent_class:
+        owl_class.sub_class_of.append(parent_class)
+        folio.triples.append((owl_class.iri, "rdfs:subClassOf", parent_class))
+        return
+
+    # check for owl:Restriction with seeAlso relation
+    for restriction in child.findall(f".//{{{NSMAP['owl']}}}Restriction"):
+        on_property = restriction.find(f".//{{{NSMAP['owl']}}}onProperty")
+        if on_property is None:
+            continue
+        if (
+            on_property.attrib.get(RDF_RESOURCE, None)
+            != "http://www.w3.org/2000/01/rdf-schema#seeAlso"
+        ):
+            continue
+
+        some_values_from = restriction.find(f".//{{{NSMAP['owl']}}}someValuesFrom")
+        if some_values_from is not None:
+            target_resource = some_values_from.attrib.get(RDF_RESOURCE, None)
+            if target_resource:
+                # add to regular seeAlso list instead of a separate restrictions list
+                owl_class.see_also.append(target_resource)
+                folio.triples.append((owl_class.iri, "rdfs:seeAlso", target_resource))
+
+
+def _class_deprecated(folio: Any, owl_class: OWLClass, child: lxml.etree._Element) -> None:
+    """
+    Handle owl:deprecated.
+
+    Args:
+        folio (FOLIO): The FOLIO instance.
+        owl_class (OWLClass): The OWL class.
+        child (lxml.etree._Element): The child element.
+
+    Returns:
+        None
+    """
+    owl_class.deprecated = True
+    folio.triples.append((owl_class.iri, "owl:deprecated", "true"))
+
+
+def _class_alt_label(folio: Any, owl_class: OWLClass, child: lxml.etree._Element) -> None:
+    """
+    Handle skos:altLabel, recording language-tagged labels as translations.
+
+    Args:
+        folio (FOLIO): The FOLIO instance.
+        owl_class (OWLClass): The OWL class.
+        child (lxml.etree._Element): The child element.
+
+    Returns:
+        None
+    """
+    lang = child.attrib.get(XML_LANG, None)
+    if lang:
+        owl_class.translations[lang] = child.text
+
+    # always add to alternative_labels for search indexing
+    if child.text not in owl_class.alternative_labels:
+        owl_class.alternative_labels.append(child.text)
+    folio.triples.append((owl_class.iri, "skos:altLabel", child.text))
+
+
+def _class_hidden_label(
+    folio: Any, owl_class: OWLClass, child: lxml.etree._Element
+) -> None:
+    """
+    Handle skos:hiddenLabel, which is also indexed as an alternative label.
+
+    Args:
+        folio (FOLIO): The FOLIO instance.
+        owl_class (OWLClass): The OWL class.
+        child (lxml.etree._Element): The child element.
+
+    Returns:
+        None
+    """
+    owl_class.hidden_label = child.text
+    owl_class.alternative_labels.append(child.text)
+    folio.triples.append((owl_class.iri, "skos:hiddenLabel", child.text))
+
+
+# owl:Class child element handlers, keyed by namespace tag
+CLASS_TAG_HANDLERS: Dict[str, TagHandler] = {
+    _ns_tag("rdfs", "label"): _text_field("label", "rdfs:label"),
+    _ns_tag("rdfs", "subClassOf"): _class_sub_class_of,
+    _ns_tag("rdfs", "isDefinedBy"): _resource_field(
+        "is_defined_by", "rdfs:isDefinedBy"
+    ),
+    _ns_tag("rdfs", "seeAlso"): _resource_list_field(
+        "see_also", "rdfs:seeAlso", text_fallback=True
+    ),
+    _ns_tag("rdfs", "comment"): _text_field("comment", "rdfs:comment"),
+    _ns_tag("owl", "deprecated"): _class_deprecated,
+    _ns_tag("skos", "prefLabel"): _text_field("preferred_label", None),
+    _ns_tag("skos", "altLabel"): _class_alt_label,
+    _ns_tag("skos", "hiddenLabel"): _class_hidden_label,
+    _ns_tag("skos", "definition"): _text_field("definition", "skos:definition"),
+    _ns_tag("skos", "example"): _text_list_field("examples", "skos:example"),
+    _ns_tag("skos", "note"): _text_list_field("notes", "skos:note"),
+    _ns_tag("skos", "historyNote"): _text_field("history_note", "skos:historyNote"),
+    _ns_tag("skos", "editorialNote"): _text_field(
+        "editorial_note", "skos:editorialNote"
+    ),
+    _ns_tag("skos", "inScheme"): _text_field("in_scheme", "skos:inScheme"),
+    _ns_tag("dc", "identifier"): _text_field("identifier", "dc:identifier"),
+    _ns_tag("dc", "description"): _text_field("description", "dc:description"),
+    _ns_tag("dc", "source"): _text_field("source", "dc:source"),
+    _ns_tag("v1", "country"): _text_field("country", "v1:country"),
+}
+
+# owl:ObjectProperty child element handlers, keyed by namespace tag
+OBJECT_PROPERTY_TAG_HANDLERS: Dict[str, TagHandler] = {
+    _ns_tag("rdfs", "label"): _text_field("label", "rdfs:label"),
+    _ns_tag("rdfs", "subPropertyOf"): _resource_list_field(
+        "sub_property_of", "rdfs:subPropertyOf"
+    ),
+    _ns_tag("rdfs", "domain"): _resource_list_field("domain", "rdfs:domain"),
+    _ns_tag("rdfs", "range"): _resource_list_field("range", "rdfs:range"),
+    _ns_tag("owl", "inverseOf"): _resource_field(
+        "inverse_of", "owl:inverseOf", text_fallback=True
+    ),
+    _ns_tag("skos", "prefLabel"): _text_field("preferred_label", "skos:prefLabel"),
+    _ns_tag("skos", "altLabel"): _text_list_field(
+        "alternative_labels", "skos:altLabel"
+    ),
+    _ns_tag("skos", "definition"): _text_field("definition", "skos:definition"),
+    _ns_tag("skos", "example"): _text_list_field("examples", "skos:example"),
+}
+
+# top-level node parsers, keyed by namespace tag; None marks node types that are not parsed yet
+NODE_PARSERS: Dict[str, Optional[str]] = {
+    _ns_tag("owl", "Class"): "parse_owl_class",
+    _ns_tag("owl", "Ontology"): "parse_owl_ontology",
+    _ns_tag("owl", "ObjectProperty"): "parse_owl_object_property",
+    # TODO: parse datatype properties, annotation properties, named individuals, and
+    # rdf descriptions
+    _ns_tag("owl", "DatatypeProperty"): None,
+    _ns_tag("owl", "AnnotationProperty"): None,
+    _ns_tag("owl", "NamedIndividual"): None,
+    _ns_tag("rdf", "Description"): None,
+}
+
+
+# value type of a parsed ontology state attribute
+StateValue = TypeVar("StateValue")
+
+
+class OntologyState:
+    """
+    Parsed ontology state, built while parsing and frozen once it is published on a FOLIO
+    instance.
+
+    A FOLIO instance holds its state behind a single attribute and replaces it as a whole on
+    refresh, so a reader that takes one reference to the state sees every attribute from the
+    same revision of the ontology.
+    """
+
+    __slots__ = STATE_ATTRIBUTES + ("_prefix_cache", "_ci_prefix_cache", "_frozen")
+
+    title: Optional[str]
+    description: Optional[str]
+    classes: List[OWLClass] | ClassColumns
+    object_properties: List[OWLObjectProperty]
+    iri_to_index: Dict[str, int]
+    iri_to_property_index: Dict[str, int]
+    label_to_index: Dict[str, List[int]]
+    alt_label_to_index: Dict[str, List[int]]
+    property_label_to_index: Dict[str, List[int]]
+    class_edges: Dict[str, List[str]]
+    class_adjacency: ClassAdjacency
+    triples: TripleStore
+    _label_trie: Optional[marisa_trie.Trie]
+    _lowercase_label_trie: Optional[marisa_trie.Trie]
+    _lowercase_to_original: Dict[str, List[str]]
+    _class_fingerprints: Dict[str, str]
+    _property_fingerprints: Dict[str, str]
+    _class_hierarchy: ClassHierarchy
+    _branch_membership: BranchMembership
+    _text_index: TextIndex
+    _class_facets: ClassFacets
+    _label_search_corpus: SearchCorpus
+    _all_label_search_corpus: SearchCorpus
+    _definition_search_corpus: SearchCorpus
+    _source_digest: Optional[SourceDigest]
+    _prefix_cache: Dict[str, List[OWLClass]]
+    _ci_prefix_cache: Dict[str, List[OWLClass]]
+    _frozen: bool
+
+    def __init__(self, lazy_classes: bool = False) -> None:
+        """
+        Initialize an empty state.
+
+        Args:
+            lazy_classes (bool): Whether to store classes in lazily-materialized columnar
+                storage instead of a list.
+
+        Returns:
+            None
+        """
+        object.__setattr__(self, "_frozen", False)
+
+        # ontology data structures
+        self.title = None
+        self.description = None
+        self.classes = ClassColumns() if lazy_classes else []
+        self.object_properties = []
+        self.iri_to_index = {}
+        self.iri_to_property_index = {}
+        self.label_to_index = {}
+        self.alt_label_to_index = {}
+        self.property_label_to_index = {}
+        self.class_edges = {}
+        self.class_adjacency = ClassAdjacency([], [])
+        self.triples = TripleStore()
+        self._label_trie = None
+        self._lowercase_label_trie = None
+        self._lowercase_to_original = {}
+
+        # node fingerprints for delta refreshes, keyed by IRI; empty until the first delta
+        self._class_fingerprints = {}
+        self._property_fingerprints = {}
+
+        # pre-order interval labeling of the class hierarchy
+        self._class_hierarchy = ClassHierarchy([])
+
+        # FOLIO branch membership of each class
+        self._branch_membership = BranchMembership(0, [])
+
+        # inverted text index for query()
+        self._text_index = TextIndex()
+
+        # structural filter bitmaps for query()
+        self._class_facets = ClassFacets()
+
+        # preprocessed label, label and alternative label, and definition search corpora
+        self._label_search_corpus = SearchCorpus()
+        self._all_label_search_corpus = SearchCorpus()
+        self._definition_search_corpus = SearchCorpus()
+
+        # content digest of the OWL buffer the state was parsed from, which keys its snapshot
+        self._source_digest = None
+
+        # prefix search results, cleared with the state
+        self._prefix_cache = {}
+        self._ci_prefix_cache = {}
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, Any]) -> OntologyState:
+        """
+        Create a frozen state from parsed ontology state values.
+
+        Args:
+            values (Dict[str, Any]): The parsed ontology state, keyed by attribute name.
+
+        Returns:
+            OntologyState: The frozen state.
+        """
+        state = cls.__new__(cls)
+        object.__setattr__(state, "_frozen", False)
+        for name in STATE_ATTRIBUTES:
+            setattr(state, name, values[name])
+        state._prefix_cache = {}
+        state._ci_prefix_cache = {}
+        state.freeze()
+        return state
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the parsed ontology state values.
+
+        Returns:
+            Dict[str, Any]: The parsed ontology state, keyed by attribute name.
+        """
+        return {name: getattr(self, name) for name in STATE_ATTRIBUTES}
+
+    def freeze(self) -> None:
+        """
+        Freeze the state, so that its attributes can no longer be replaced and its triples can
+        no longer be modified.
+
+        Returns:
+            None
+        """
+        self.triples.freeze()
+        object.__setattr__(self, "_frozen", True)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen:
+            raise AttributeError(f"Cannot set {name} on a published ontology state.")
+        object.__setattr__(self, name, value)
+
+    def get_class_value(self, index: int, field: str) -> Any:
+        """
+        Get a field of a class by index, without constructing its model in lazy mode.
+
+        Args:
+            index (int): The class index.
+            field (str): The OWLClass field name.
+
+        Returns:
+            Any: The field value.
+        """
+        if isinstance(self.classes, ClassColumns):
+            return self.classes.get_value(index, field)
+        return getattr(self.classes[index], field)
+
+    def iter_class_values(self, fields: Tuple[str, ...]) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterate over fields of every class, without constructing models in lazy mode.
+
+        Args:
+            fields (Tuple[str, ...]): The OWLClass field names, at least two.
+
+        Yields:
+            Tuple[Any, ...]: The field values of each class, in class index order.
+        """
+        if isinstance(self.classes, ClassColumns):
+            columns = self.classes
+            for index in range(len(columns)):
+                yield tuple(columns.get_value(index, field) for field in fields)
+        else:
+            yield from map(attrgetter(*fields), self.classes)
+
+    def iter_class_indices(
+        self,
+        start_index: int,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        direction: Literal["children", "parents"] = "children",
+        breadth_first: bool = False,
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Traverse the class hierarchy from a class index without recursion.
+
+        Each class is yielded once, even if it is reachable along several paths or through a
+        cycle.  Depth-first traversal yields classes in the same order as a recursive pre-order
+        walk, and revisits a class only if it is reached at a smaller depth, so that classes
+        below it within max_depth are not missed.  Breadth-first traversal yields each class at
+        its minimum depth.
+
+        Args:
+            start_index (int): The index of the class to start from.
+            max_depth (int): The maximum depth to traverse; negative for no limit.
+            direction (Literal["children", "parents"]): Whether to follow subclasses
+                (parent_class_of) or superclasses (sub_class_of).
+            breadth_first (bool): Whether to traverse breadth-first instead of depth-first.
+
+        Yields:
+            Tuple[int, int]: The index of each class and the depth at which it was first
+                reached, starting with (start_index, 0).
+        """
+        offsets, targets = self.class_adjacency.get_arrays(direction)
+
+        if breadth_first:
+            visited = {start_index}
+            queue = [start_index]
+            depth = 0
+            while queue:
+                next_queue = []
+                for index in queue:
+                    yield index, depth
+                    if depth == max_depth:
+                        continue
+                    for neighbor_index in targets[offsets[index] : offsets[index + 1]]:
+                        if neighbor_index not in visited:
+                            visited.add(neighbor_index)
+                            next_queue.append(neighbor_index)
+                queue = next_queue
+                depth += 1
+            return
+
+        # smallest depth each class has been expanded at
+        expanded: Dict[int, int] = {}
+        stack = [(start_index, 0)]
+        while stack:
+            index, depth = stack.pop()
+            previous_depth = expanded.get(index)
+            if previous_depth is not None and previous_depth <= depth:
+                continue
+            if previous_depth is None:
+                yield index, depth
+            expanded[index] = depth
+
+            if depth != max_depth:
+                stack.extend(
+                    (targets[position], depth + 1)
+                    for position in range(offsets[index + 1] - 1, offsets[index] - 1, -1)
+                )
+
+
+class _StateAttribute(Generic[StateValue]):
+    """
+    Descriptor exposing an attribute of the current ontology state on a FOLIO instance.
+    """
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Any = None) -> StateValue:
+        if instance is None:
+            return self  # type: ignore[return-value]
+        return getattr(instance._state, self.name)
+
+    def __set__(self, instance: Any, value: StateValue) -> None:
+        setattr(instance._state, self.name, value)
 
 
 # pylint: disable=too-many-instance-attributes
@@ -170,6 +839,33 @@ class FOLIO:
     This class provides a Python library for working with FOLIO (Federated Open Legal Information Ontology) data.
     """
 
+    # parsed ontology state attributes, read from and built on the current OntologyState
+    title: _StateAttribute[Optional[str]] = _StateAttribute()
+    description: _StateAttribute[Optional[str]] = _StateAttribute()
+    classes: _StateAttribute[List[OWLClass] | ClassColumns] = _StateAttribute()
+    object_properties: _StateAttribute[List[OWLObjectProperty]] = _StateAttribute()
+    iri_to_index: _StateAttribute[Dict[str, int]] = _StateAttribute()
+    iri_to_property_index: _StateAttribute[Dict[str, int]] = _StateAttribute()
+    label_to_index: _StateAttribute[Dict[str, List[int]]] = _StateAttribute()
+    alt_label_to_index: _StateAttribute[Dict[str, List[int]]] = _StateAttribute()
+    property_label_to_index: _StateAttribute[Dict[str, List[int]]] = _StateAttribute()
+    class_edges: _StateAttribute[Dict[str, List[str]]] = _StateAttribute()
+    class_adjacency: _StateAttribute[ClassAdjacency] = _StateAttribute()
+    triples: _StateAttribute[TripleStore] = _StateAttribute()
+    _label_trie: _StateAttribute[Optional[marisa_trie.Trie]] = _StateAttribute()
+    _lowercase_label_trie: _StateAttribute[Optional[marisa_trie.Trie]] = _StateAttribute()
+    _lowercase_to_original: _StateAttribute[Dict[str, List[str]]] = _StateAttribute()
+    _class_fingerprints: _StateAttribute[Dict[str, str]] = _StateAttribute()
+    _property_fingerprints: _StateAttribute[Dict[str, str]] = _StateAttribute()
+    _class_hierarchy: _StateAttribute[ClassHierarchy] = _StateAttribute()
+    _branch_membership: _StateAttribute[BranchMembership] = _StateAttribute()
+    _text_index: _StateAttribute[TextIndex] = _StateAttribute()
+    _class_facets: _StateAttribute[ClassFacets] = _StateAttribute()
+    _label_search_corpus: _StateAttribute[SearchCorpus] = _StateAttribute()
+    _all_label_search_corpus: _StateAttribute[SearchCorpus] = _StateAttribute()
+    _definition_search_corpus: _StateAttribute[SearchCorpus] = _StateAttribute()
+    _source_digest: _StateAttribute[Optional[SourceDigest]] = _StateAttribute()
+
     # pylint: disable=too-many-positional-arguments
     def __init__(
         self,
@@ -183,6 +879,12 @@ class FOLIO:
         llm_kwargs: Optional[dict] = None,
         effort: Optional[str] = None,
         tier: Optional[str] = None,
+        use_snapshot: bool = True,
+        cache_path: str | Path = DEFAULT_CACHE_DIR,
+        streaming: bool = False,
+        retain_tree: bool = True,
+        parse_workers: Optional[int] = None,
+        lazy_classes: bool = False,
     ) -> None:
         """
         Initialize the FOLIO ontology.
@@ -201,105 +903,340 @@ class FOLIO:
                 Translates to provider-specific params via get_llm_kwargs.
             tier (Optional[str]): Universal service tier ("flex", "standard", "priority").
                 Translates to provider-specific params via get_llm_kwargs.
+            use_snapshot (bool): Whether to restore the parsed ontology from a binary snapshot
+                next to the local cache, and to write one after parsing.  Requires use_cache.
+            cache_path (str | Path): The path to the cache directory.  Defaults to ~/.folio/cache,
+                or the FOLIO_CACHE_DIR environment variable if set.
+            streaming (bool): Whether to parse the ontology with a streaming iterparse parser
+                that never holds the full XML tree in memory, here and on refresh.
+            retain_tree (bool): Whether to keep the parsed XML tree on self.tree after parsing.
+                Ignored when streaming.
+            parse_workers (Optional[int]): If greater than 1, parse the ontology across this
+                many worker processes, here and on refresh.  Only node parsing runs in the
+                workers, so this only helps ontologies much larger than FOLIO on hosts with a
+                free core per worker.
+            lazy_classes (bool): Whether to keep parsed class fields in columnar storage and
+                only construct OWLClass models when classes are first accessed.
 
         Returns:
             None
         """
-        # initialize the tree and parser
-        self.source_type: str = source_type
-        self.http_url: Optional[str] = http_url
-        self.github_repo_owner: str = github_repo_owner
-        self.github_repo_name: str = github_repo_name
-        self.github_repo_branch: str = github_repo_branch
-        self.use_cache: bool = use_cache
-
-        # initialize the tree and parser
-        self.tree: Optional[lxml.etree._Element] = None
-        self.parser: Optional[lxml.etree.XMLParser] = None
-
-        # ontology data structures
-        self.title: Optional[str] = None
-        self.description: Optional[str] = None
-        self.classes: List[OWLClass] = []
-        self.object_properties: List[OWLObjectProperty] = []
-        self.iri_to_index: Dict[str, int] = {}
-        self.iri_to_property_index: Dict[str, int] = {}
-        self.label_to_index: Dict[str, List[int]] = {}
-        self.alt_label_to_index: Dict[str, List[int]] = {}
-        self.property_label_to_index: Dict[str, List[int]] = {}
-        self.class_edges: Dict[str, List[str]] = {}
-        self._cached_triples: Tuple[Tuple[str, str, str], ...] = ()
-        self._label_trie: Optional[marisa_trie.Trie] = None
-        self._lowercase_label_trie: Optional[marisa_trie.Trie] = None
-        self._lowercase_to_original: Dict[str, List[str]] = {}
-        self._prefix_cache: Dict[str, List[OWLClass]] = {}
-        self._ci_prefix_cache: Dict[str, List[OWLClass]] = {}
-        self.triples: List[Tuple[str, str, str]] = []
-
-        # load the ontology
-        LOGGER.info("Loading FOLIO ontology from %s...", source_type)
-        start_time = time.time()
-        owl_buffer = FOLIO.load_owl(
+        self._configure(
             source_type=source_type,
             http_url=http_url,
             github_repo_owner=github_repo_owner,
             github_repo_name=github_repo_name,
             github_repo_branch=github_repo_branch,
             use_cache=use_cache,
+            use_snapshot=use_snapshot,
+            cache_path=cache_path,
+            streaming=streaming,
+            parse_workers=parse_workers,
+            lazy_classes=lazy_classes,
         )
-        end_time = time.time()
-        LOGGER.info("Loaded FOLIO ontology in %.2f seconds", end_time - start_time)
-
-        # parse the ontology
-        LOGGER.info("Parsing FOLIO ontology...")
-        start_time = time.time()
-        self.parse_owl(owl_buffer)
-        end_time = time.time()
-        LOGGER.info("Parsed FOLIO ontology in %.2f seconds", end_time - start_time)
+        self._reset_state(lazy_classes=lazy_classes)
+
+        # restore the parsed ontology from a snapshot if possible
+        restored = False
+        if use_cache and use_snapshot:
+            start_time = time.time()
+            restored = self.load_snapshot()
+            end_time = time.time()
+            if restored:
+                LOGGER.info(
+                    "Restored FOLIO ontology snapshot in %.2f seconds",
+                    end_time - start_time,
+                )
 
-        # store llm kwargs for search calls
-        self.llm_kwargs: dict = llm_kwargs or {}
+        if not restored:
+            # load the ontology as bytes, memory-mapped from the cache if possible
+            LOGGER.info("Loading FOLIO ontology from %s...", source_type)
+            start_time = time.time()
+            with FOLIO._open_owl_verified(
+                source_type=source_type,
+                http_url=http_url,
+                github_repo_owner=github_repo_owner,
+                github_repo_name=github_repo_name,
+                github_repo_branch=github_repo_branch,
+                use_cache=use_cache,
+                cache_path=cache_path,
+            ) as (owl_buffer, owl_digest):
+                end_time = time.time()
+                LOGGER.info(
+                    "Loaded FOLIO ontology in %.2f seconds", end_time - start_time
+                )
 
-        # try to initialize a model
-        self.llm: Optional[BaseAIModel] = None
-        if alea_llm_client is not None:
-            try:
-                if llm is None:
-                    self.llm = alea_llm_client.OpenAIModel(model="gpt-5.4")
-                else:
-                    self.llm = llm
-                LOGGER.info("Initialized LLM model: %s", self.llm)
+                # parse the ontology
+                LOGGER.info("Parsing FOLIO ontology...")
+                start_time = time.time()
+                self.parse_owl(
+                    owl_buffer,
+                    streaming=streaming,
+                    retain_tree=retain_tree,
+                    parse_workers=parse_workers,
+                    source_digest=owl_digest,
+                )
+                end_time = time.time()
+                LOGGER.info(
+                    "Parsed FOLIO ontology in %.2f seconds", end_time - start_time
+                )
 
-                # Merge effort/tier into llm_kwargs using provider detection
-                if (
-                    effort is not None or tier is not None
-                ) and get_llm_kwargs is not None:
-                    provider_kwargs = get_llm_kwargs(self.llm, effort=effort, tier=tier)
-                    # provider_kwargs is base, llm_kwargs overrides
-                    merged = {**provider_kwargs, **self.llm_kwargs}
-                    self.llm_kwargs = merged
+            # write a snapshot for the next warm start
+            if use_cache and use_snapshot:
+                self._try_save_snapshot()
 
-            except Exception:  # pylint: disable=broad-except
-                LOGGER.warning(
-                    "Failed to initialize LLM model: %s", traceback.format_exc()
-                )
+        self._init_llm(llm=llm, llm_kwargs=llm_kwargs, effort=effort, tier=tier)
 
-    @staticmethod
-    def list_branches(
-        repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
-        repo_name: str = DEFAULT_GITHUB_REPO_NAME,
-    ) -> List[str]:
+    # pylint: disable=too-many-positional-arguments
+    @classmethod
+    async def aload(
+        cls,
+        source_type: str = DEFAULT_SOURCE_TYPE,
+        http_url: Optional[str] = DEFAULT_HTTP_URL,
+        github_repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        github_repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        github_repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+        use_cache: bool = True,
+        llm: Optional[BaseAIModel] = None,
+        llm_kwargs: Optional[dict] = None,
+        effort: Optional[str] = None,
+        tier: Optional[str] = None,
+        use_snapshot: bool = True,
+        cache_path: str | Path = DEFAULT_CACHE_DIR,
+        executor: Optional[Executor] = None,
+        streaming: bool = False,
+        parse_workers: Optional[int] = None,
+        lazy_classes: bool = False,
+    ) -> FOLIO:
         """
-        List the branches in a GitHub repository.
+        Asynchronously load the FOLIO ontology without blocking the event loop.
+
+        The ontology is downloaded with httpx.AsyncClient, and cache I/O, snapshot restores, and
+        parsing run in an executor.  Pass a ProcessPoolExecutor as the executor to parse in a
+        separate process instead of the default thread pool.
 
         Args:
-            repo_owner (str): The owner of the GitHub repository.
-            repo_name (str): The name of the GitHub repository.
+            source_type (str): The source type for loading the ontology. Either "github" or "http".
+            http_url (Optional[str]): The HTTP URL for the ontology.
+            github_repo_owner (str): The owner of the GitHub repository.
+            github_repo_name (str): The name of the GitHub repository.
+            github_repo_branch (str): The branch of the GitHub repository.
+            use_cache (bool): Whether to use the local cache
+            llm (Optional[BaseAIModel]): an alea_llm_client BaseAIModel instance for searching via decoder
+            llm_kwargs (Optional[dict]): Extra kwargs passed to LLM calls.
+            effort (Optional[str]): Universal effort level ("low", "medium", "high").
+            tier (Optional[str]): Universal service tier ("flex", "standard", "priority").
+            use_snapshot (bool): Whether to restore the parsed ontology from a binary snapshot.
+            cache_path (str | Path): The path to the cache directory.
+            executor (Optional[Executor]): The executor used to parse the ontology; defaults to the
+                event loop's default thread pool.
+            streaming (bool): Whether to parse the ontology with a streaming iterparse parser.
+            parse_workers (Optional[int]): If greater than 1, parse the ontology across this
+                many worker processes.
+            lazy_classes (bool): Whether to construct OWLClass models only when classes are
+                first accessed.
 
         Returns:
-            List[str]: A list of branch names in the GitHub repository.
+            FOLIO: The loaded FOLIO ontology.
         """
-        # GitHub API endpoint for listing branches
+        folio = cls.__new__(cls)
+        folio._configure(
+            source_type=source_type,
+            http_url=http_url,
+            github_repo_owner=github_repo_owner,
+            github_repo_name=github_repo_name,
+            github_repo_branch=github_repo_branch,
+            use_cache=use_cache,
+            use_snapshot=use_snapshot,
+            cache_path=cache_path,
+            streaming=streaming,
+            parse_workers=parse_workers,
+            lazy_classes=lazy_classes,
+        )
+        folio._reset_state(lazy_classes=lazy_classes)
+
+        # restore the parsed ontology from a snapshot if possible
+        restored = False
+        if use_cache and use_snapshot:
+            start_time = time.time()
+            restored = await asyncio.to_thread(folio.load_snapshot)
+            end_time = time.time()
+            if restored:
+                LOGGER.info(
+                    "Restored FOLIO ontology snapshot in %.2f seconds",
+                    end_time - start_time,
+                )
+
+        if not restored:
+            # load the ontology
+            LOGGER.info("Loading FOLIO ontology from %s...", source_type)
+            start_time = time.time()
+            owl_buffer = await FOLIO._aload_owl_bytes(
+                source_type=source_type,
+                http_url=http_url,
+                github_repo_owner=github_repo_owner,
+                github_repo_name=github_repo_name,
+                github_repo_branch=github_repo_branch,
+                use_cache=use_cache,
+                cache_path=cache_path,
+            )
+            end_time = time.time()
+            LOGGER.info("Loaded FOLIO ontology in %.2f seconds", end_time - start_time)
+
+            # parse the ontology
+            LOGGER.info("Parsing FOLIO ontology...")
+            start_time = time.time()
+            folio._set_state(
+                await FOLIO._aparse_owl_state(
+                    owl_buffer, executor, streaming, parse_workers, lazy_classes
+                )
+            )
+            end_time = time.time()
+            LOGGER.info("Parsed FOLIO ontology in %.2f seconds", end_time - start_time)
+
+            # write a snapshot for the next warm start
+            if use_cache and use_snapshot:
+                await asyncio.to_thread(folio._try_save_snapshot)
+
+        folio._init_llm(llm=llm, llm_kwargs=llm_kwargs, effort=effort, tier=tier)
+        return folio
+
+    # pylint: disable=too-many-positional-arguments
+    def _configure(
+        self,
+        source_type: str,
+        http_url: Optional[str],
+        github_repo_owner: str,
+        github_repo_name: str,
+        github_repo_branch: str,
+        use_cache: bool,
+        use_snapshot: bool,
+        cache_path: str | Path,
+        streaming: bool,
+        parse_workers: Optional[int],
+        lazy_classes: bool,
+    ) -> None:
+        """
+        Set the ontology source, cache, and parser configuration.
+
+        Args:
+            source_type (str): The source type for loading the ontology. Either "github" or "http".
+            http_url (Optional[str]): The HTTP URL for the ontology.
+            github_repo_owner (str): The owner of the GitHub repository.
+            github_repo_name (str): The name of the GitHub repository.
+            github_repo_branch (str): The branch of the GitHub repository.
+            use_cache (bool): Whether to use the local cache
+            use_snapshot (bool): Whether to use binary snapshots of the parsed ontology.
+            cache_path (str | Path): The path to the cache directory.
+            streaming (bool): Whether to parse the ontology with a streaming iterparse parser.
+            parse_workers (Optional[int]): The number of parallel parse worker processes.
+            lazy_classes (bool): Whether to construct OWLClass models only on first access.
+
+        Returns:
+            None
+        """
+        self.source_type: str = source_type
+        self.http_url: Optional[str] = http_url
+        self.github_repo_owner: str = github_repo_owner
+        self.github_repo_name: str = github_repo_name
+        self.github_repo_branch: str = github_repo_branch
+        self.use_cache: bool = use_cache
+        self.use_snapshot: bool = use_snapshot
+        self.cache_path: Path = Path(cache_path)
+        self.streaming: bool = streaming
+        self.parse_workers: Optional[int] = parse_workers
+        self.lazy_classes: bool = lazy_classes
+
+        # background refresh
+        self._refresh_stop: threading.Event = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def _reset_state(self, lazy_classes: bool = False) -> None:
+        """
+        Reset the tree, parser, and parsed ontology state to an empty state.
+
+        Args:
+            lazy_classes (bool): Whether to store classes in lazily-materialized columnar
+                storage instead of a list.
+
+        Returns:
+            None
+        """
+        # initialize the tree and parser
+        self.tree: Optional[lxml.etree._Element] = None
+        self.parser: Optional[lxml.etree.XMLParser] = None
+
+        # parsed ontology state, replaced as a whole when a new state is published
+        self._state: OntologyState = OntologyState(lazy_classes=lazy_classes)
+
+        # serializes state swaps; each refresh is numbered when it starts, so a refresh
+        # that finishes after a newer one has been published is discarded
+        self._refresh_lock: threading.RLock = threading.RLock()
+        self._refresh_generation: int = 0
+        self._state_generation: int = 0
+
+    def _init_llm(
+        self,
+        llm: Optional[BaseAIModel] = None,
+        llm_kwargs: Optional[dict] = None,
+        effort: Optional[str] = None,
+        tier: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the LLM model and kwargs used for searching.
+
+        Args:
+            llm (Optional[BaseAIModel]): an alea_llm_client BaseAIModel instance for searching via decoder
+            llm_kwargs (Optional[dict]): Extra kwargs passed to LLM calls.
+            effort (Optional[str]): Universal effort level ("low", "medium", "high").
+            tier (Optional[str]): Universal service tier ("flex", "standard", "priority").
+
+        Returns:
+            None
+        """
+        # store llm kwargs for search calls
+        self.llm_kwargs: dict = llm_kwargs or {}
+
+        # try to initialize a model
+        self.llm: Optional[BaseAIModel] = None
+        if alea_llm_client is not None:
+            try:
+                if llm is None:
+                    self.llm = alea_llm_client.OpenAIModel(model="gpt-5.4")
+                else:
+                    self.llm = llm
+                LOGGER.info("Initialized LLM model: %s", self.llm)
+
+                # Merge effort/tier into llm_kwargs using provider detection
+                if (
+                    effort is not None or tier is not None
+                ) and get_llm_kwargs is not None:
+                    provider_kwargs = get_llm_kwargs(self.llm, effort=effort, tier=tier)
+                    # provider_kwargs is base, llm_kwargs overrides
+                    merged = {**provider_kwargs, **self.llm_kwargs}
+                    self.llm_kwargs = merged
+
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.warning(
+                    "Failed to initialize LLM model: %s", traceback.format_exc()
+                )
+
+    @staticmethod
+    def list_branches(
+        repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+    ) -> List[str]:
+        """
+        List the branches in a GitHub repository.
+
+        Args:
+            repo_owner (str): The owner of the GitHub repository.
+            repo_name (str): The name of the GitHub repository.
+
+        Returns:
+            List[str]: A list of branch names in the GitHub repository.
+        """
+        # GitHub API endpoint for listing branches
         url = f"{DEFAULT_GITHUB_API_URL}/repos/{repo_owner}/{repo_name}/branches"
 
         # Set up headers with authentication
@@ -323,19 +1260,17 @@ class FOLIO:
             ) from e
 
     @staticmethod
-    def load_cache(
-        cache_path: str | Path = DEFAULT_CACHE_DIR,
+    def get_cache_key(
         source_type: str = DEFAULT_SOURCE_TYPE,
         http_url: Optional[str] = DEFAULT_HTTP_URL,
         github_repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
         github_repo_name: str = DEFAULT_GITHUB_REPO_NAME,
         github_repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
-    ) -> Optional[str]:
+    ) -> str:
         """
-        Load the FOLIO ontology from a local cache.
+        Get the unhashed cache key for an ontology source.
 
         Args:
-            cache_path (str | Path): The path to the cache directory.
             source_type (str): The source type for loading the ontology. Either "github" or "http".
             http_url (Optional[str]): The HTTP URL for the ontology.
             github_repo_owner (str): The owner of the GitHub repository.
@@ -343,44 +1278,92 @@ class FOLIO:
             github_repo_branch (str): The branch of the GitHub repository.
 
         Returns:
-            str | None: The raw ontology buffer, or None if the cache file does not exist.
+            str: The cache key.
         """
-        # determine the cache file path
-        if isinstance(cache_path, str):
-            cache_root_path = Path(cache_path)
-        else:
-            cache_root_path = cache_path
-
-        # determine the cache file name
         if source_type == "github":
-            cache_key = f"{github_repo_owner}/{github_repo_name}/{github_repo_branch}"
-        elif source_type == "http":
+            return f"{github_repo_owner}/{github_repo_name}/{github_repo_branch}"
+
+        if source_type == "http":
             if http_url is None:
                 raise ValueError("HTTP URL must be provided for source type 'http'.")
-            cache_key = http_url
-        else:
-            raise ValueError("Invalid source type. Must be either 'github' or 'http'.")
+            return http_url
+
+        raise ValueError("Invalid source type. Must be either 'github' or 'http'.")
+
+    @staticmethod
+    def get_cache_file_path(
+        cache_path: str | Path = DEFAULT_CACHE_DIR,
+        source_type: str = DEFAULT_SOURCE_TYPE,
+        http_url: Optional[str] = DEFAULT_HTTP_URL,
+        github_repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        github_repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        github_repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+    ) -> Path:
+        """
+        Get the OWL cache file path for an ontology source, creating the cache directory if needed.
+
+        Args:
+            cache_path (str | Path): The path to the cache directory.
+            source_type (str): The source type for loading the ontology. Either "github" or "http".
+            http_url (Optional[str]): The HTTP URL for the ontology.
+            github_repo_owner (str): The owner of the GitHub repository.
+            github_repo_name (str): The name of the GitHub repository.
+            github_repo_branch (str): The branch of the GitHub repository.
+
+        Returns:
+            Path: The cache file path.
+        """
+        return CacheStore(cache_path).get_path(
+            source_type,
+            FOLIO.get_cache_key(
+                source_type=source_type,
+                http_url=http_url,
+                github_repo_owner=github_repo_owner,
+                github_repo_name=github_repo_name,
+                github_repo_branch=github_repo_branch,
+            ),
+        )
 
-        # hash the cache key
-        cache_key_hash = hashlib.blake2b(cache_key.encode()).hexdigest()
-        cache_file_path = cache_root_path / source_type / f"{cache_key_hash}.owl"
+    @staticmethod
+    def load_cache(
+        cache_path: str | Path = DEFAULT_CACHE_DIR,
+        source_type: str = DEFAULT_SOURCE_TYPE,
+        http_url: Optional[str] = DEFAULT_HTTP_URL,
+        github_repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        github_repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        github_repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+    ) -> Optional[str]:
+        """
+        Load the FOLIO ontology from a local cache.
 
-        # create the cache directory if it does not exist
-        cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+        Args:
+            cache_path (str | Path): The path to the cache directory.
+            source_type (str): The source type for loading the ontology. Either "github" or "http".
+            http_url (Optional[str]): The HTTP URL for the ontology.
+            github_repo_owner (str): The owner of the GitHub repository.
+            github_repo_name (str): The name of the GitHub repository.
+            github_repo_branch (str): The branch of the GitHub repository.
 
-        # check if the cache file exists
-        if cache_file_path.exists():
-            LOGGER.info("Loaded ontology from cache: %s", cache_file_path)
-            with cache_file_path.open("rt", encoding="utf-8") as input_file:
-                return input_file.read()
+        Returns:
+            str | None: The raw ontology buffer, or None if the cache file does not exist or
+                fails its digest check.
+        """
+        # determine the cache file path
+        cache_file_path = FOLIO.get_cache_file_path(
+            cache_path=cache_path,
+            source_type=source_type,
+            http_url=http_url,
+            github_repo_owner=github_repo_owner,
+            github_repo_name=github_repo_name,
+            github_repo_branch=github_repo_branch,
+        )
 
-        # return None if the cache file does not exist
-        LOGGER.info("Cache file does not exist: %s", cache_file_path)
-        return None
+        data = CacheStore(cache_path).read(cache_file_path)
+        return data.decode("utf-8") if data is not None else None
 
     @staticmethod
     def save_cache(
-        buffer: str,
+        buffer: str | bytes,
         cache_path: str | Path = DEFAULT_CACHE_DIR,
         source_type: str = DEFAULT_SOURCE_TYPE,
         http_url: Optional[str] = DEFAULT_HTTP_URL,
@@ -391,8 +1374,11 @@ class FOLIO:
         """
         Save the FOLIO ontology to a local cache.
 
+        The cache file is written atomically under an inter-process lock, and is not rewritten
+        if its content is unchanged.
+
         Args:
-            buffer (str): The raw ontology buffer.
+            buffer (str | bytes): The raw ontology buffer.
             cache_path (str | Path): The path to the cache directory.
             source_type (str): The source type for loading the ontology. Either "github" or "http".
             http_url (Optional[str]): The HTTP URL for the ontology.
@@ -401,50 +1387,123 @@ class FOLIO:
             github_repo_branch (str): The branch of the GitHub repository.
         """
         # determine the cache file path
-        if isinstance(cache_path, str):
-            cache_root_path = Path(cache_path)
-        else:
-            cache_root_path = cache_path
+        cache_file_path = FOLIO.get_cache_file_path(
+            cache_path=cache_path,
+            source_type=source_type,
+            http_url=http_url,
+            github_repo_owner=github_repo_owner,
+            github_repo_name=github_repo_name,
+            github_repo_branch=github_repo_branch,
+        )
 
-        # determine the cache file name
-        if source_type == "github":
-            cache_key = f"{github_repo_owner}/{github_repo_name}/{github_repo_branch}"
-        elif source_type == "http":
-            if http_url is None:
-                raise ValueError("HTTP URL must be provided for source type 'http'.")
-            cache_key = http_url
-        else:
-            raise ValueError("Invalid source type. Must be either 'github' or 'http'.")
+        # write the buffer to the cache file
+        CacheStore(cache_path).write(
+            cache_file_path,
+            buffer.encode("utf-8") if isinstance(buffer, str) else buffer,
+        )
 
-        # hash the cache key
-        cache_key_hash = hashlib.blake2b(cache_key.encode()).hexdigest()
-        cache_file_path = cache_root_path / source_type / f"{cache_key_hash}.owl"
+    @staticmethod
+    def get_github_commit_sha(
+        repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+    ) -> Optional[str]:
+        """
+        Get the commit SHA at the head of a GitHub repository branch.
 
-        # create the cache directory if it does not exist
-        cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+        This is a best-effort lookup against the GitHub API, which is rate-limited for
+        unauthenticated clients, so failures are logged and None is returned.
 
-        # write the buffer to the cache file
-        with cache_file_path.open("wt", encoding="utf-8") as output_file:
-            LOGGER.info("Saving to cache: %s", cache_file_path)
-            output_file.write(buffer)
+        Args:
+            repo_owner (str): The owner of the GitHub repository.
+            repo_name (str): The name of the GitHub repository.
+            repo_branch (str): The branch of the GitHub repository.
+
+        Returns:
+            str | None: The commit SHA, or None if it could not be determined.
+        """
+        # GitHub API endpoint for the branch head commit
+        url = f"{DEFAULT_GITHUB_API_URL}/repos/{repo_owner}/{repo_name}/commits/{repo_branch}"
+
+        try:
+            with httpx.Client() as client:
+                response = client.get(url, headers=GITHUB_SHA_HEADERS)
+                response.raise_for_status()
+                return response.text.strip() or None
+        except httpx.HTTPError as e:
+            LOGGER.info("Unable to get commit SHA for %s: %s", url, e)
+            return None
 
     @staticmethod
-    def load_owl_github(
+    def _process_owl_response(
+        response: httpx.Response,
+        metadata: Optional[CacheMetadata] = None,
+        commit_sha: Optional[str] = None,
+    ) -> Tuple[Optional[bytes], CacheMetadata]:
+        """
+        Process the response to an ontology request, conditional or not.
+
+        Args:
+            response (httpx.Response): The HTTP response.
+            metadata (Optional[CacheMetadata]): The cache metadata sent with the request.
+            commit_sha (Optional[str]): The GitHub commit SHA of the branch head, if known.
+
+        Returns:
+            Tuple[Optional[bytes], CacheMetadata]: The raw ontology buffer, or None if it is
+                unchanged since the previous fetch, and the updated cache metadata.
+        """
+        # return the cached metadata with the new commit if unchanged
+        if response.status_code == 304 and metadata is not None:
+            LOGGER.info("Ontology not modified: %s", response.url)
+            return None, metadata.model_copy(
+                update={"commit_sha": commit_sha or metadata.commit_sha}
+            )
+
+        # Check if the request was successful
+        response.raise_for_status()
+
+        # return the raw ontology buffer without decoding it
+        return response.content, CacheMetadata.from_response(
+            response, commit_sha=commit_sha
+        )
+
+    @staticmethod
+    def fetch_owl_github(
         repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
         repo_name: str = DEFAULT_GITHUB_REPO_NAME,
         repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
-    ) -> str:
+        metadata: Optional[CacheMetadata] = None,
+    ) -> Tuple[Optional[bytes], CacheMetadata]:
         """
-        Load the FOLIO ontology in OWL format from a GitHub repository.
+        Fetch the FOLIO ontology in OWL format from a GitHub repository, conditionally if
+        cache metadata from a previous fetch is provided.
+
+        With metadata, the branch head commit SHA is checked first, and the file itself is then
+        requested with If-None-Match/If-Modified-Since so that an unchanged ontology returns 304.
 
         Args:
             repo_owner (str): The owner of the GitHub repository.
             repo_name (str): The name of the GitHub repository.
             repo_branch (str): The branch of the GitHub repository.
+            metadata (Optional[CacheMetadata]): The cache metadata from a previous fetch.
+
+        Returns:
+            Tuple[Optional[bytes], CacheMetadata]: The raw ontology buffer, or None if it is
+                unchanged since the previous fetch, and the updated cache metadata.
         """
         # GitHub URL for the ontology file
         url = f"{DEFAULT_GITHUB_OBJECT_URL}/{repo_owner}/{repo_name}/{repo_branch}/FOLIO.owl"
 
+        # check the branch head before requesting the file
+        commit_sha: Optional[str] = None
+        headers: Dict[str, str] = {}
+        if metadata is not None:
+            commit_sha = FOLIO.get_github_commit_sha(repo_owner, repo_name, repo_branch)
+            if commit_sha is not None and commit_sha == metadata.commit_sha:
+                LOGGER.info("Ontology unchanged at commit %s", commit_sha)
+                return None, metadata
+            headers = metadata.get_conditional_headers()
+
         # Load the ontology from the GitHub URL
         try:
             # setup client in context handler and make the request
@@ -452,52 +1511,54 @@ class FOLIO:
                 LOGGER.info(
                     "Loading ontology from %s/%s/%s", repo_owner, repo_name, repo_branch
                 )
-                response = client.get(url)
-
-                # Check if the request was successful
-                response.raise_for_status()
-
-                # return the raw ontology buffer
-                return response.text
+                response = client.get(url, headers=headers)
+                return FOLIO._process_owl_response(response, metadata, commit_sha)
         except httpx.HTTPStatusError as e:
             raise RuntimeError(
                 f"Error loading ontology from {repo_owner}/{repo_name}/{repo_branch}"
             ) from e
 
     @staticmethod
-    def load_owl_http(http_url: Optional[str] = DEFAULT_HTTP_URL) -> str:
+    def fetch_owl_http(
+        http_url: Optional[str] = DEFAULT_HTTP_URL,
+        metadata: Optional[CacheMetadata] = None,
+    ) -> Tuple[Optional[bytes], CacheMetadata]:
         """
-        Load the FOLIO ontology in OWL format from an HTTP URL.
+        Fetch the FOLIO ontology in OWL format from an HTTP URL, conditionally if cache
+        metadata from a previous fetch is provided.
 
         Args:
             http_url (str): The HTTP URL for the ontology.
+            metadata (Optional[CacheMetadata]): The cache metadata from a previous fetch.
+
+        Returns:
+            Tuple[Optional[bytes], CacheMetadata]: The raw ontology buffer, or None if it is
+                unchanged since the previous fetch, and the updated cache metadata.
         """
+        headers = metadata.get_conditional_headers() if metadata is not None else {}
+
         # Load the ontology from the HTTP URL
         try:
             # setup client in context handler and make the request
             with httpx.Client(follow_redirects=True) as client:
                 LOGGER.info("Loading ontology from %s", http_url)
-                response = client.get(http_url)
-
-                # Check if the request was successful
-                response.raise_for_status()
-
-                # return the raw ontology buffer
-                return response.text
+                response = client.get(http_url, headers=headers)
+                return FOLIO._process_owl_response(response, metadata)
         except httpx.HTTPStatusError as e:
             raise RuntimeError(f"Error loading ontology from {http_url}") from e
 
     @staticmethod
-    def load_owl(
+    def fetch_owl(
         source_type: str = DEFAULT_SOURCE_TYPE,
         http_url: Optional[str] = DEFAULT_HTTP_URL,
         github_repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
         github_repo_name: str = DEFAULT_GITHUB_REPO_NAME,
         github_repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
-        use_cache: bool = True,
-    ) -> str:
+        metadata: Optional[CacheMetadata] = None,
+    ) -> Tuple[Optional[bytes], CacheMetadata]:
         """
-        Load the FOLIO ontology in OWL format.
+        Fetch the FOLIO ontology in OWL format from its source, conditionally if cache
+        metadata from a previous fetch is provided.
 
         Args:
             source_type (str): The source type for loading the ontology. Either "github" or "http".
@@ -505,636 +1566,2542 @@ class FOLIO:
             github_repo_owner (str): The owner of the GitHub repository.
             github_repo_name (str): The name of the GitHub repository.
             github_repo_branch (str): The branch of the GitHub repository.
-            use_cache (bool): Whether to use the local cache.
-        """
-        owl_buffer: Optional[str] = None
-        if use_cache:
-            # Load the ontology from the cache
-            owl_buffer = FOLIO.load_cache(
+            metadata (Optional[CacheMetadata]): The cache metadata from a previous fetch.
+
+        Returns:
+            Tuple[Optional[bytes], CacheMetadata]: The raw ontology buffer, or None if it is
+                unchanged since the previous fetch, and the updated cache metadata.
+        """
+        if source_type == "github":
+            # Load the ontology from GitHub
+            return FOLIO.fetch_owl_github(
+                repo_owner=github_repo_owner,
+                repo_name=github_repo_name,
+                repo_branch=github_repo_branch,
+                metadata=metadata,
+            )
+
+        if source_type == "http":
+            if http_url is None:
+                raise ValueError("HTTP URL must be provided for source type 'http'.")
+
+            # Load the ontology from an HTTP URL
+            return FOLIO.fetch_owl_http(http_url=http_url, metadata=metadata)
+
+        raise ValueError("Invalid source type. Must be either 'github' or 'http'.")
+
+    @staticmethod
+    def load_owl_github(
+        repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+    ) -> str:
+        """
+        Load the FOLIO ontology in OWL format from a GitHub repository.
+
+        Args:
+            repo_owner (str): The owner of the GitHub repository.
+            repo_name (str): The name of the GitHub repository.
+            repo_branch (str): The branch of the GitHub repository.
+        """
+        owl_buffer, _ = FOLIO.fetch_owl_github(
+            repo_owner=repo_owner, repo_name=repo_name, repo_branch=repo_branch
+        )
+        return owl_buffer.decode("utf-8")  # type: ignore[union-attr]
+
+    @staticmethod
+    def load_owl_http(http_url: Optional[str] = DEFAULT_HTTP_URL) -> str:
+        """
+        Load the FOLIO ontology in OWL format from an HTTP URL.
+
+        Args:
+            http_url (str): The HTTP URL for the ontology.
+        """
+        owl_buffer, _ = FOLIO.fetch_owl_http(http_url=http_url)
+        return owl_buffer.decode("utf-8")  # type: ignore[union-attr]
+
+    @staticmethod
+    def load_owl(
+        source_type: str = DEFAULT_SOURCE_TYPE,
+        http_url: Optional[str] = DEFAULT_HTTP_URL,
+        github_repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        github_repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        github_repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+        use_cache: bool = True,
+        cache_path: str | Path = DEFAULT_CACHE_DIR,
+    ) -> str:
+        """
+        Load the FOLIO ontology in OWL format.
+
+        Args:
+            source_type (str): The source type for loading the ontology. Either "github" or "http".
+            http_url (Optional[str]): The HTTP URL for the ontology.
+            github_repo_owner (str): The owner of the GitHub repository.
+            github_repo_name (str): The name of the GitHub repository.
+            github_repo_branch (str): The branch of the GitHub repository.
+            use_cache (bool): Whether to use the local cache.
+            cache_path (str | Path): The path to the cache directory.
+        """
+        with FOLIO.open_owl(
+            source_type=source_type,
+            http_url=http_url,
+            github_repo_owner=github_repo_owner,
+            github_repo_name=github_repo_name,
+            github_repo_branch=github_repo_branch,
+            use_cache=use_cache,
+            cache_path=cache_path,
+        ) as owl_buffer:
+            return str(owl_buffer, "utf-8")
+
+    @staticmethod
+    @contextmanager
+    def open_owl(
+        source_type: str = DEFAULT_SOURCE_TYPE,
+        http_url: Optional[str] = DEFAULT_HTTP_URL,
+        github_repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        github_repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        github_repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+        use_cache: bool = True,
+        cache_path: str | Path = DEFAULT_CACHE_DIR,
+    ) -> Iterator[bytes | mmap.mmap]:
+        """
+        Open the FOLIO ontology in OWL format as an undecoded bytes buffer.
+
+        On a cache hit, the buffer is a read-only memory map of the verified cache file, which
+        parse_owl() parses without copying it into memory; it is closed on exit.  On Windows,
+        where a mapped file cannot be replaced, the cache file is read into bytes instead.  Otherwise, the
+        ontology is fetched as bytes and saved to the cache.
+
+        Args:
+            source_type (str): The source type for loading the ontology. Either "github" or "http".
+            http_url (Optional[str]): The HTTP URL for the ontology.
+            github_repo_owner (str): The owner of the GitHub repository.
+            github_repo_name (str): The name of the GitHub repository.
+            github_repo_branch (str): The branch of the GitHub repository.
+            use_cache (bool): Whether to use the local cache.
+            cache_path (str | Path): The path to the cache directory.
+
+        Yields:
+            bytes | mmap.mmap: The raw ontology buffer.
+        """
+        with FOLIO._open_owl_verified(
+            source_type=source_type,
+            http_url=http_url,
+            github_repo_owner=github_repo_owner,
+            github_repo_name=github_repo_name,
+            github_repo_branch=github_repo_branch,
+            use_cache=use_cache,
+            cache_path=cache_path,
+        ) as (owl_buffer, _):
+            yield owl_buffer
+
+    @staticmethod
+    @contextmanager
+    def _open_owl_verified(
+        source_type: str = DEFAULT_SOURCE_TYPE,
+        http_url: Optional[str] = DEFAULT_HTTP_URL,
+        github_repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        github_repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        github_repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+        use_cache: bool = True,
+        cache_path: str | Path = DEFAULT_CACHE_DIR,
+    ) -> Iterator[Tuple[bytes | mmap.mmap, Optional[str]]]:
+        """
+        Open the FOLIO ontology like open_owl(), along with the digest the cache verified it
+        against, so that the buffer does not have to be digested again to key its snapshot.
+
+        Args:
+            source_type (str): The source type for loading the ontology. Either "github" or "http".
+            http_url (Optional[str]): The HTTP URL for the ontology.
+            github_repo_owner (str): The owner of the GitHub repository.
+            github_repo_name (str): The name of the GitHub repository.
+            github_repo_branch (str): The branch of the GitHub repository.
+            use_cache (bool): Whether to use the local cache.
+            cache_path (str | Path): The path to the cache directory.
+
+        Yields:
+            Tuple[bytes | mmap.mmap, Optional[str]]: The raw ontology buffer and its digest, or
+                None if the cache did not record one or the cache is not used.
+        """
+
+        def fetch() -> Tuple[bytes, CacheMetadata]:
+            owl_buffer, metadata = FOLIO.fetch_owl(
                 source_type=source_type,
                 http_url=http_url,
                 github_repo_owner=github_repo_owner,
                 github_repo_name=github_repo_name,
                 github_repo_branch=github_repo_branch,
             )
+            return owl_buffer, metadata  # type: ignore[return-value]
+
+        if not use_cache:
+            yield fetch()[0], None
+            return
+
+        # Map the ontology from the cache, or fetch and save it on a miss
+        cache_file_path = FOLIO.get_cache_file_path(
+            cache_path=cache_path,
+            source_type=source_type,
+            http_url=http_url,
+            github_repo_owner=github_repo_owner,
+            github_repo_name=github_repo_name,
+            github_repo_branch=github_repo_branch,
+        )
+        cache_store = CacheStore(cache_path)
+        with cache_store.open_verified(cache_file_path) as (mapped, digest):
+            if mapped is not None:
+                yield mapped, digest
+                return
+
+        yield cache_store.read_or_fetch_verified(cache_file_path, fetch)
+
+    @staticmethod
+    def load_owl_if_modified(
+        cache_path: str | Path = DEFAULT_CACHE_DIR,
+        source_type: str = DEFAULT_SOURCE_TYPE,
+        http_url: Optional[str] = DEFAULT_HTTP_URL,
+        github_repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        github_repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        github_repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+    ) -> Optional[bytes]:
+        """
+        Revalidate the cached FOLIO ontology against its source with a conditional request.
+
+        The HTTP validators (ETag, Last-Modified) and GitHub commit SHA stored in the cache
+        metadata sidecar are sent with the request; if the source is unchanged, nothing is
+        downloaded.  Otherwise, the new ontology and its validators are saved to the cache.
+
+        Args:
+            cache_path (str | Path): The path to the cache directory.
+            source_type (str): The source type for loading the ontology. Either "github" or "http".
+            http_url (Optional[str]): The HTTP URL for the ontology.
+            github_repo_owner (str): The owner of the GitHub repository.
+            github_repo_name (str): The name of the GitHub repository.
+            github_repo_branch (str): The branch of the GitHub repository.
+
+        Returns:
+            bytes | None: The new raw ontology buffer, or None if the cached ontology is current.
+        """
+        cache_file_path = FOLIO.get_cache_file_path(
+            cache_path=cache_path,
+            source_type=source_type,
+            http_url=http_url,
+            github_repo_owner=github_repo_owner,
+            github_repo_name=github_repo_name,
+            github_repo_branch=github_repo_branch,
+        )
+
+        # only send validators if the cached file they describe still exists
+        metadata = (
+            read_cache_metadata(cache_file_path) if cache_file_path.exists() else None
+        )
+
+        owl_buffer, new_metadata = FOLIO.fetch_owl(
+            source_type=source_type,
+            http_url=http_url,
+            github_repo_owner=github_repo_owner,
+            github_repo_name=github_repo_name,
+            github_repo_branch=github_repo_branch,
+            metadata=metadata,
+        )
+
+        cache_store = CacheStore(cache_path)
+        if owl_buffer is not None:
+            cache_store.write(cache_file_path, owl_buffer, new_metadata)
+        elif new_metadata != metadata:
+            cache_store.write_metadata(cache_file_path, new_metadata)
+
+        return owl_buffer
+
+    @staticmethod
+    async def aget_github_commit_sha(
+        repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+    ) -> Optional[str]:
+        """
+        Asynchronously get the commit SHA at the head of a GitHub repository branch.
+
+        Args:
+            repo_owner (str): The owner of the GitHub repository.
+            repo_name (str): The name of the GitHub repository.
+            repo_branch (str): The branch of the GitHub repository.
+
+        Returns:
+            str | None: The commit SHA, or None if it could not be determined.
+        """
+        # GitHub API endpoint for the branch head commit
+        url = f"{DEFAULT_GITHUB_API_URL}/repos/{repo_owner}/{repo_name}/commits/{repo_branch}"
+
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.get(url, headers=GITHUB_SHA_HEADERS)
+                response.raise_for_status()
+                return response.text.strip() or None
+        except httpx.HTTPError as e:
+            LOGGER.info("Unable to get commit SHA for %s: %s", url, e)
+            return None
+
+    @staticmethod
+    async def afetch_owl_github(
+        repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+        metadata: Optional[CacheMetadata] = None,
+    ) -> Tuple[Optional[bytes], CacheMetadata]:
+        """
+        Asynchronously fetch the FOLIO ontology in OWL format from a GitHub repository.
+
+        See fetch_owl_github for the conditional request behavior.
+
+        Args:
+            repo_owner (str): The owner of the GitHub repository.
+            repo_name (str): The name of the GitHub repository.
+            repo_branch (str): The branch of the GitHub repository.
+            metadata (Optional[CacheMetadata]): The cache metadata from a previous fetch.
+
+        Returns:
+            Tuple[Optional[bytes], CacheMetadata]: The raw ontology buffer, or None if it is
+                unchanged since the previous fetch, and the updated cache metadata.
+        """
+        # GitHub URL for the ontology file
+        url = f"{DEFAULT_GITHUB_OBJECT_URL}/{repo_owner}/{repo_name}/{repo_branch}/FOLIO.owl"
+
+        # check the branch head before requesting the file
+        commit_sha: Optional[str] = None
+        headers: Dict[str, str] = {}
+        if metadata is not None:
+            commit_sha = await FOLIO.aget_github_commit_sha(
+                repo_owner, repo_name, repo_branch
+            )
+            if commit_sha is not None and commit_sha == metadata.commit_sha:
+                LOGGER.info("Ontology unchanged at commit %s", commit_sha)
+                return None, metadata
+            headers = metadata.get_conditional_headers()
+
+        # Load the ontology from the GitHub URL
+        try:
+            async with httpx.AsyncClient() as client:
+                LOGGER.info(
+                    "Loading ontology from %s/%s/%s", repo_owner, repo_name, repo_branch
+                )
+                response = await client.get(url, headers=headers)
+                return FOLIO._process_owl_response(response, metadata, commit_sha)
+        except httpx.HTTPStatusError as e:
+            raise RuntimeError(
+                f"Error loading ontology from {repo_owner}/{repo_name}/{repo_branch}"
+            ) from e
+
+    @staticmethod
+    async def afetch_owl_http(
+        http_url: Optional[str] = DEFAULT_HTTP_URL,
+        metadata: Optional[CacheMetadata] = None,
+    ) -> Tuple[Optional[bytes], CacheMetadata]:
+        """
+        Asynchronously fetch the FOLIO ontology in OWL format from an HTTP URL.
+
+        Args:
+            http_url (str): The HTTP URL for the ontology.
+            metadata (Optional[CacheMetadata]): The cache metadata from a previous fetch.
+
+        Returns:
+            Tuple[Optional[bytes], CacheMetadata]: The raw ontology buffer, or None if it is
+                unchanged since the previous fetch, and the updated cache metadata.
+        """
+        headers = metadata.get_conditional_headers() if metadata is not None else {}
+
+        # Load the ontology from the HTTP URL
+        try:
+            async with httpx.AsyncClient(follow_redirects=True) as client:
+                LOGGER.info("Loading ontology from %s", http_url)
+                response = await client.get(http_url, headers=headers)
+                return FOLIO._process_owl_response(response, metadata)
+        except httpx.HTTPStatusError as e:
+            raise RuntimeError(f"Error loading ontology from {http_url}") from e
+
+    @staticmethod
+    async def afetch_owl(
+        source_type: str = DEFAULT_SOURCE_TYPE,
+        http_url: Optional[str] = DEFAULT_HTTP_URL,
+        github_repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        github_repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        github_repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+        metadata: Optional[CacheMetadata] = None,
+    ) -> Tuple[Optional[bytes], CacheMetadata]:
+        """
+        Asynchronously fetch the FOLIO ontology in OWL format from its source.
+
+        Args:
+            source_type (str): The source type for loading the ontology. Either "github" or "http".
+            http_url (Optional[str]): The HTTP URL for the ontology.
+            github_repo_owner (str): The owner of the GitHub repository.
+            github_repo_name (str): The name of the GitHub repository.
+            github_repo_branch (str): The branch of the GitHub repository.
+            metadata (Optional[CacheMetadata]): The cache metadata from a previous fetch.
+
+        Returns:
+            Tuple[Optional[bytes], CacheMetadata]: The raw ontology buffer, or None if it is
+                unchanged since the previous fetch, and the updated cache metadata.
+        """
+        if source_type == "github":
+            return await FOLIO.afetch_owl_github(
+                repo_owner=github_repo_owner,
+                repo_name=github_repo_name,
+                repo_branch=github_repo_branch,
+                metadata=metadata,
+            )
+
+        if source_type == "http":
+            if http_url is None:
+                raise ValueError("HTTP URL must be provided for source type 'http'.")
+
+            return await FOLIO.afetch_owl_http(http_url=http_url, metadata=metadata)
+
+        raise ValueError("Invalid source type. Must be either 'github' or 'http'.")
+
+    @staticmethod
+    async def aload_owl(
+        source_type: str = DEFAULT_SOURCE_TYPE,
+        http_url: Optional[str] = DEFAULT_HTTP_URL,
+        github_repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        github_repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        github_repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+        use_cache: bool = True,
+        cache_path: str | Path = DEFAULT_CACHE_DIR,
+    ) -> str:
+        """
+        Asynchronously load the FOLIO ontology in OWL format.
+
+        Cache reads and writes run in a worker thread.  Unlike load_owl, the cache lock is not
+        held while downloading, so concurrent processes that all miss the cache may each fetch
+        the ontology; the cache writes themselves are still atomic and skipped if unchanged.
+
+        Args:
+            source_type (str): The source type for loading the ontology. Either "github" or "http".
+            http_url (Optional[str]): The HTTP URL for the ontology.
+            github_repo_owner (str): The owner of the GitHub repository.
+            github_repo_name (str): The name of the GitHub repository.
+            github_repo_branch (str): The branch of the GitHub repository.
+            use_cache (bool): Whether to use the local cache.
+            cache_path (str | Path): The path to the cache directory.
+
+        Returns:
+            str: The raw ontology buffer.
+        """
+        owl_buffer = await FOLIO._aload_owl_bytes(
+            source_type=source_type,
+            http_url=http_url,
+            github_repo_owner=github_repo_owner,
+            github_repo_name=github_repo_name,
+            github_repo_branch=github_repo_branch,
+            use_cache=use_cache,
+            cache_path=cache_path,
+        )
+        return owl_buffer.decode("utf-8")
+
+    @staticmethod
+    async def _aload_owl_bytes(
+        source_type: str = DEFAULT_SOURCE_TYPE,
+        http_url: Optional[str] = DEFAULT_HTTP_URL,
+        github_repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        github_repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        github_repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+        use_cache: bool = True,
+        cache_path: str | Path = DEFAULT_CACHE_DIR,
+    ) -> bytes:
+        """
+        Asynchronously load the FOLIO ontology in OWL format as an undecoded bytes buffer.
+
+        See aload_owl for details.
+
+        Args:
+            source_type (str): The source type for loading the ontology. Either "github" or "http".
+            http_url (Optional[str]): The HTTP URL for the ontology.
+            github_repo_owner (str): The owner of the GitHub repository.
+            github_repo_name (str): The name of the GitHub repository.
+            github_repo_branch (str): The branch of the GitHub repository.
+            use_cache (bool): Whether to use the local cache.
+            cache_path (str | Path): The path to the cache directory.
+
+        Returns:
+            bytes: The raw ontology buffer.
+        """
+        if use_cache:
+            cache_file_path = FOLIO.get_cache_file_path(
+                cache_path=cache_path,
+                source_type=source_type,
+                http_url=http_url,
+                github_repo_owner=github_repo_owner,
+                github_repo_name=github_repo_name,
+                github_repo_branch=github_repo_branch,
+            )
+            cache_store = CacheStore(cache_path)
+            cached_buffer = await asyncio.to_thread(cache_store.read, cache_file_path)
+            if cached_buffer is not None:
+                return cached_buffer
+
+        owl_buffer, metadata = await FOLIO.afetch_owl(
+            source_type=source_type,
+            http_url=http_url,
+            github_repo_owner=github_repo_owner,
+            github_repo_name=github_repo_name,
+            github_repo_branch=github_repo_branch,
+        )
+
+        # save the ontology to the cache
+        if use_cache:
+            await asyncio.to_thread(
+                cache_store.write, cache_file_path, owl_buffer, metadata
+            )
+
+        return owl_buffer  # type: ignore[return-value]
+
+    @staticmethod
+    async def aload_owl_if_modified(
+        cache_path: str | Path = DEFAULT_CACHE_DIR,
+        source_type: str = DEFAULT_SOURCE_TYPE,
+        http_url: Optional[str] = DEFAULT_HTTP_URL,
+        github_repo_owner: str = DEFAULT_GITHUB_REPO_OWNER,
+        github_repo_name: str = DEFAULT_GITHUB_REPO_NAME,
+        github_repo_branch: str = DEFAULT_GITHUB_REPO_BRANCH,
+    ) -> Optional[bytes]:
+        """
+        Asynchronously revalidate the cached FOLIO ontology against its source.
+
+        See load_owl_if_modified for the conditional request behavior.
+
+        Args:
+            cache_path (str | Path): The path to the cache directory.
+            source_type (str): The source type for loading the ontology. Either "github" or "http".
+            http_url (Optional[str]): The HTTP URL for the ontology.
+            github_repo_owner (str): The owner of the GitHub repository.
+            github_repo_name (str): The name of the GitHub repository.
+            github_repo_branch (str): The branch of the GitHub repository.
+
+        Returns:
+            bytes | None: The new raw ontology buffer, or None if the cached ontology is current.
+        """
+        cache_file_path = FOLIO.get_cache_file_path(
+            cache_path=cache_path,
+            source_type=source_type,
+            http_url=http_url,
+            github_repo_owner=github_repo_owner,
+            github_repo_name=github_repo_name,
+            github_repo_branch=github_repo_branch,
+        )
+
+        # only send validators if the cached file they describe still exists
+        metadata = (
+            await asyncio.to_thread(read_cache_metadata, cache_file_path)
+            if cache_file_path.exists()
+            else None
+        )
+
+        owl_buffer, new_metadata = await FOLIO.afetch_owl(
+            source_type=source_type,
+            http_url=http_url,
+            github_repo_owner=github_repo_owner,
+            github_repo_name=github_repo_name,
+            github_repo_branch=github_repo_branch,
+            metadata=metadata,
+        )
+
+        cache_store = CacheStore(cache_path)
+        if owl_buffer is not None:
+            await asyncio.to_thread(
+                cache_store.write, cache_file_path, owl_buffer, new_metadata
+            )
+        elif new_metadata != metadata:
+            await asyncio.to_thread(
+                cache_store.write_metadata, cache_file_path, new_metadata
+            )
+
+        return owl_buffer
+
+    @staticmethod
+    def _parse_owl_state(
+        buffer: str | bytes | mmap.mmap | Path,
+        streaming: bool = False,
+        parse_workers: Optional[int] = None,
+        lazy_classes: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Parse the FOLIO ontology into a new parsed ontology state.
+
+        The state is built on a bare instance so that it can be parsed in a worker thread or
+        process without touching a live FOLIO instance.
+
+        Args:
+            buffer (str | bytes | mmap.mmap | Path): The raw ontology buffer, or the path to an
+                OWL file.
+            streaming (bool): Whether to parse the ontology with a streaming iterparse parser.
+            parse_workers (Optional[int]): If greater than 1, the number of parallel parse
+                worker processes.
+            lazy_classes (bool): Whether to store classes in lazily-materialized columnar
+                storage.
+
+        Returns:
+            Dict[str, Any]: The parsed ontology state, keyed by attribute name.
+        """
+        folio = FOLIO.__new__(FOLIO)
+        folio._reset_state(lazy_classes=lazy_classes)
+        folio._build_state(
+            buffer,
+            streaming=streaming,
+            retain_tree=False,
+            parse_workers=parse_workers,
+        )
+        return folio._get_state()
+
+    @staticmethod
+    async def _aparse_owl_state(
+        buffer: bytes,
+        executor: Optional[Executor] = None,
+        streaming: bool = False,
+        parse_workers: Optional[int] = None,
+        lazy_classes: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Parse the FOLIO ontology into a new parsed ontology state in an executor.
+
+        Args:
+            buffer (bytes): The raw ontology buffer.
+            executor (Optional[Executor]): The executor; defaults to the event loop's default
+                thread pool.
+            streaming (bool): Whether to parse the ontology with a streaming iterparse parser.
+            parse_workers (Optional[int]): If greater than 1, the number of parallel parse
+                worker processes.
+            lazy_classes (bool): Whether to store classes in lazily-materialized columnar
+                storage.
+
+        Returns:
+            Dict[str, Any]: The parsed ontology state, keyed by attribute name.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            executor,
+            FOLIO._parse_owl_state,
+            buffer,
+            streaming,
+            parse_workers,
+            lazy_classes,
+        )
+
+    def _get_state(self) -> Dict[str, Any]:
+        """
+        Get the parsed ontology state.
+
+        Returns:
+            Dict[str, Any]: The parsed ontology state, keyed by attribute name.
+        """
+        return self._state.to_dict()
+
+    def _begin_refresh(self) -> int:
+        """
+        Number a refresh that builds a new state outside the refresh lock.
+
+        Returns:
+            int: The refresh generation, to pass to _set_state().
+        """
+        with self._refresh_lock:
+            self._refresh_generation += 1
+            return self._refresh_generation
+
+    def _set_state(
+        self, state: Dict[str, Any], generation: Optional[int] = None
+    ) -> bool:
+        """
+        Publish a new parsed ontology state.
+
+        The state is frozen and swapped in with a single assignment, so readers that take one
+        reference to the state see either the previous ontology or the new one, never a mix of
+        the two or a partially-built one.  Swaps are serialized with the refresh lock.
+
+        Args:
+            state (Dict[str, Any]): The parsed ontology state, keyed by attribute name.
+            generation (Optional[int]): The generation from _begin_refresh() of a refresh that
+                built the state without holding the refresh lock; the state is discarded if a
+                newer refresh was published in the meantime.
+
+        Returns:
+            bool: True if the state was published, False if it was discarded.
+        """
+        new_state = OntologyState.from_dict(state)
+        with self._refresh_lock:
+            if generation is None:
+                self._refresh_generation += 1
+                generation = self._refresh_generation
+            elif generation < self._state_generation:
+                return False
+
+            # release the previous tree along with the previous state
+            self._state_generation = generation
+            self._state = new_state
+            self.tree = None
+            self.parser = None
+        return True
+
+    def save_snapshot(self, cache_path: Optional[str | Path] = None) -> Optional[Path]:
+        """
+        Save a binary snapshot of the parsed ontology next to the local OWL cache file.
+
+        Args:
+            cache_path (Optional[str | Path]): The path to the cache directory; defaults to the
+                instance cache path.
+
+        Returns:
+            Path | None: The snapshot path, or None if the OWL cache file does not exist.
+        """
+        return write_snapshot(
+            self._get_state(),
+            cache_key=FOLIO.get_cache_key(
+                source_type=self.source_type,
+                http_url=self.http_url,
+                github_repo_owner=self.github_repo_owner,
+                github_repo_name=self.github_repo_name,
+                github_repo_branch=self.github_repo_branch,
+            ),
+            cache_file_path=FOLIO.get_cache_file_path(
+                cache_path=cache_path if cache_path is not None else self.cache_path,
+                source_type=self.source_type,
+                http_url=self.http_url,
+                github_repo_owner=self.github_repo_owner,
+                github_repo_name=self.github_repo_name,
+                github_repo_branch=self.github_repo_branch,
+            ),
+        )
+
+    def load_snapshot(self, cache_path: Optional[str | Path] = None) -> bool:
+        """
+        Restore the parsed ontology from a binary snapshot next to the local OWL cache file.
+
+        Args:
+            cache_path (Optional[str | Path]): The path to the cache directory; defaults to the
+                instance cache path.
+
+        Returns:
+            bool: True if the snapshot was restored, False if it was missing, stale, or invalid.
+        """
+        state = read_snapshot(
+            cache_key=FOLIO.get_cache_key(
+                source_type=self.source_type,
+                http_url=self.http_url,
+                github_repo_owner=self.github_repo_owner,
+                github_repo_name=self.github_repo_name,
+                github_repo_branch=self.github_repo_branch,
+            ),
+            cache_file_path=FOLIO.get_cache_file_path(
+                cache_path=cache_path if cache_path is not None else self.cache_path,
+                source_type=self.source_type,
+                http_url=self.http_url,
+                github_repo_owner=self.github_repo_owner,
+                github_repo_name=self.github_repo_name,
+                github_repo_branch=self.github_repo_branch,
+            ),
+        )
+        if state is None:
+            return False
+
+        if set(state.keys()) != set(STATE_ATTRIBUTES):
+            LOGGER.warning("Snapshot state does not match the current schema.")
+            return False
+
+        # match the class storage to the configured mode
+        if self.lazy_classes and not isinstance(state["classes"], ClassColumns):
+            state["classes"] = ClassColumns(state["classes"])
+        elif not self.lazy_classes and isinstance(state["classes"], ClassColumns):
+            state["classes"] = list(state["classes"])
+
+        self._set_state(state)
+        return True
+
+    def _try_save_snapshot(self) -> None:
+        """
+        Save a snapshot, logging instead of raising on failure.
+
+        Returns:
+            None
+        """
+        try:
+            self.save_snapshot()
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.warning("Failed to save snapshot: %s", traceback.format_exc())
+
+    @staticmethod
+    @cache
+    def get_ns_tag(ns: str, tag: str) -> str:
+        """
+        Get the namespace tag for an XML element.
+
+        Args:
+            ns (str): The namespace.
+            tag (str): The tag name.
+
+        Returns:
+            str: The namespace tag.
+        """
+        # DO NOT use nested f-strings for this method; not supported in older Python versions.
+        if ns in NSMAP:
+            return "{%s}%s" % (NSMAP[ns], tag)
+
+        return tag
+
+    def parse_owl_class(self, node: lxml.etree._Element) -> None:
+        """
+        Parse an OWL class in the FOLIO ontology.
+
+        Args:
+            node (lxml.etree._Element): The node element.
+
+        Returns:
+            OWLClass | None: The parsed OWL class, or None if the class is invalid.
+        """
+        # get the rdf:about
+        iri = node.attrib.get(self.get_ns_tag("rdf", "about"), None)
+        if iri is None:
+            LOGGER.info("Missing IRI for OWL class: %s", node)
+            return
+
+        # initialize the OWL class, or a record of its fields in lazy mode
+        owl_class = (
+            ClassRecord(iri)
+            if isinstance(self.classes, ClassColumns)
+            else OWLClass(iri=iri)
+        )
+
+        # dispatch each child element on its tag
+        for child in node.iterchildren():
+            handler = CLASS_TAG_HANDLERS.get(child.tag)
+            if handler is None:
+                LOGGER.debug("Unknown tag: %s", child.tag)
+                continue
+            handler(self, owl_class, child)
+
+        # skip invalid classes
+        if not owl_class.is_valid() and owl_class.iri != OWL_THING:
+            LOGGER.info("Invalid OWL class: %s", owl_class)
+            return
+
+        # append and update indices
+        self.classes.append(owl_class)
+        self._index_class(owl_class, len(self.classes) - 1)
+
+    @staticmethod
+    def _get_class_label_keys(owl_class: OWLClass) -> Tuple[List[str], List[str]]:
+        """
+        Get the label index keys for an OWL class.
+
+        Args:
+            owl_class (OWLClass): The OWL class.
+
+        Returns:
+            Tuple[List[str], List[str]]: The label_to_index and alt_label_to_index keys, with
+                one entry per index occurrence.
+        """
+        label_keys = [owl_class.label] if owl_class.label else []
+        alt_label_keys = [owl_class.preferred_label] if owl_class.preferred_label else []
+        alt_label_keys.extend(
+            alt_label
+            for alt_label in owl_class.alternative_labels  # pylint: disable=not-an-iterable
+            if alt_label
+        )
+        return label_keys, alt_label_keys
+
+    def _index_class(self, owl_class: OWLClass, index: int) -> None:
+        """
+        Add an OWL class to the IRI and label indices.
+
+        Args:
+            owl_class (OWLClass): The OWL class.
+            index (int): The index of the class in self.classes.
+
+        Returns:
+            None
+        """
+        self.iri_to_index[owl_class.iri] = index
+
+        # update the label index with the label, and the alt label index with the preferred
+        # and alternative labels; the index lists are replaced rather than appended to, so a
+        # delta can share them with the previous state
+        label_keys, alt_label_keys = self._get_class_label_keys(owl_class)
+        for label in label_keys:
+            self.label_to_index[label] = self.label_to_index.get(label, []) + [index]
+        for alt_label in alt_label_keys:
+            self.alt_label_to_index[alt_label] = self.alt_label_to_index.get(
+                alt_label, []
+            ) + [index]
+
+    def _unindex_class(self, owl_class: OWLClass, index: int) -> None:
+        """
+        Remove an OWL class from the IRI and label indices.
+
+        Args:
+            owl_class (OWLClass): The OWL class.
+            index (int): The index of the class in self.classes.
+
+        Returns:
+            None
+        """
+        if self.iri_to_index.get(owl_class.iri) == index:
+            del self.iri_to_index[owl_class.iri]
+
+        label_keys, alt_label_keys = self._get_class_label_keys(owl_class)
+        for index_map, keys in (
+            (self.label_to_index, label_keys),
+            (self.alt_label_to_index, alt_label_keys),
+        ):
+            for key in set(keys):
+                indices = [i for i in index_map.get(key, []) if i != index]
+                if indices:
+                    index_map[key] = indices
+                else:
+                    index_map.pop(key, None)
+
+    def parse_owl_object_property(self, node: lxml.etree._Element) -> None:
+        """
+        Parse an OWL object property in the FOLIO ontology.
+
+        Args:
+            node (lxml.etree._Element): The node element.
+
+        Returns:
+            None
+        """
+        # get the rdf:about
+        iri = node.attrib.get(self.get_ns_tag("rdf", "about"), None)
+        if iri is None:
+            LOGGER.info("Missing IRI for OWL object property: %s", node)
+            return
+
+        # initialize the OWL object property
+        owl_property = OWLObjectProperty(iri=iri)
+
+        # dispatch each child element on its tag
+        for child in node.iterchildren():
+            handler = OBJECT_PROPERTY_TAG_HANDLERS.get(child.tag)
+            if handler is None:
+                LOGGER.debug("Unknown tag in ObjectProperty: %s", child.tag)
+                continue
+            handler(self, owl_property, child)
+
+        # skip invalid properties
+        if not owl_property.is_valid():
+            LOGGER.info("Invalid OWL object property: %s", owl_property)
+            return
+
+        # append and update indices
+        self.object_properties.append(owl_property)
+        self._index_property(owl_property, len(self.object_properties) - 1)
+
+        # Add an edge triple for every domain/range pair to support graph traversal
+        self._add_property_edge_triples(owl_property)
+
+    def _add_property_edge_triples(self, owl_property: OWLObjectProperty) -> None:
+        """
+        Add the domain/range edge triples for an OWL object property that are not already present.
+
+        Args:
+            owl_property (OWLObjectProperty): The OWL object property.
+
+        Returns:
+            None
+        """
+        for edge_triple in self._get_property_edge_triples(owl_property):
+            self.triples.add(edge_triple)
+
+    @staticmethod
+    def _get_property_label_keys(owl_property: OWLObjectProperty) -> List[str]:
+        """
+        Get the property label index keys for an OWL object property.
+
+        Args:
+            owl_property (OWLObjectProperty): The OWL object property.
+
+        Returns:
+            List[str]: The property_label_to_index keys, with one entry per index occurrence.
+        """
+        return [
+            label
+            for label in (owl_property.label, owl_property.preferred_label)
+            if label
+        ]
+
+    @staticmethod
+    def _get_property_edge_triples(
+        owl_property: OWLObjectProperty,
+    ) -> List[Tuple[str, str, str]]:
+        """
+        Get the domain/range edge triples for an OWL object property.
+
+        These triples can be used to infer edges between IRIs, in the format
+        (domain_class, property_label, range_class), and are only generated for properties
+        with a preferred label.
+
+        Args:
+            owl_property (OWLObjectProperty): The OWL object property.
+
+        Returns:
+            List[Tuple[str, str, str]]: The edge triples.
+        """
+        if not owl_property.preferred_label:
+            return []
+
+        return [
+            (domain, owl_property.label, range_val)  # type: ignore[misc]
+            for domain in owl_property.domain
+            for range_val in owl_property.range
+        ]
+
+    def _index_property(self, owl_property: OWLObjectProperty, index: int) -> None:
+        """
+        Add an OWL object property to the IRI and label indices.
+
+        Args:
+            owl_property (OWLObjectProperty): The OWL object property.
+            index (int): The index of the property in self.object_properties.
+
+        Returns:
+            None
+        """
+        self.iri_to_property_index[owl_property.iri] = index
+        for label in self._get_property_label_keys(owl_property):
+            self.property_label_to_index[label] = self.property_label_to_index.get(
+                label, []
+            ) + [index]
+
+    def _unindex_property(self, owl_property: OWLObjectProperty, index: int) -> None:
+        """
+        Remove an OWL object property from the IRI and label indices.
+
+        Args:
+            owl_property (OWLObjectProperty): The OWL object property.
+            index (int): The index of the property in self.object_properties.
+
+        Returns:
+            None
+        """
+        if self.iri_to_property_index.get(owl_property.iri) == index:
+            del self.iri_to_property_index[owl_property.iri]
+
+        for label in set(self._get_property_label_keys(owl_property)):
+            indices = [
+                i for i in self.property_label_to_index.get(label, []) if i != index
+            ]
+            if indices:
+                self.property_label_to_index[label] = indices
+            else:
+                self.property_label_to_index.pop(label, None)
+
+    def parse_owl_ontology(self, node: lxml.etree._Element) -> None:
+        """
+        Parse an OWL ontology in the FOLIO ontology.
+
+        Args:
+            node (lxml.etree._Element): The node element.
+
+        Returns:
+            None
+        """
+        for child in node.getchildren():
+            if child.tag == self.get_ns_tag("dc", "title"):
+                self.title = child.text
+            elif child.tag == self.get_ns_tag("dc", "description"):
+                self.description = child.text
+
+    def parse_node(self, node: lxml.etree._Element) -> None:
+        """
+        Parse a node in the FOLIO ontology.
+
+        Nodes are dispatched on their tag through NODE_PARSERS, which maps these types:
+            - owl:Class
+            - owl:ObjectProperty
+            - owl:DatatypeProperty (not parsed yet)
+            - owl:AnnotationProperty (not parsed yet)
+            - owl:NamedIndividual (not parsed yet)
+            - owl:Ontology
+            - rdf:Description (not parsed yet)
+
+        Args:
+            node (lxml.etree._Element): The node element.
+
+        Returns:
+            None
+        """
+        if node.tag not in NODE_PARSERS:
+            LOGGER.debug("Unknown node type: %s", node.tag)
+            return
+
+        # dispatch by method name so that subclasses can override the node parsers
+        parser_name = NODE_PARSERS[node.tag]
+        if parser_name is not None:
+            getattr(self, parser_name)(node)
+
+    @staticmethod
+    def iterparse_nodes(
+        buffer: str | bytes | mmap.mmap | Path,
+        tags: Optional[Iterable[str]] = None,
+    ) -> Iterator[lxml.etree._Element]:
+        """
+        Stream the top-level nodes of the FOLIO ontology with lxml.etree.iterparse.
+
+        Each node is yielded once its subtree is complete and is cleared, along with any
+        previously yielded siblings, as soon as the caller asks for the next node, so only one
+        top-level node is held in memory at a time.
+
+        Args:
+            buffer (str | bytes | mmap.mmap | Path): The raw ontology buffer, or the path to an
+                OWL file.
+            tags (Optional[Iterable[str]]): If given, only yield nodes with these namespaced
+                tags; other elements are skipped by lxml without being passed to Python.
+
+        Yields:
+            lxml.etree._Element: The top-level ontology nodes, in document order.
+        """
+        # get a file name or file-like source for iterparse
+        if isinstance(buffer, Path):
+            source: Any = str(buffer)
+        elif isinstance(buffer, str):
+            source = io.BytesIO(buffer.encode("utf-8"))
+        elif isinstance(buffer, mmap.mmap):
+            buffer.seek(0)
+            source = buffer
+        else:
+            source = io.BytesIO(buffer)
+
+        for _, node in lxml.etree.iterparse(
+            source,
+            events=("end",),
+            tag=tags,
+            encoding="utf-8",
+            remove_comments=True,
+        ):
+            # only dispatch direct children of the root element
+            parent = node.getparent()
+            if parent is None or parent.getparent() is not None:
+                continue
+
+            yield node
+
+            # release the node and any earlier siblings
+            node.clear()
+            while node.getprevious() is not None:
+                del parent[0]
+
+    @staticmethod
+    def _parse_owl_partition(
+        path: Path,
+        start_line: int,
+        stop_line: Optional[int],
+        lazy_classes: bool = False,
+    ) -> bytes:
+        """
+        Parse one partition of the top-level ontology nodes in a parallel parse worker.
+
+        The partition state is returned pickled, so that it is unpickled by the merge loop
+        rather than by the process pool's result thread.
+
+        Args:
+            path (Path): The path to the OWL file.
+            start_line (int): The first source line of the partition.
+            stop_line (Optional[int]): The source line after the partition, or None to parse to
+                the end of the file.
+            lazy_classes (bool): Whether to store classes in lazily-materialized columnar
+                storage.
+
+        Returns:
+            bytes: The pickled partition state; see _parse_owl_partition_state().
+        """
+        with _gc_paused():
+            return pickle.dumps(
+                FOLIO._parse_owl_partition_state(
+                    path, start_line, stop_line, lazy_classes
+                ),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+
+    @staticmethod
+    def _parse_owl_partition_state(
+        path: Path,
+        start_line: int,
+        stop_line: Optional[int],
+        lazy_classes: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Parse the top-level ontology nodes starting on the lines of one partition.
+
+        The file is streamed with iterparse and read only up to the end of the partition, and
+        the nodes before it are released without being parsed, so no worker holds the whole
+        tree.  Only the node types with parsers are passed to Python.
+
+        Args:
+            path (Path): The path to the OWL file.
+            start_line (int): The first source line of the partition.
+            stop_line (Optional[int]): The source line after the partition, or None to parse to
+                the end of the file.
+            lazy_classes (bool): Whether to store classes in lazily-materialized columnar
+                storage.
+
+        Returns:
+            Dict[str, Any]: The classes, properties, and IRI and label indices parsed from the
+                partition, with indices local to it; the encoded triples and the rows of the
+                property edge triples among them; and the title and description, if the
+                partition sets them.
+        """
+        folio = _FOLIOPartitionParser.__new__(_FOLIOPartitionParser)
+        folio._reset_state(lazy_classes=lazy_classes)
+        unset = object()
+        folio.title = folio.description = unset  # type: ignore[assignment]
+
+        parsed_tags = [tag for tag, name in NODE_PARSERS.items() if name is not None]
+        for node in folio.iterparse_nodes(path, tags=parsed_tags):
+            if node.sourceline < start_line:
+                continue
+            if stop_line is not None and node.sourceline >= stop_line:
+                break
+            folio.parse_node(node)
+
+        partition = {
+            name: getattr(folio, name)
+            for name in (
+                "classes",
+                "object_properties",
+                "iri_to_index",
+                "iri_to_property_index",
+                "label_to_index",
+                "alt_label_to_index",
+                "property_label_to_index",
+            )
+        }
+        partition["triples"] = folio.triples.to_encoded()
+        partition["edge_rows"] = folio.edge_rows
+        for name in ("title", "description"):
+            if getattr(folio, name) is not unset:
+                partition[name] = getattr(folio, name)
+        return partition
+
+    def _merge_partition_state(self, partition: Dict[str, Any]) -> None:
+        """
+        Append the state parsed from a partition after the partitions before it.
+
+        The partition's indices are shifted past the classes and properties already merged,
+        its triples are appended without being re-encoded, and its property edge triples are
+        dropped if an earlier partition already added them, as a serial parse would.
+
+        Args:
+            partition (Dict[str, Any]): The partition state from _parse_owl_partition_state().
+
+        Returns:
+            None
+        """
+        for name in ("title", "description"):
+            if name in partition:
+                setattr(self, name, partition[name])
+
+        # shift the partition indices past the classes and properties already merged
+        class_offset = len(self.classes)
+        property_offset = len(self.object_properties)
+        if isinstance(self.classes, ClassColumns):
+            self.classes.extend_columns(partition["classes"])
+        else:
+            self.classes.extend(partition["classes"])
+        self.object_properties.extend(partition["object_properties"])
+
+        for name, offset in (
+            ("iri_to_index", class_offset),
+            ("iri_to_property_index", property_offset),
+        ):
+            getattr(self, name).update(
+                zip(
+                    partition[name].keys(),
+                    map(add, partition[name].values(), repeat(offset)),
+                )
+            )
+
+        # the index lists are replaced rather than appended to, as in _index_class()
+        for name, offset in (
+            ("label_to_index", class_offset),
+            ("alt_label_to_index", class_offset),
+            ("property_label_to_index", property_offset),
+        ):
+            label_index = getattr(self, name)
+            for key, indices in partition[name].items():
+                label_index[key] = label_index.get(key, []) + [
+                    index + offset for index in indices
+                ]
+
+        # drop the property edge triples that an earlier partition already added
+        triples = TripleStore.from_encoded(partition["triples"])
+        duplicate_rows = [
+            row for row in partition["edge_rows"] if self.triples.find(*triples[row])
+        ]
+        if duplicate_rows:
+            triples = triples.without_rows(duplicate_rows)
+        self.triples.extend_store(triples)
+
+    def _parse_owl_parallel(
+        self, buffer: str | bytes | mmap.mmap | Path, parse_workers: int
+    ) -> None:
+        """
+        Parse the top-level ontology nodes across a process pool.
+
+        The file is split into contiguous ranges of source lines, and each worker streams the
+        file, parses the top-level nodes starting in its range, and returns its classes,
+        properties, and indices along with its encoded triples.  The partitions are merged in
+        document order, so the classes, properties, indices, and triples are identical to a
+        serial parse.  Buffers are written to a temporary file once rather than sent to every
+        worker.  Workers are started with forkserver or spawn rather than fork, so scripts that
+        parse in parallel must guard their entry point with if __name__ == "__main__".
+
+        Merging, the class hierarchy, and the search indices are still built in this process,
+        so a parallel parse is only faster for large ontologies on hosts with a free core per
+        worker; on a single core, it is slower than a serial parse.  Documents on a single
+        line cannot be split and are parsed by the first worker.
+
+        Args:
+            buffer (str | bytes | mmap.mmap | Path): The raw ontology buffer, or the path to an
+                OWL file.
+            parse_workers (int): The number of worker processes.
+
+        Returns:
+            None
+        """
+        temp_path: Optional[Path] = None
+        try:
+            if isinstance(buffer, Path):
+                path = buffer
+            else:
+                with tempfile.NamedTemporaryFile(
+                    suffix=".owl", delete=False
+                ) as temp_file:
+                    temp_path = path = Path(temp_file.name)
+                    temp_file.write(
+                        buffer.encode("utf-8") if isinstance(buffer, str) else buffer
+                    )
+
+            # split the lines evenly; nodes are assigned by the line they start on
+            with path.open("rb") as owl_file:
+                num_lines = 1 + sum(
+                    chunk.count(b"\n")
+                    for chunk in iter(lambda: owl_file.read(PARSE_CHUNK_SIZE), b"")
+                )
+            start_lines = [
+                1 + partition * num_lines // parse_workers
+                for partition in range(parse_workers)
+            ]
+            stop_lines: List[Optional[int]] = [*start_lines[1:], None]
+
+            lazy_classes = isinstance(self.classes, ClassColumns)
+            with ProcessPoolExecutor(
+                max_workers=parse_workers, mp_context=_get_parse_pool_context()
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        FOLIO._parse_owl_partition,
+                        path,
+                        start_line,
+                        stop_line,
+                        lazy_classes,
+                    )
+                    for start_line, stop_line in zip(start_lines, stop_lines)
+                ]
+                payloads = [future.result() for future in futures]
+        finally:
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+
+        # unpickle and merge the partitions in order with the garbage collector paused
+        with _gc_paused():
+            for payload in payloads:
+                self._merge_partition_state(pickle.loads(payload))
+
+    def parse_owl(
+        self,
+        buffer: str | bytes | mmap.mmap | Path,
+        streaming: bool = False,
+        retain_tree: bool = True,
+        parse_workers: Optional[int] = None,
+        source_digest: Optional[str] = None,
+    ) -> None:
+        """
+        Parse the FOLIO ontology in OWL format.
+
+        Bytes and memory-mapped buffers are parsed without being decoded, and OWL files are
+        read by lxml directly from their path.  In streaming mode, the ontology is parsed with
+        iterparse and each top-level node is released as soon as it has been parsed, so the
+        full tree is never held in memory and self.tree is not set.
+
+        Args:
+            buffer (str | bytes | mmap.mmap | Path): The raw ontology buffer, or the path to an
+                OWL file.
+            streaming (bool): Whether to parse the ontology with iterparse instead of building
+                the full tree.
+            retain_tree (bool): Whether to keep the parsed tree on self.tree after parsing.
+                Ignored in streaming mode, which never retains the tree.
+            parse_workers (Optional[int]): If greater than 1, parse the top-level nodes across
+                this many worker processes; see _parse_owl_parallel() for when this helps.
+                Parallel parses never retain the tree.
+            source_digest (Optional[str]): The content digest of the buffer, if already known,
+                such as one verified by the cache; it keys snapshots of the parsed state.
+
+        Returns:
+            None
+        """
+        # parse into a new state and publish it once complete
+        builder = FOLIO.__new__(FOLIO)
+        builder._reset_state(lazy_classes=isinstance(self.classes, ClassColumns))
+        builder._build_state(
+            buffer, streaming, retain_tree, parse_workers, source_digest
+        )
+        with self._refresh_lock:
+            self._set_state(builder._get_state())
+            self.tree = builder.tree
+            self.parser = builder.parser
+
+    @staticmethod
+    def _get_source_digest(
+        buffer: str | bytes | mmap.mmap | Path, source_digest: Optional[str] = None
+    ) -> SourceDigest:
+        """
+        Get the content digest of an ontology buffer to key snapshots of its parsed state.
+
+        Strings and bytes cannot change, so they are only digested if a snapshot is written.
+        Memory maps may be closed and files rewritten after parsing, so they are digested now,
+        files a chunk at a time.
+
+        Args:
+            buffer (str | bytes | mmap.mmap | Path): The raw ontology buffer, or the path to an
+                OWL file.
+            source_digest (Optional[str]): The digest, if already known.
+
+        Returns:
+            SourceDigest: The digest.
+        """
+        if source_digest is not None:
+            return SourceDigest(source_digest)
+        if isinstance(buffer, (str, bytes)):
+            return SourceDigest(buffer=buffer)
+        return SourceDigest(get_digest(buffer))
+
+    def _build_state(
+        self,
+        buffer: str | bytes | mmap.mmap | Path,
+        streaming: bool = False,
+        retain_tree: bool = True,
+        parse_workers: Optional[int] = None,
+        source_digest: Optional[str] = None,
+    ) -> None:
+        """
+        Parse the FOLIO ontology into the unpublished state of this instance.
+
+        Args:
+            buffer (str | bytes | mmap.mmap | Path): The raw ontology buffer, or the path to an
+                OWL file.
+            streaming (bool): Whether to parse the ontology with iterparse.
+            retain_tree (bool): Whether to keep the parsed tree on self.tree after parsing.
+            parse_workers (Optional[int]): The number of parallel parse worker processes.
+            source_digest (Optional[str]): The content digest of the buffer, if already known.
+
+        Returns:
+            None
+        """
+        self._source_digest = self._get_source_digest(buffer, source_digest)
+        if parse_workers is not None and parse_workers > 1:
+            # parse node types across a process pool
+            self.parser = None
+            self.tree = None
+            self._parse_owl_parallel(buffer, parse_workers)
+        elif streaming:
+            # parse node types as they are streamed
+            self.parser = None
+            self.tree = None
+            for node in self.iterparse_nodes(buffer):
+                self.parse_node(node)
+        else:
+            # initialize the parser
+            self.parser = lxml.etree.XMLParser(
+                encoding="utf-8", remove_comments=True, ns_clean=True
+            )
+
+            # parse the buffer or file into a tree
+            if isinstance(buffer, Path):
+                self.tree = lxml.etree.parse(str(buffer), parser=self.parser).getroot()
+            else:
+                self.tree = lxml.etree.fromstring(buffer, parser=self.parser)
+
+            # parse node types
+            for node in self.tree.iterchildren():
+                self.parse_node(node)
+
+            # release the tree unless it should be retained
+            if not retain_tree:
+                self.parser = None
+                self.tree = None
+
+        # build the class edges
+        if isinstance(self.classes, ClassColumns):
+            self._build_lazy_class_edges(self.classes)
+        else:
+            for owl_class in self.classes:
+                for parent_class in owl_class.sub_class_of:
+                    # skip owl thing
+                    if parent_class == OWL_THING:
+                        continue
+
+                    # add forward edge
+                    if parent_class not in self.class_edges:
+                        self.class_edges[parent_class] = []
+                    self.class_edges[parent_class].append(owl_class.iri)
+
+                    # add reverse edge to the parent class
+                    if parent_class in self:
+                        self[parent_class].parent_class_of.append(owl_class.iri)  # type: ignore
+                    else:
+                        LOGGER.warning("Parent class not found: %s", parent_class)
+
+        # index the class edges and label the hierarchy for ancestor/descendant checks
+        self.class_adjacency = self._build_class_adjacency()
+        self._class_hierarchy = self._build_class_hierarchy()
+        self._branch_membership = self._build_branch_membership()
+        self._class_facets = self._build_class_facets()
+
+        # now create the Trie for the labels in label_to_index and alt_label_to_index
+        self._build_label_tries()
+        self._text_index = self._build_text_index()
+        self._build_search_corpora()
+
+    def _build_lazy_class_edges(self, classes: ClassColumns) -> None:
+        """
+        Build the class edges from columnar class storage without constructing OWLClass models.
+
+        Args:
+            classes (ClassColumns): The classes.
+
+        Returns:
+            None
+        """
+        for index in range(len(classes)):
+            iri = classes.get_value(index, "iri")
+            for parent_class in classes.get_value(index, "sub_class_of"):
+                # skip owl thing
+                if parent_class == OWL_THING:
+                    continue
+
+                # add forward edge
+                if parent_class not in self.class_edges:
+                    self.class_edges[parent_class] = []
+                self.class_edges[parent_class].append(iri)
+
+                # add reverse edge to the parent class
+                parent_index = self.iri_to_index.get(self.normalize_iri(parent_class))
+                if parent_index is not None:
+                    classes.append_value(parent_index, "parent_class_of", iri)
+                else:
+                    LOGGER.warning("Parent class not found: %s", parent_class)
+
+    def _build_class_adjacency(self) -> ClassAdjacency:
+        """
+        Build the CSR adjacency of the class hierarchy from the parent_class_of and
+        sub_class_of fields, dropping IRIs that are not classes in the ontology.
+
+        Returns:
+            ClassAdjacency: The class adjacency, keyed by class index.
+        """
+
+        def get_indices(index: int, field: str) -> List[int]:
+            indices = []
+            for iri in self._state.get_class_value(index, field):
+                neighbor_index = self.iri_to_index.get(self.normalize_iri(iri))
+                if neighbor_index is not None:
+                    indices.append(neighbor_index)
+            return indices
+
+        num_classes = len(self.classes)
+        return ClassAdjacency(
+            [get_indices(index, "parent_class_of") for index in range(num_classes)],
+            [get_indices(index, "sub_class_of") for index in range(num_classes)],
+        )
+
+    def _build_class_hierarchy(self) -> ClassHierarchy:
+        """
+        Build the interval labeling of the class hierarchy from the class adjacency.
+
+        Returns:
+            ClassHierarchy: The class hierarchy, keyed by class index.
+        """
+        adjacency = self.class_adjacency
+        return ClassHierarchy(
+            [adjacency.get_children(index) for index in range(len(adjacency))]
+        )
+
+    def _build_branch_membership(self) -> BranchMembership:
+        """
+        Build the FOLIO branch membership of each class from the class hierarchy.
+
+        Returns:
+            BranchMembership: The branch membership, keyed by class index and FOLIOTypes name.
+        """
+        membership = BranchMembership(len(self.classes), [ft.name for ft in FOLIOTypes])
+        for folio_type, folio_type_iri in FOLIO_TYPE_IRIS.items():
+            root_index = self.iri_to_index.get(self.normalize_iri(folio_type_iri))
+            if root_index is None:
+                continue
+
+            for max_depth in BRANCH_MEMBERSHIP_DEPTHS:
+                membership.add_members(
+                    folio_type.name,
+                    max_depth,
+                    (
+                        index
+                        for index, depth in self._state.iter_class_indices(
+                            root_index, max_depth=max_depth
+                        )
+                        if depth > 0
+                    ),
+                )
+        return membership
+
+    def _build_class_facets(self) -> ClassFacets:
+        """
+        Build the structural filter bitmaps of the classes.
+
+        Returns:
+            ClassFacets: The facets, keyed by class index.
+        """
+        num_classes = len(self.classes)
+        deprecated: List[int] = []
+        has_children: List[int] = []
+        countries: Dict[str, List[int]] = {}
+        for index, (is_deprecated, child_classes, country) in enumerate(
+            self._state.iter_class_values(("deprecated", "parent_class_of", "country"))
+        ):
+            if is_deprecated:
+                deprecated.append(index)
+            if child_classes:
+                has_children.append(index)
+            if country is not None:
+                countries.setdefault(country, []).append(index)
+
+        branches: Dict[str, Iterable[int]] = {}
+        for folio_type in FOLIOTypes:
+            members = self._branch_membership.get_members(folio_type.name, -1)
+            if members is not None:
+                branches[folio_type.name] = members
+
+        return ClassFacets(
+            num_classes,
+            deprecated=deprecated,
+            has_children=has_children,
+            branches=branches,
+            countries=countries,
+        )
+
+    def _build_text_index(self) -> TextIndex:
+        """
+        Build the inverted text index over the text fields of the classes.
+
+        Returns:
+            TextIndex: The text index, keyed by class index.
+        """
+        return TextIndex(self._state.iter_class_values(TEXT_FIELDS))
+
+    def _build_search_corpora(self) -> None:
+        """
+        Build the label and definition search corpora, preprocessed with rapidfuzz's
+        default_process, from the label indices and class definitions.
+
+        Returns:
+            None
+        """
+        if rapidfuzz is None:
+            self._label_search_corpus = SearchCorpus()
+            self._all_label_search_corpus = SearchCorpus()
+            self._definition_search_corpus = SearchCorpus()
+            return
+
+        processor = rapidfuzz.utils.default_process
+        labels = list(self.label_to_index.keys())
+        all_labels = labels + list(self.alt_label_to_index.keys())
+        self._label_search_corpus = SearchCorpus(labels, labels, processor)
+        self._all_label_search_corpus = SearchCorpus(all_labels, all_labels, processor)
+
+        class_indices = []
+        definitions = []
+        for index in range(len(self.classes)):
+            definition = self._state.get_class_value(index, "definition")
+            if definition is not None:
+                class_indices.append(index)
+                definitions.append(definition)
+        self._definition_search_corpus = SearchCorpus(
+            class_indices, definitions, processor
+        )
+
+    def _update_search_corpora(
+        self, current: Dict[str, Any], changed_indices: Iterable[int]
+    ) -> None:
+        """
+        Update the search corpora of a state for changed classes, reusing the preprocessed
+        strings of unchanged labels and definitions.
+
+        Args:
+            current (Dict[str, Any]): The state the classes changed from.
+            changed_indices (Iterable[int]): The indices of the added, removed, and modified
+                classes, including removed indices at or after the new number of classes.
+
+        Returns:
+            None
+        """
+        if rapidfuzz is None:
+            self._label_search_corpus = current["_label_search_corpus"]
+            self._all_label_search_corpus = current["_all_label_search_corpus"]
+            self._definition_search_corpus = current["_definition_search_corpus"]
+            return
+
+        processor = rapidfuzz.utils.default_process
+        labels = list(self.label_to_index.keys())
+        all_labels = labels + list(self.alt_label_to_index.keys())
+        if (
+            labels == current["_label_search_corpus"].keys
+            and all_labels == current["_all_label_search_corpus"].keys
+        ):
+            self._label_search_corpus = current["_label_search_corpus"]
+            self._all_label_search_corpus = current["_all_label_search_corpus"]
+        else:
+            self._label_search_corpus = current["_label_search_corpus"].rebuild(
+                labels, labels, processor
+            )
+            self._all_label_search_corpus = current["_all_label_search_corpus"].rebuild(
+                all_labels, all_labels, processor
+            )
+
+        num_classes = len(self.classes)
+        self._definition_search_corpus = current["_definition_search_corpus"].replace(
+            {
+                index: (
+                    self._state.get_class_value(index, "definition")
+                    if index < num_classes
+                    else None
+                )
+                for index in changed_indices
+            },
+            processor,
+        )
+
+    def _build_label_tries(self) -> None:
+        """
+        Build the label tries used for prefix search from the label indices.
+
+        Returns:
+            None
+        """
+        if marisa_trie is not None:
+            all_labels = [
+                label
+                for label in list(self.label_to_index.keys())
+                + list(self.alt_label_to_index.keys())
+                if len(label) >= MIN_PREFIX_LENGTH
+            ]
+            self._label_trie = marisa_trie.Trie(all_labels)
+
+            # build lowercase-to-original bridge dict and lowercase trie
+            self._lowercase_to_original = {}
+            for label in all_labels:
+                folded = label.casefold()
+                if folded not in self._lowercase_to_original:
+                    self._lowercase_to_original[folded] = []
+                self._lowercase_to_original[folded].append(label)
+            self._lowercase_label_trie = marisa_trie.Trie(
+                list(self._lowercase_to_original.keys())
+            )
+
+    @staticmethod
+    def get_node_fingerprint(node: lxml.etree._Element) -> str:
+        """
+        Get the fingerprint of an ontology node, used to detect changed classes and properties.
+
+        The text following the node is not part of it, so whitespace changes between nodes do
+        not change their fingerprints.
+
+        Args:
+            node (lxml.etree._Element): The node element.
+
+        Returns:
+            str: The blake2b hex digest of the serialized node.
+        """
+        return hashlib.blake2b(
+            lxml.etree.tostring(node, with_tail=False), digest_size=16
+        ).hexdigest()
+
+    def _get_entity_nodes(
+        self, tree: lxml.etree._Element
+    ) -> Optional[Tuple[Dict[str, lxml.etree._Element], Dict[str, lxml.etree._Element]]]:
+        """
+        Get the OWL class and object property nodes in an ontology tree, keyed by IRI.
+
+        Args:
+            tree (lxml.etree._Element): The parsed ontology tree.
+
+        Returns:
+            Tuple[Dict[str, lxml.etree._Element], Dict[str, lxml.etree._Element]] | None: The
+                class and object property nodes, or None if any IRI is defined more than once.
+        """
+        class_nodes: Dict[str, lxml.etree._Element] = {}
+        property_nodes: Dict[str, lxml.etree._Element] = {}
+        for node in tree.iterchildren():
+            if node.tag == self.get_ns_tag("owl", "Class"):
+                nodes = class_nodes
+            elif node.tag == self.get_ns_tag("owl", "ObjectProperty"):
+                nodes = property_nodes
+            else:
+                continue
+
+            iri = node.attrib.get(self.get_ns_tag("rdf", "about"), None)
+            if iri is None:
+                continue
+            if iri in nodes:
+                LOGGER.info("Duplicate IRI in ontology: %s", iri)
+                return None
+            nodes[iri] = node
+
+        return class_nodes, property_nodes
+
+    @staticmethod
+    def _parse_entity_node(
+        node: lxml.etree._Element,
+    ) -> Tuple[Optional[OWLClass | OWLObjectProperty], List[Tuple[str, str, str]]]:
+        """
+        Parse a single OWL class or object property node.
+
+        Args:
+            node (lxml.etree._Element): The node element.
+
+        Returns:
+            Tuple[Optional[OWLClass | OWLObjectProperty], List[Tuple[str, str, str]]]: The
+                parsed class or property, or None if it is invalid, and its triples.
+        """
+        folio = FOLIO.__new__(FOLIO)
+        folio._reset_state()
+        folio.parse_node(node)
+        entities = folio.classes or folio.object_properties
+        return (entities[0] if entities else None), folio.triples
+
+    @staticmethod
+    def _diff_entities(
+        old_entities: List[OWLClass] | List[OWLObjectProperty],
+        new_entities: List[OWLClass] | List[OWLObjectProperty],
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Compare two lists of parsed classes or properties by value.
+
+        Args:
+            old_entities (List[OWLClass] | List[OWLObjectProperty]): The previous entities.
+            new_entities (List[OWLClass] | List[OWLObjectProperty]): The new entities.
+
+        Returns:
+            Tuple[List[str], List[str], List[str]]: The added, removed, and modified IRIs.
+        """
+        old_by_iri = {entity.iri: entity for entity in old_entities}
+        new_by_iri = {entity.iri: entity for entity in new_entities}
+
+        # parent_class_of is derived from other classes, so it is not part of a class's content
+        return (
+            [iri for iri in new_by_iri if iri not in old_by_iri],
+            [iri for iri in old_by_iri if iri not in new_by_iri],
+            [
+                iri
+                for iri, entity in new_by_iri.items()
+                if iri in old_by_iri
+                and old_by_iri[iri].model_dump(exclude={"parent_class_of"})
+                != entity.model_dump(exclude={"parent_class_of"})
+            ],
+        )
 
-        if not owl_buffer:
-            if source_type == "github":
-                # Load the ontology from GitHub
-                owl_buffer = FOLIO.load_owl_github(
-                    repo_owner=github_repo_owner,
-                    repo_name=github_repo_name,
-                    repo_branch=github_repo_branch,
-                )
-            elif source_type == "http":
-                if http_url is None:
-                    raise ValueError(
-                        "HTTP URL must be provided for source type 'http'."
-                    )
+    def _remove_class(self, owl_class: OWLClass) -> None:
+        """
+        Remove an OWL class by moving the last class into its slot.
 
-                # Load the ontology from an HTTP URL
-                owl_buffer = FOLIO.load_owl_http(http_url=http_url)
-            else:
-                raise ValueError(
-                    "Invalid source type. Must be either 'github' or 'http'."
-                )
+        Args:
+            owl_class (OWLClass): The OWL class.
 
-        # Save the ontology to the cache
-        if use_cache:
-            FOLIO.save_cache(
-                buffer=owl_buffer,
-                source_type=source_type,
-                http_url=http_url,
-                github_repo_owner=github_repo_owner,
-                github_repo_name=github_repo_name,
-                github_repo_branch=github_repo_branch,
-            )
+        Returns:
+            None
+        """
+        index = self.iri_to_index[owl_class.iri]
+        self._unindex_class(owl_class, index)
 
-        return owl_buffer
+        last_index = len(self.classes) - 1
+        last_class = self.classes.pop()
+        if index != last_index:
+            self._unindex_class(last_class, last_index)
+            self.classes[index] = last_class
+            self._index_class(last_class, index)
 
-    @staticmethod
-    @cache
-    def get_ns_tag(ns: str, tag: str) -> str:
+    def _remove_property(self, owl_property: OWLObjectProperty) -> None:
         """
-        Get the namespace tag for an XML element.
+        Remove an OWL object property by moving the last property into its slot.
 
         Args:
-            ns (str): The namespace.
-            tag (str): The tag name.
+            owl_property (OWLObjectProperty): The OWL object property.
 
         Returns:
-            str: The namespace tag.
+            None
         """
-        # DO NOT use nested f-strings for this method; not supported in older Python versions.
-        if ns in NSMAP:
-            return "{%s}%s" % (NSMAP[ns], tag)
+        index = self.iri_to_property_index[owl_property.iri]
+        self._unindex_property(owl_property, index)
 
-        return tag
+        last_index = len(self.object_properties) - 1
+        last_property = self.object_properties.pop()
+        if index != last_index:
+            self._unindex_property(last_property, last_index)
+            self.object_properties[index] = last_property
+            self._index_property(last_property, index)
 
-    # pylint: disable=too-many-branches,too-many-statements
-    def parse_owl_class(self, node: lxml.etree._Element) -> None:
+    # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+    def parse_owl_delta(self, buffer: str | bytes | mmap.mmap) -> ChangeSet:
         """
-        Parse an OWL class in the FOLIO ontology.
+        Apply a new revision of the FOLIO ontology in OWL format as a delta.
+
+        Each OWL class and object property node is fingerprinted and compared against the
+        fingerprints from the previous delta, and only the added, removed, and modified classes
+        and properties are parsed and updated in the indices, class edges, and triples.  The
+        triples of changed entities are removed through the subject index, and the text index,
+        facets, and definition search corpus are only updated for the changed classes.  The
+        class hierarchy is only rebuilt if classes were added or removed or their superclasses
+        changed, and the label tries only if the set of labels changed.  The updated state is
+        built separately and swapped in atomically.
+
+        The first delta on an instance has no fingerprints to compare against.  If the buffer
+        is the one the current state was parsed from, only the fingerprints are recorded;
+        otherwise the whole ontology is parsed and the classes and properties are compared by
+        value.  Ontologies that define an IRI more than once are always parsed in full.
+
+        Added classes and properties are appended, and removed ones are replaced by the last
+        class or property, so indices and triple order may differ from a full parse.
 
         Args:
-            node (lxml.etree._Element): The node element.
+            buffer (str | bytes | mmap.mmap): The raw ontology buffer.
 
         Returns:
-            OWLClass | None: The parsed OWL class, or None if the class is invalid.
+            ChangeSet: The IRIs of the added, removed, and modified classes and properties.
         """
-        # get the rdf:about
-        iri = node.attrib.get(self.get_ns_tag("rdf", "about"), None)
-        if iri is None:
-            LOGGER.info("Missing IRI for OWL class: %s", node)
-            return
+        # the garbage collector is paused while the new objects are built next to the
+        # current state
+        with self._refresh_lock, _gc_paused():
+            current = self._get_state()
+            source_digest = self._get_source_digest(buffer)
 
-        # initialize the OWL class
-        owl_class = OWLClass(iri=iri)
+            # parse the buffer into a tree and fingerprint the class and property nodes
+            parser = lxml.etree.XMLParser(
+                encoding="utf-8", remove_comments=True, ns_clean=True
+            )
+            tree = lxml.etree.fromstring(buffer, parser=parser)
+            entity_nodes = self._get_entity_nodes(tree)
+            class_fingerprints: Dict[str, str] = {}
+            property_fingerprints: Dict[str, str] = {}
+            if entity_nodes is not None:
+                class_fingerprints = {
+                    iri: self.get_node_fingerprint(node)
+                    for iri, node in entity_nodes[0].items()
+                }
+                property_fingerprints = {
+                    iri: self.get_node_fingerprint(node)
+                    for iri, node in entity_nodes[1].items()
+                }
 
-        for child in node.getchildren():
-            if child.tag == self.get_ns_tag("rdfs", "label"):
-                # set label
-                owl_class.label = child.text
-
-                # add triple
-                self.triples.append((owl_class.iri, "rdfs:label", child.text))
-            elif child.tag == self.get_ns_tag("rdfs", "subClassOf"):
-                # set parent class
-                parent_class = child.attrib.get(
-                    self.get_ns_tag("rdf", "resource"), None
+            # without fingerprints to compare against, record them if the buffer is the one
+            # the current state was parsed from, or else parse in full and compare by value
+            if (
+                entity_nodes is not None
+                and not (
+                    current["_class_fingerprints"] or current["_property_fingerprints"]
                 )
-                if parent_class:
-                    owl_class.sub_class_of.append(parent_class)
+                and current["_source_digest"] is not None
+                and current["_source_digest"] == source_digest
+            ):
+                self._set_state(
+                    {
+                        **current,
+                        "_class_fingerprints": class_fingerprints,
+                        "_property_fingerprints": property_fingerprints,
+                    }
+                )
+                LOGGER.info("FOLIO ontology is unchanged")
+                return ChangeSet()
 
-                    # add triple
-                    self.triples.append(
-                        (owl_class.iri, "rdfs:subClassOf", parent_class)
+            if entity_nodes is None or not (
+                current["_class_fingerprints"] or current["_property_fingerprints"]
+            ):
+                LOGGER.info("Parsing full FOLIO ontology for delta...")
+                state = FOLIO._parse_owl_state(
+                    buffer, self.streaming, self.parse_workers, self.lazy_classes
+                )
+                state["_class_fingerprints"] = class_fingerprints
+                state["_property_fingerprints"] = property_fingerprints
+                added_classes, removed_classes, modified_classes = self._diff_entities(
+                    current["classes"], state["classes"]
+                )
+                added_properties, removed_properties, modified_properties = (
+                    self._diff_entities(
+                        current["object_properties"], state["object_properties"]
                     )
-                # Check for owl:Restriction with seeAlso relation
-                else:
-                    for restriction in child.findall(
-                        f".//{{{NSMAP['owl']}}}Restriction"
-                    ):
-                        on_property = restriction.find(
-                            f".//{{{NSMAP['owl']}}}onProperty"
+                )
+                self._set_state(state)
+                return ChangeSet(
+                    added_classes=added_classes,
+                    removed_classes=removed_classes,
+                    modified_classes=modified_classes,
+                    added_properties=added_properties,
+                    removed_properties=removed_properties,
+                    modified_properties=modified_properties,
+                )
+
+            # compare the fingerprints
+            class_nodes, property_nodes = entity_nodes
+            old_class_fingerprints = current["_class_fingerprints"]
+            old_property_fingerprints = current["_property_fingerprints"]
+            change_set = ChangeSet(
+                added_classes=[
+                    iri for iri in class_fingerprints if iri not in old_class_fingerprints
+                ],
+                removed_classes=[
+                    iri for iri in old_class_fingerprints if iri not in class_fingerprints
+                ],
+                modified_classes=[
+                    iri
+                    for iri, fingerprint in class_fingerprints.items()
+                    if old_class_fingerprints.get(iri, fingerprint) != fingerprint
+                ],
+                added_properties=[
+                    iri
+                    for iri in property_fingerprints
+                    if iri not in old_property_fingerprints
+                ],
+                removed_properties=[
+                    iri
+                    for iri in old_property_fingerprints
+                    if iri not in property_fingerprints
+                ],
+                modified_properties=[
+                    iri
+                    for iri, fingerprint in property_fingerprints.items()
+                    if old_property_fingerprints.get(iri, fingerprint) != fingerprint
+                ],
+            )
+
+            # build the updated state on a copy of the current indices; their lists are
+            # replaced rather than changed in place, so they are shared with the current state
+            folio = FOLIO.__new__(FOLIO)
+            folio._reset_state()
+            folio.classes = current["classes"].copy()
+            folio.object_properties = list(current["object_properties"])
+            folio.iri_to_index = dict(current["iri_to_index"])
+            folio.iri_to_property_index = dict(current["iri_to_property_index"])
+            folio.label_to_index = dict(current["label_to_index"])
+            folio.alt_label_to_index = dict(current["alt_label_to_index"])
+            folio.property_label_to_index = dict(current["property_label_to_index"])
+            folio.class_edges = dict(current["class_edges"])
+
+            # parse the ontology metadata
+            for node in tree.iterchildren():
+                if node.tag == self.get_ns_tag("owl", "Ontology"):
+                    folio.parse_owl_ontology(node)
+
+            if (
+                change_set.is_empty()
+                and folio.title == current["title"]
+                and folio.description == current["description"]
+            ):
+                # key the current state on the new buffer if only its formatting changed
+                if source_digest != current["_source_digest"]:
+                    self._set_state({**current, "_source_digest": source_digest})
+                LOGGER.info("FOLIO ontology is unchanged")
+                return change_set
+
+            # update the changed classes and their class edges
+            new_triples: List[Tuple[str, str, str]] = []
+            edge_iris: set = set()
+            changed_indices: set = set()
+            edges_changed = bool(change_set.added_classes or change_set.removed_classes)
+            for iri in (
+                change_set.removed_classes
+                + change_set.modified_classes
+                + change_set.added_classes
+            ):
+                old_class: Optional[OWLClass] = (
+                    current["classes"][current["iri_to_index"][iri]]
+                    if iri in current["iri_to_index"]
+                    else None
+                )
+                new_class: Optional[OWLClass] = None
+                if iri in class_nodes:
+                    new_class, class_triples = self._parse_entity_node(class_nodes[iri])  # type: ignore[assignment]
+                    new_triples.extend(class_triples)
+
+                # only move the class between its parents' children if its parents changed
+                if (
+                    old_class is None
+                    or new_class is None
+                    or old_class.sub_class_of != new_class.sub_class_of
+                ):
+                    edges_changed = True
+                    if old_class is not None:
+                        for parent_class in set(old_class.sub_class_of) - {OWL_THING}:
+                            children = [
+                                child
+                                for child in folio.class_edges.get(parent_class, [])
+                                if child != iri
+                            ]
+                            if children:
+                                folio.class_edges[parent_class] = children
+                            else:
+                                folio.class_edges.pop(parent_class, None)
+                            edge_iris.add(parent_class)
+
+                    if new_class is not None:
+                        for parent_class in new_class.sub_class_of:
+                            if parent_class != OWL_THING:
+                                folio.class_edges[parent_class] = folio.class_edges.get(
+                                    parent_class, []
+                                ) + [iri]
+                                edge_iris.add(parent_class)
+
+                if new_class is not None:
+                    edge_iris.add(iri)
+
+                if old_class is not None and new_class is not None:
+                    index = folio.iri_to_index[iri]
+                    folio._unindex_class(old_class, index)
+                    folio.classes[index] = new_class
+                    folio._index_class(new_class, index)
+                    changed_indices.add(index)
+                elif old_class is not None:
+                    # the last class moves into the removed class's slot
+                    changed_indices.update(
+                        (folio.iri_to_index[iri], len(folio.classes) - 1)
+                    )
+                    folio._remove_class(old_class)
+                elif new_class is not None:
+                    changed_indices.add(len(folio.classes))
+                    folio.classes.append(new_class)
+                    folio._index_class(new_class, len(folio.classes) - 1)
+
+            # update the reverse edges of classes whose children changed
+            for iri in edge_iris:
+                if iri in folio.iri_to_index:
+                    index = folio.iri_to_index[iri]
+                    children = folio.class_edges.get(iri, [])
+                    if folio.classes[index].parent_class_of != children:
+                        folio.classes[index] = folio.classes[index].model_copy(
+                            update={"parent_class_of": list(children)}
                         )
-                        if on_property is not None:
-                            property_resource = on_property.attrib.get(
-                                self.get_ns_tag("rdf", "resource"), None
-                            )
 
-                            # Check if it's a seeAlso restriction
-                            if (
-                                property_resource
-                                == "http://www.w3.org/2000/01/rdf-schema#seeAlso"
-                            ):
-                                some_values_from = restriction.find(
-                                    f".//{{{NSMAP['owl']}}}someValuesFrom"
-                                )
-                                if some_values_from is not None:
-                                    target_resource = some_values_from.attrib.get(
-                                        self.get_ns_tag("rdf", "resource"), None
-                                    )
-                                    if target_resource:
-                                        # Add to regular seeAlso list instead of a separate restrictions list
-                                        owl_class.see_also.append(target_resource)
-
-                                        # Add triple for the restriction
-                                        self.triples.append(
-                                            (
-                                                owl_class.iri,
-                                                "rdfs:seeAlso",
-                                                target_resource,
-                                            )
-                                        )
-            elif child.tag == self.get_ns_tag("rdfs", "isDefinedBy"):
-                # set defined by
-                defined_by = child.attrib.get(self.get_ns_tag("rdf", "resource"), None)
-                if defined_by:
-                    owl_class.is_defined_by = defined_by
-
-                    # add triple
-                    self.triples.append((owl_class.iri, "rdfs:isDefinedBy", defined_by))
-            elif child.tag == self.get_ns_tag("rdfs", "seeAlso"):
-                # set see also
-                see_also = child.attrib.get(self.get_ns_tag("rdf", "resource"), None)
-                if see_also:
-                    owl_class.see_also.append(see_also)
-
-                    # add triple
-                    self.triples.append((owl_class.iri, "rdfs:seeAlso", see_also))
-                elif child.text:  # Handle case where seeAlso has text content
-                    owl_class.see_also.append(child.text)
-
-                    # add triple
-                    self.triples.append((owl_class.iri, "rdfs:seeAlso", child.text))
-            elif child.tag == self.get_ns_tag("rdfs", "comment"):
-                # set comment
-                owl_class.comment = child.text
-
-                # add triple
-                self.triples.append((owl_class.iri, "rdfs:comment", child.text))
-            elif child.tag == self.get_ns_tag("owl", "deprecated"):
-                # set deprecated
-                owl_class.deprecated = True
-
-                # add triple
-                self.triples.append((owl_class.iri, "owl:deprecated", "true"))
-            elif child.tag == self.get_ns_tag("skos", "prefLabel"):
-                # set preferred label
-                owl_class.preferred_label = child.text
-
-                # add triple
-            elif child.tag == self.get_ns_tag("skos", "altLabel"):
-                # set alternative label
-                lang = child.attrib.get(self.get_ns_tag("xml", "lang"), None)
-                if lang:
-                    owl_class.translations[lang] = child.text
-                # Always add to alternative_labels for search indexing
-                if child.text not in owl_class.alternative_labels:
-                    owl_class.alternative_labels.append(child.text)
-
-                # add triple
-                self.triples.append((owl_class.iri, "skos:altLabel", child.text))
-            elif child.tag == self.get_ns_tag("skos", "hiddenLabel"):
-                # set hidden label
-                owl_class.hidden_label = child.text
-
-                # add to alternative labels
-                owl_class.alternative_labels.append(child.text)
-
-                # add triple
-                self.triples.append((owl_class.iri, "skos:hiddenLabel", child.text))
-            elif child.tag == self.get_ns_tag("skos", "definition"):
-                # set definition
-                owl_class.definition = child.text
-
-                # add triple
-                self.triples.append((owl_class.iri, "skos:definition", child.text))
-            elif child.tag == self.get_ns_tag("skos", "example"):
-                # add example
-                owl_class.examples.append(child.text)
-
-                # add triple
-                self.triples.append((owl_class.iri, "skos:example", child.text))
-            elif child.tag == self.get_ns_tag("skos", "note"):
-                # add note
-                owl_class.notes.append(child.text)
-
-                # add triple
-                self.triples.append((owl_class.iri, "skos:note", child.text))
-            elif child.tag == self.get_ns_tag("skos", "historyNote"):
-                # set history note
-                owl_class.history_note = child.text
-
-                # add triple
-                self.triples.append((owl_class.iri, "skos:historyNote", child.text))
-            elif child.tag == self.get_ns_tag("skos", "editorialNote"):
-                # set editorial note
-                owl_class.editorial_note = child.text
-
-                # add triple
-                self.triples.append((owl_class.iri, "skos:editorialNote", child.text))
-            elif child.tag == self.get_ns_tag("skos", "inScheme"):
-                # set in scheme
-                owl_class.in_scheme = child.text
-
-                # add triple
-                self.triples.append((owl_class.iri, "skos:inScheme", child.text))
-            elif child.tag == self.get_ns_tag("dc", "identifier"):
-                # set identifier
-                owl_class.identifier = child.text
-
-                # add triple
-                self.triples.append((owl_class.iri, "dc:identifier", child.text))
-            elif child.tag == self.get_ns_tag("dc", "description"):
-                # set description
-                owl_class.description = child.text
-
-                # add triple
-                self.triples.append((owl_class.iri, "dc:description", child.text))
-            elif child.tag == self.get_ns_tag("dc", "source"):
-                # set source
-                owl_class.source = child.text
-
-                # add triple
-                self.triples.append((owl_class.iri, "dc:source", child.text))
-            elif child.tag == self.get_ns_tag("v1", "country"):
-                # set country
-                owl_class.country = child.text
-
-                # add triple
-                self.triples.append((owl_class.iri, "v1:country", child.text))
-            else:
-                # raise RuntimeError(f"Unknown tag: {child.tag}")
-                LOGGER.debug("Unknown tag: %s", child.tag)
+            # update the changed properties
+            changed_property_iris = set(
+                change_set.removed_properties
+                + change_set.modified_properties
+                + change_set.added_properties
+            )
+            new_edge_triples: List[Tuple[str, str, str]] = []
+            changed_edge_triples: set = set()
+            for iri in (
+                change_set.removed_properties
+                + change_set.modified_properties
+                + change_set.added_properties
+            ):
+                old_property: Optional[OWLObjectProperty] = (
+                    current["object_properties"][current["iri_to_property_index"][iri]]
+                    if iri in current["iri_to_property_index"]
+                    else None
+                )
+                new_property: Optional[OWLObjectProperty] = None
+                if iri in property_nodes:
+                    new_property, property_triples = self._parse_entity_node(  # type: ignore[assignment]
+                        property_nodes[iri]
+                    )
+                    property_edge_triples = (
+                        self._get_property_edge_triples(new_property)
+                        if new_property is not None
+                        else []
+                    )
+                    new_triples.extend(
+                        triple
+                        for triple in property_triples
+                        if triple not in property_edge_triples
+                    )
+                    new_edge_triples.extend(property_edge_triples)
 
-        # skip invalid classes
-        if not owl_class.is_valid() and owl_class.iri != OWL_THING:
-            LOGGER.info("Invalid OWL class: %s", owl_class)
-            return
+                if old_property is not None:
+                    changed_edge_triples.update(
+                        self._get_property_edge_triples(old_property)
+                    )
 
-        # append and update indices
-        self.classes.append(owl_class)
+                if old_property is not None and new_property is not None:
+                    index = folio.iri_to_property_index[iri]
+                    folio._unindex_property(old_property, index)
+                    folio.object_properties[index] = new_property
+                    folio._index_property(new_property, index)
+                elif old_property is not None:
+                    folio._remove_property(old_property)
+                elif new_property is not None:
+                    folio.object_properties.append(new_property)
+                    folio._index_property(
+                        new_property, len(folio.object_properties) - 1
+                    )
 
-        # update the indices
-        index = len(self.classes) - 1
-        self.iri_to_index[owl_class.iri] = index
+            # edge triples are shared between properties with the same label, domain, and range
+            kept_edge_triples = {
+                triple
+                for owl_property in current["object_properties"]
+                if owl_property.iri not in changed_property_iris
+                for triple in self._get_property_edge_triples(owl_property)
+            }
 
-        # update the label index with pref label
-        if owl_class.label:
-            if owl_class.label not in self.label_to_index:
-                self.label_to_index[owl_class.label] = [index]
-            else:
-                self.label_to_index[owl_class.label].append(index)
+            # remove the triples of changed classes and properties and their edge triples,
+            # keeping edge triples still generated by unchanged properties, then add the new
+            # triples
+            triples: TripleStore = current["triples"]
+            removed_rows: set = set()
+            for iri in change_set.get_changed_iris():
+                removed_rows.update(triples.find_rows(subject=iri))
+            for edge_triple in changed_edge_triples - kept_edge_triples:
+                removed_rows.update(triples.find_rows(*edge_triple))
+            folio.triples = triples.without_rows(
+                row for row in removed_rows if triples[row] not in kept_edge_triples
+            )
+            folio.triples.extend(new_triples)
+            for edge_triple in new_edge_triples:
+                folio.triples.add(edge_triple)
 
-        # update the alt label index with preferred label
-        if owl_class.preferred_label:
-            if owl_class.preferred_label not in self.alt_label_to_index:
-                self.alt_label_to_index[owl_class.preferred_label] = [index]
+            # only rebuild the label tries if the set of labels changed
+            if (
+                folio.label_to_index.keys() != current["label_to_index"].keys()
+                or folio.alt_label_to_index.keys()
+                != current["alt_label_to_index"].keys()
+            ):
+                folio._build_label_tries()
             else:
-                self.alt_label_to_index[owl_class.preferred_label].append(index)
+                folio._label_trie = current["_label_trie"]
+                folio._lowercase_label_trie = current["_lowercase_label_trie"]
+                folio._lowercase_to_original = current["_lowercase_to_original"]
+
+            # relabel the class hierarchy only if its edges changed
+            if edges_changed:
+                folio.class_adjacency = folio._build_class_adjacency()
+                folio._class_hierarchy = folio._build_class_hierarchy()
+                folio._branch_membership = folio._build_branch_membership()
+                folio._class_facets = folio._build_class_facets()
+            else:
+                folio.class_adjacency = current["class_adjacency"]
+                folio._class_hierarchy = current["_class_hierarchy"]
+                folio._branch_membership = current["_branch_membership"]
+                folio._class_facets = current["_class_facets"].replace(
+                    {
+                        index: (
+                            bool(folio._state.get_class_value(index, "deprecated")),
+                            bool(folio._state.get_class_value(index, "parent_class_of")),
+                            folio._state.get_class_value(index, "country"),
+                        )
+                        for index in changed_indices
+                    }
+                )
 
-        # update the label index with alt labels
-        for alt_label in owl_class.alternative_labels:  # pylint: disable=not-an-iterable
-            if alt_label:
-                if alt_label not in self.alt_label_to_index:
-                    self.alt_label_to_index[alt_label] = [index]
-                else:
-                    self.alt_label_to_index[alt_label].append(index)
+            # reindex the text of the changed classes
+            num_classes = len(folio.classes)
+            folio._text_index = current["_text_index"].replace(
+                {
+                    index: [
+                        folio._state.get_class_value(index, field)
+                        for field in TEXT_FIELDS
+                    ]
+                    for index in changed_indices
+                    if index < num_classes
+                },
+                num_classes,
+            )
+            folio._update_search_corpora(current, changed_indices)
 
-    def parse_owl_object_property(self, node: lxml.etree._Element) -> None:
+            folio._class_fingerprints = class_fingerprints
+            folio._property_fingerprints = property_fingerprints
+            folio._source_digest = source_digest
+            self._set_state(folio._get_state())
+
+            LOGGER.info("Applied FOLIO ontology delta: %s", change_set)
+            return change_set
+
+    def iter_subgraph(
+        self,
+        iri: str,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        direction: Literal["children", "parents"] = "children",
+        breadth_first: bool = False,
+    ) -> Iterator[Tuple[OWLClass, int]]:
         """
-        Parse an OWL object property in the FOLIO ontology.
+        Lazily traverse the subgraph of the FOLIO ontology below (or above) an OWL class.
+
+        Each class is yielded once, with cycle protection; see get_subgraph() for the
+        traversal order.
 
         Args:
-            node (lxml.etree._Element): The node element.
+            iri (str): The IRI of the OWL class to start from.
+            max_depth (int): The maximum depth to traverse the graph; negative for no limit.
+            direction (Literal["children", "parents"]): Whether to traverse subclasses or
+                superclasses.
+            breadth_first (bool): Whether to traverse breadth-first instead of depth-first.
 
-        Returns:
-            None
+        Yields:
+            Tuple[OWLClass, int]: Each OWL class and the depth at which it was reached,
+                starting with the class itself at depth 0.
         """
-        # get the rdf:about
-        iri = node.attrib.get(self.get_ns_tag("rdf", "about"), None)
-        if iri is None:
-            LOGGER.info("Missing IRI for OWL object property: %s", node)
+        state = self._state
+        index = state.iri_to_index.get(self.normalize_iri(iri), None)
+        if index is None:
             return
 
-        # initialize the OWL object property
-        owl_property = OWLObjectProperty(iri=iri)
-
-        for child in node.getchildren():
-            if child.tag == self.get_ns_tag("rdfs", "label"):
-                # set label
-                owl_property.label = child.text
-
-                # add triple
-                self.triples.append((owl_property.iri, "rdfs:label", child.text))
-            elif child.tag == self.get_ns_tag("rdfs", "subPropertyOf"):
-                # set parent property
-                parent_property = child.attrib.get(
-                    self.get_ns_tag("rdf", "resource"), None
-                )
-                if parent_property:
-                    owl_property.sub_property_of.append(parent_property)
+        for class_index, depth in state.iter_class_indices(
+            index, max_depth=max_depth, direction=direction, breadth_first=breadth_first
+        ):
+            yield state.classes[class_index], depth
 
-                    # add triple
-                    self.triples.append(
-                        (owl_property.iri, "rdfs:subPropertyOf", parent_property)
-                    )
-            elif child.tag == self.get_ns_tag("rdfs", "domain"):
-                # set domain
-                domain = child.attrib.get(self.get_ns_tag("rdf", "resource"), None)
-                if domain:
-                    owl_property.domain.append(domain)
-
-                    # add triple
-                    self.triples.append((owl_property.iri, "rdfs:domain", domain))
-            elif child.tag == self.get_ns_tag("rdfs", "range"):
-                # set range
-                range_value = child.attrib.get(self.get_ns_tag("rdf", "resource"), None)
-                if range_value:
-                    owl_property.range.append(range_value)
-
-                    # add triple
-                    self.triples.append((owl_property.iri, "rdfs:range", range_value))
-            elif child.tag == self.get_ns_tag("owl", "inverseOf"):
-                # set inverse of
-                inverse_of = child.attrib.get(self.get_ns_tag("rdf", "resource"), None)
-                if inverse_of:
-                    owl_property.inverse_of = inverse_of
-
-                    # add triple
-                    self.triples.append((owl_property.iri, "owl:inverseOf", inverse_of))
-                elif child.text:
-                    # Some inverseOf elements have text content instead of resource attribute
-                    owl_property.inverse_of = child.text
-
-                    # add triple
-                    self.triples.append((owl_property.iri, "owl:inverseOf", child.text))
-            elif child.tag == self.get_ns_tag("skos", "prefLabel"):
-                # set preferred label
-                owl_property.preferred_label = child.text
-
-                # add triple
-                self.triples.append((owl_property.iri, "skos:prefLabel", child.text))
-            elif child.tag == self.get_ns_tag("skos", "altLabel"):
-                # set alternative label
-                owl_property.alternative_labels.append(child.text)
-
-                # add triple
-                self.triples.append((owl_property.iri, "skos:altLabel", child.text))
-            elif child.tag == self.get_ns_tag("skos", "definition"):
-                # set definition
-                owl_property.definition = child.text
-
-                # add triple
-                self.triples.append((owl_property.iri, "skos:definition", child.text))
-            elif child.tag == self.get_ns_tag("skos", "example"):
-                # add example
-                owl_property.examples.append(child.text)
-
-                # add triple
-                self.triples.append((owl_property.iri, "skos:example", child.text))
-            else:
-                LOGGER.debug("Unknown tag in ObjectProperty: %s", child.tag)
+    def get_subgraph(
+        self, iri: str, max_depth: int = DEFAULT_MAX_DEPTH
+    ) -> List[OWLClass]:
+        """
+        Get the subgraph of the FOLIO ontology below an OWL class.
 
-        # skip invalid properties
-        if not owl_property.is_valid():
-            LOGGER.info("Invalid OWL object property: %s", owl_property)
-            return
+        Classes are returned in depth-first pre-order, each once, even if they are reachable
+        through several parents.
 
-        # append and update indices
-        self.object_properties.append(owl_property)
+        Args:
+            iri (str): The IRI of the OWL class to start from.
+            max_depth (int): The maximum depth to traverse the graph.
 
-        # update the indices
-        index = len(self.object_properties) - 1
-        self.iri_to_property_index[owl_property.iri] = index
+        Returns:
+            List[OWLClass]: The subgraph of the FOLIO ontology, starting with the class itself.
+        """
+        return [owl_class for owl_class, _ in self.iter_subgraph(iri, max_depth)]
 
-        # update the property label index
-        if owl_property.label:
-            if owl_property.label not in self.property_label_to_index:
-                self.property_label_to_index[owl_property.label] = [index]
-            else:
-                self.property_label_to_index[owl_property.label].append(index)
+    def get_children(
+        self, iri: str, max_depth: int = DEFAULT_MAX_DEPTH
+    ) -> List[OWLClass]:
+        """
+        Get the children of an OWL class in the FOLIO ontology.
 
-        # update the property label index with preferred label
-        if owl_property.preferred_label:
-            if owl_property.preferred_label not in self.property_label_to_index:
-                self.property_label_to_index[owl_property.preferred_label] = [index]
-            else:
-                self.property_label_to_index[owl_property.preferred_label].append(index)
+        Args:
+            iri (str): The IRI of the OWL class to start from.
+            max_depth (int): The maximum depth to traverse the graph.
 
-            # Add an edge triple for every domain/range pair to support graph traversal
-            for domain in owl_property.domain:
-                for range_val in owl_property.range:
-                    # This creates a triple that can be used to infer edges between IRIs
-                    # Format: (domain_class, property_label, range_class)
-                    edge_triple = (domain, owl_property.label, range_val)
-                    if edge_triple not in self.triples:
-                        self.triples.append(edge_triple)
+        Returns:
+            List[OWLClass]: The children of the OWL class.
+        """
+        return [
+            owl_class
+            for owl_class, depth in self.iter_subgraph(iri, max_depth)
+            if depth > 0
+        ]
 
-    def parse_owl_ontology(self, node: lxml.etree._Element) -> None:
+    def get_parents(
+        self, iri: str, max_depth: int = DEFAULT_MAX_DEPTH
+    ) -> List[OWLClass]:
         """
-        Parse an OWL ontology in the FOLIO ontology.
+        Get the parents of an OWL class in the FOLIO ontology.
 
         Args:
-            node (lxml.etree._Element): The node element.
+            iri (str): The IRI of the OWL class to start from.
+            max_depth (int): The maximum depth to traverse the graph.
 
         Returns:
-            None
+            List[OWLClass]: The class itself followed by its parents, each once.
         """
-        for child in node.getchildren():
-            if child.tag == self.get_ns_tag("dc", "title"):
-                self.title = child.text
-            elif child.tag == self.get_ns_tag("dc", "description"):
-                self.description = child.text
+        return [
+            owl_class
+            for owl_class, _ in self.iter_subgraph(iri, max_depth, direction="parents")
+        ]
 
-    def parse_node(self, node: lxml.etree._Element) -> None:
+    def is_descendant(self, iri: str, ancestor_iri: str) -> bool:
         """
-        Parse a node in the FOLIO ontology.
+        Check if an OWL class is a descendant (transitive subclass) of another OWL class.
 
-        Switch on these types:
-            - owl:Class
-            - owl:ObjectProperty
-            - owl:DatatypeProperty
-            - owl:AnnotationProperty
-            - owl:NamedIndividual
-            - owl:Ontology
-            - rdf:Description
+        Uses the precomputed interval labeling of the class hierarchy, so the check does not
+        traverse the graph.
 
         Args:
-            node (lxml.etree._Element): The node element.
+            iri (str): The IRI of the OWL class.
+            ancestor_iri (str): The IRI of the ancestor OWL class.
 
         Returns:
-            None
+            bool: True if the class is a descendant of the ancestor, False otherwise, including
+                when either class is not found or both IRIs refer to the same class.
         """
-        if node.tag == self.get_ns_tag("owl", "Class"):
-            self.parse_owl_class(node)
-        elif node.tag == self.get_ns_tag("owl", "Ontology"):
-            self.parse_owl_ontology(node)
-        elif node.tag == self.get_ns_tag("owl", "ObjectProperty"):
-            self.parse_owl_object_property(node)
-        elif node.tag == self.get_ns_tag("owl", "DatatypeProperty"):
-            # TODO: parse datatype property
-            pass
-        elif node.tag == self.get_ns_tag("owl", "AnnotationProperty"):
-            # TODO: parse annotation property
-            pass
-        elif node.tag == self.get_ns_tag("owl", "NamedIndividual"):
-            # TODO: parse named individual
-            pass
-        elif node.tag == self.get_ns_tag("rdf", "Description"):
-            # TODO: parse rdf description
-            pass
-        else:
-            LOGGER.debug("Unknown node type: %s", node.tag)
+        state = self._state
+        index = state.iri_to_index.get(self.normalize_iri(iri), None)
+        ancestor_index = state.iri_to_index.get(self.normalize_iri(ancestor_iri), None)
+        if index is None or ancestor_index is None:
+            return False
+
+        return state._class_hierarchy.is_descendant(index, ancestor_index)
 
-    def parse_owl(self, buffer: str) -> None:
+    def _find_common_ancestors(
+        self, state: OntologyState, pairs: Iterable[Tuple[str, str]], lowest: bool
+    ) -> Iterator[Optional[Tuple[int, Ancestors, Ancestors]]]:
         """
-        Parse the FOLIO ontology in OWL format.
+        Find a common ancestor of each pair of OWL classes, reusing the ancestors of classes
+        that appear in several pairs.
 
         Args:
-            buffer (str): The raw ontology buffer.
+            state (OntologyState): The ontology state to search.
+            pairs (Iterable[Tuple[str, str]]): The pairs of OWL class IRIs.
+            lowest (bool): Whether to find the deepest or the nearest common ancestor.
 
-        Returns:
-            lxml.etree.ElementTree: The parsed ontology tree.
+        Yields:
+            Optional[Tuple[int, Ancestors, Ancestors]]: The
+                common ancestor class index and the ancestors of both classes, or None if
+                either class is not found or they have no common ancestor.
         """
-        # initialize the parser
-        self.parser = lxml.etree.XMLParser(
-            encoding="utf-8", remove_comments=True, ns_clean=True
-        )
+        ancestors_cache: Dict[int, Ancestors] = {}
 
-        # parse the buffer into a tree
-        self.tree = lxml.etree.fromstring(buffer, parser=self.parser)
+        def get_ancestors(iri: str) -> Optional[Ancestors]:
+            index = state.iri_to_index.get(self.normalize_iri(iri), None)
+            if index is None:
+                return None
+            if index not in ancestors_cache:
+                ancestors_cache[index] = state.class_adjacency.get_ancestors(index)
+            return ancestors_cache[index]
+
+        for iri, other_iri in pairs:
+            ancestors = get_ancestors(iri)
+            other_ancestors = get_ancestors(other_iri)
+            if ancestors is None or other_ancestors is None:
+                yield None
+                continue
 
-        # parse node types
-        for node in self.tree.iterchildren():
-            self.parse_node(node)
+            ancestor_index = state._class_hierarchy.find_common_ancestor(
+                ancestors, other_ancestors, lowest=lowest
+            )
+            if ancestor_index is None:
+                yield None
+            else:
+                yield ancestor_index, ancestors, other_ancestors
 
-        # build the class edges
-        for owl_class in self.classes:
-            for parent_class in owl_class.sub_class_of:
-                # skip owl thing
-                if parent_class == OWL_THING:
-                    continue
+    def get_lowest_common_ancestor(
+        self, iri: str, other_iri: str
+    ) -> Optional[OWLClass]:
+        """
+        Get the lowest common ancestor of two OWL classes.
 
-                # add forward edge
-                if parent_class not in self.class_edges:
-                    self.class_edges[parent_class] = []
-                self.class_edges[parent_class].append(owl_class.iri)
+        The lowest common ancestor is the deepest class that both classes are, or descend
+        from; ties between classes of equal depth are broken by the total distance from both
+        classes.
 
-                # add reverse edge to the parent class
-                if parent_class in self:
-                    self[parent_class].parent_class_of.append(owl_class.iri)  # type: ignore
-                else:
-                    LOGGER.warning("Parent class not found: %s", parent_class)
+        Args:
+            iri (str): The IRI of the first OWL class.
+            other_iri (str): The IRI of the second OWL class.
 
-        # freeze triple tuples
-        self._cached_triples = tuple(self.triples)
+        Returns:
+            Optional[OWLClass]: The lowest common ancestor, or None if either class is not
+                found or they have no common ancestor.
+        """
+        return self.get_lowest_common_ancestors([(iri, other_iri)])[0]
 
-        # clear prefix caches (fixes staleness on refresh())
-        self._prefix_cache = {}
-        self._ci_prefix_cache = {}
+    def get_lowest_common_ancestors(
+        self, pairs: Iterable[Tuple[str, str]]
+    ) -> List[Optional[OWLClass]]:
+        """
+        Get the lowest common ancestor of each pair of OWL classes.
 
-        # now create the Trie for the labels in label_to_index and alt_label_to_index
-        if marisa_trie is not None:
-            all_labels = [
-                label
-                for label in list(self.label_to_index.keys())
-                + list(self.alt_label_to_index.keys())
-                if len(label) >= MIN_PREFIX_LENGTH
-            ]
-            self._label_trie = marisa_trie.Trie(all_labels)
+        Args:
+            pairs (Iterable[Tuple[str, str]]): The pairs of OWL class IRIs.
 
-            # build lowercase-to-original bridge dict and lowercase trie
-            self._lowercase_to_original = {}
-            for label in all_labels:
-                folded = label.casefold()
-                if folded not in self._lowercase_to_original:
-                    self._lowercase_to_original[folded] = []
-                self._lowercase_to_original[folded].append(label)
-            self._lowercase_label_trie = marisa_trie.Trie(
-                list(self._lowercase_to_original.keys())
-            )
+        Returns:
+            List[Optional[OWLClass]]: The lowest common ancestor of each pair, in pair order;
+                see get_lowest_common_ancestor().
+        """
+        state = self._state
+        return [
+            None if result is None else state.classes[result[0]]
+            for result in self._find_common_ancestors(state, pairs, lowest=True)
+        ]
 
-    def get_subgraph(
-        self, iri: str, max_depth: int = DEFAULT_MAX_DEPTH
-    ) -> List[OWLClass]:
+    def get_shortest_path(self, iri: str, other_iri: str) -> List[OWLClass]:
         """
-        Recursive function to get the subgraph of the FOLIO ontology.
+        Get the shortest taxonomic path between two OWL classes, going up from the first
+        class to their nearest common ancestor and down to the second class.
 
         Args:
-            iri (str): The IRI of the OWL class to start from.
-            max_depth (int): The maximum depth to traverse the graph.
+            iri (str): The IRI of the first OWL class.
+            other_iri (str): The IRI of the second OWL class.
 
         Returns:
-            List[OWLClass]: The subgraph of the FOLIO ontology.
+            List[OWLClass]: The classes on the path, from the first class to the second,
+                inclusive; empty if either class is not found or they have no common ancestor.
         """
-        # get the index of the class
-        index = self.iri_to_index.get(self.normalize_iri(iri), None)
-        if index is None:
-            return []
+        return self.get_shortest_paths([(iri, other_iri)])[0]
 
-        # get the class
-        owl_class = self.classes[index]
+    def get_shortest_paths(
+        self, pairs: Iterable[Tuple[str, str]]
+    ) -> List[List[OWLClass]]:
+        """
+        Get the shortest taxonomic path between each pair of OWL classes.
 
-        # initialize the subgraph
-        subgraph = [owl_class]
+        Args:
+            pairs (Iterable[Tuple[str, str]]): The pairs of OWL class IRIs.
 
-        # traverse the graph
-        if max_depth != 0:
-            for child_class in owl_class.parent_class_of:
-                subgraph.extend(self.get_subgraph(child_class, max_depth - 1))
+        Returns:
+            List[List[OWLClass]]: The path for each pair, in pair order; see
+                get_shortest_path().
+        """
+        state = self._state
+        paths: List[List[OWLClass]] = []
+        for result in self._find_common_ancestors(state, pairs, lowest=False):
+            if result is None:
+                paths.append([])
+                continue
 
-        return subgraph
+            ancestor_index, ancestors, other_ancestors = result
+            path = trace_ancestor_path(ancestors, ancestor_index)
+            other_path = trace_ancestor_path(other_ancestors, ancestor_index)
+            path.extend(reversed(other_path[:-1]))
+            paths.append([state.classes[index] for index in path])
+        return paths
 
-    def get_children(
-        self, iri: str, max_depth: int = DEFAULT_MAX_DEPTH
+    def get_folio_branch(
+        self, folio_type: FOLIOTypes, max_depth: int = DEFAULT_MAX_DEPTH
     ) -> List[OWLClass]:
         """
-        Get the children of an OWL class in the FOLIO ontology.
+        Get the classes in a FOLIO branch, in the same order as get_children() on its root.
+
+        Members are served from the precomputed branch membership for the default depths and
+        for no depth limit, and traversed otherwise.
 
         Args:
-            iri (str): The IRI of the OWL class to start from.
-            max_depth (int): The maximum depth to traverse the graph.
+            folio_type (FOLIOTypes): The FOLIO branch.
+            max_depth (int): The maximum depth to traverse the graph; negative for no limit.
 
         Returns:
-            List[OWLClass]: The children of the OWL class.
+            List[OWLClass]: The classes in the branch, excluding its root.
         """
-        return [
-            child for child in self.get_subgraph(iri, max_depth) if child != self[iri]
-        ]
+        state = self._state
+        members = state._branch_membership.get_members(folio_type.name, max_depth)
+        if members is None:
+            return self.get_children(FOLIO_TYPE_IRIS[folio_type], max_depth=max_depth)
+        return [state.classes[index] for index in members]
 
-    def get_parents(
-        self, iri: str, max_depth: int = DEFAULT_MAX_DEPTH
-    ) -> List[OWLClass]:
+    def get_class_branches(self, iri: str) -> List[FOLIOTypes]:
         """
-        Get the parents of an OWL class in the FOLIO ontology.
+        Get the FOLIO branches an OWL class belongs to at any depth.
 
         Args:
-            iri (str): The IRI of the OWL class to start from.
-            max_depth (int): The maximum depth to traverse the graph.
+            iri (str): The IRI of the OWL class.
 
         Returns:
-            List[OWLClass]: The parents of the OWL class.
+            List[FOLIOTypes]: The branches, in FOLIOTypes order; empty if the class is not
+                found or is not in any branch.
         """
-        # get the index of the class
-        index = self.iri_to_index.get(self.normalize_iri(iri), None)
+        state = self._state
+        index = state.iri_to_index.get(self.normalize_iri(iri), None)
         if index is None:
             return []
 
-        # get the class
-        owl_class = self.classes[index]
-
-        # initialize the subgraph
-        subgraph = [owl_class]
-
-        # traverse the graph backwards
-        if max_depth != 0:
-            for parent_class in owl_class.sub_class_of:
-                subgraph.extend(self.get_parents(parent_class, max_depth - 1))
-
-        return subgraph
+        return [
+            FOLIOTypes[name] for name in state._branch_membership.get_branches(index)
+        ]
 
     @staticmethod
     @cache
@@ -1187,7 +4154,7 @@ class FOLIO:
         Returns:
             bool: True if the OWL class is in the ontology, False otherwise.
         """
-        return self.normalize_iri(item) in self.iri_to_index
+        return self.normalize_iri(item) in self._state.iri_to_index
 
     def __getitem__(self, item: str | int) -> Optional[OWLClass]:
         """
@@ -1199,15 +4166,16 @@ class FOLIO:
         Returns:
             OWLClass | None: The OWL class, or None if the class is not found.
         """
+        state = self._state
         if isinstance(item, int):
             try:
-                return self.classes[item]
+                return state.classes[item]
             except IndexError:
                 return None
         elif isinstance(item, str):
-            index = self.iri_to_index.get(self.normalize_iri(item), None)
+            index = state.iri_to_index.get(self.normalize_iri(item), None)
             if index is not None:
-                return self.classes[index]
+                return state.classes[index]
             return None
         else:
             raise TypeError("Invalid item type. Must be str or int.")
@@ -1222,15 +4190,16 @@ class FOLIO:
         Returns:
             OWLObjectProperty | None: The OWL object property, or None if not found.
         """
+        state = self._state
         if isinstance(item, int):
             try:
-                return self.object_properties[item]
+                return state.object_properties[item]
             except IndexError:
                 return None
         elif isinstance(item, str):
-            index = self.iri_to_property_index.get(self.normalize_iri(item), None)
+            index = state.iri_to_property_index.get(self.normalize_iri(item), None)
             if index is not None:
-                return self.object_properties[index]
+                return state.object_properties[index]
             return None
         else:
             raise TypeError("Invalid item type. Must be str or int.")
@@ -1248,10 +4217,11 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of OWL classes with the given label.
         """
-        classes = [self[index] for index in self.label_to_index.get(label, [])]
+        state = self._state
+        classes = [state.classes[index] for index in state.label_to_index.get(label, [])]
         if include_alt_labels:
             classes.extend(
-                [self[index] for index in self.alt_label_to_index.get(label, [])]
+                state.classes[index] for index in state.alt_label_to_index.get(label, [])
             )
 
         return classes  # type: ignore
@@ -1266,9 +4236,10 @@ class FOLIO:
         Returns:
             List[OWLObjectProperty]: The list of OWL object properties with the given label.
         """
+        state = self._state
         properties = [
-            self.object_properties[index]
-            for index in self.property_label_to_index.get(label, [])
+            state.object_properties[index]
+            for index in state.property_label_to_index.get(label, [])
         ]
         return properties
 
@@ -1285,52 +4256,263 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of OWL classes with the given alternative label.
         """
-        classes = [self[index] for index in self.alt_label_to_index.get(alt_label, [])]
+        state = self._state
+        classes = [
+            state.classes[index] for index in state.alt_label_to_index.get(alt_label, [])
+        ]
         if include_hidden_labels:
             classes.extend(
-                [self[index] for index in self.label_to_index.get(alt_label, [])]
+                state.classes[index] for index in state.label_to_index.get(alt_label, [])
             )
 
         return classes  # type: ignore
 
-    def refresh(self) -> None:
+    def refresh(self, conditional: bool = False) -> bool:
         """
         Refresh the FOLIO ontology.
 
+        The new ontology is downloaded and parsed into a separate state, which is swapped in
+        atomically once complete, so concurrent readers keep using the current ontology for the
+        whole reload.  Concurrent refreshes of the same instance are serialized.
+
+        Args:
+            conditional (bool): If True and caching is enabled, revalidate the cached ontology with a
+                conditional request (ETag, Last-Modified, or GitHub commit SHA) and only reload and
+                reparse it if the source has changed.
+
+        Returns:
+            bool: True if the ontology was reloaded, False if it was unchanged.
+        """
+        with self._refresh_lock:
+            start_time = time.time()
+            if conditional and self.use_cache:
+                # revalidate the cached ontology
+                LOGGER.info("Revalidating FOLIO ontology...")
+                owl_buffer = FOLIO.load_owl_if_modified(
+                    cache_path=self.cache_path,
+                    source_type=self.source_type,
+                    http_url=self.http_url,
+                    github_repo_owner=self.github_repo_owner,
+                    github_repo_name=self.github_repo_name,
+                    github_repo_branch=self.github_repo_branch,
+                )
+                if owl_buffer is None:
+                    LOGGER.info("FOLIO ontology is unchanged")
+                    return False
+            else:
+                # load the ontology
+                LOGGER.info("Refreshing FOLIO ontology with use_cache=False...")
+                owl_buffer, _ = FOLIO.fetch_owl(
+                    source_type=self.source_type,
+                    http_url=self.http_url,
+                    github_repo_owner=self.github_repo_owner,
+                    github_repo_name=self.github_repo_name,
+                    github_repo_branch=self.github_repo_branch,
+                )
+            end_time = time.time()
+            LOGGER.info(
+                "Refreshed FOLIO ontology in %.2f seconds", end_time - start_time
+            )
+
+            # parse the ontology and swap in the new state
+            LOGGER.info("Parsing FOLIO ontology...")
+            start_time = time.time()
+            self._set_state(
+                FOLIO._parse_owl_state(
+                    owl_buffer, self.streaming, self.parse_workers, self.lazy_classes
+                )
+            )
+            end_time = time.time()
+            LOGGER.info("Parsed FOLIO ontology in %.2f seconds", end_time - start_time)
+
+            # replace the snapshot if the cache file was updated
+            if conditional and self.use_cache and self.use_snapshot:
+                self._try_save_snapshot()
+
+            return True
+
+    def delta_refresh(self, conditional: bool = False) -> ChangeSet:
+        """
+        Refresh the FOLIO ontology, only reparsing and reindexing the classes and properties
+        that changed.  See parse_owl_delta for details.
+
+        Args:
+            conditional (bool): If True and caching is enabled, revalidate the cached ontology with a
+                conditional request and return an empty change set if the source is unchanged.
+
+        Returns:
+            ChangeSet: The IRIs of the added, removed, and modified classes and properties.
+        """
+        with self._refresh_lock:
+            if conditional and self.use_cache:
+                # revalidate the cached ontology
+                LOGGER.info("Revalidating FOLIO ontology...")
+                owl_buffer = FOLIO.load_owl_if_modified(
+                    cache_path=self.cache_path,
+                    source_type=self.source_type,
+                    http_url=self.http_url,
+                    github_repo_owner=self.github_repo_owner,
+                    github_repo_name=self.github_repo_name,
+                    github_repo_branch=self.github_repo_branch,
+                )
+                if owl_buffer is None:
+                    LOGGER.info("FOLIO ontology is unchanged")
+                    return ChangeSet()
+            else:
+                # load the ontology
+                LOGGER.info("Refreshing FOLIO ontology with use_cache=False...")
+                owl_buffer, _ = FOLIO.fetch_owl(
+                    source_type=self.source_type,
+                    http_url=self.http_url,
+                    github_repo_owner=self.github_repo_owner,
+                    github_repo_name=self.github_repo_name,
+                    github_repo_branch=self.github_repo_branch,
+                )
+
+            # apply the delta
+            start_time = time.time()
+            change_set = self.parse_owl_delta(owl_buffer)
+            end_time = time.time()
+            LOGGER.info(
+                "Applied FOLIO ontology delta in %.2f seconds", end_time - start_time
+            )
+
+            # replace the snapshot if the cache file was updated
+            if conditional and self.use_cache and self.use_snapshot:
+                self._try_save_snapshot()
+
+            return change_set
+
+    def start_auto_refresh(
+        self, interval: float, conditional: bool = True, delta: bool = False
+    ) -> None:
+        """
+        Start refreshing the FOLIO ontology on a background thread.
+
+        Each refresh builds the new ontology in the background and swaps it in atomically.
+        Errors are logged and the previous ontology is kept until the next attempt.
+
+        Args:
+            interval (float): The number of seconds between refreshes.
+            conditional (bool): Whether to revalidate the cached ontology with conditional
+                requests instead of downloading it every time.
+            delta (bool): Whether to use delta_refresh() to only reindex changed classes and
+                properties instead of reparsing the whole ontology.
+
         Returns:
             None
         """
-        # clear the ontology data structures
-        self.title = None
-        self.description = None
-        self.classes.clear()
-        self.iri_to_index.clear()
-        self.label_to_index.clear()
-        self.alt_label_to_index.clear()
-        self.class_edges.clear()
-        self.triples.clear()
-        self._cached_triples = ()
-
-        # load the ontology
-        LOGGER.info("Refreshing FOLIO ontology with use_cache=False...")
-        start_time = time.time()
-        owl_buffer = FOLIO.load_owl(
-            source_type=self.source_type,
-            http_url=self.http_url,
-            github_repo_owner=self.github_repo_owner,
-            github_repo_name=self.github_repo_name,
-            github_repo_branch=self.github_repo_branch,
-            use_cache=False,
+        if interval <= 0:
+            raise ValueError("Refresh interval must be positive.")
+
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            raise RuntimeError("Auto refresh is already running.")
+
+        def refresh_loop() -> None:
+            while not self._refresh_stop.wait(interval):
+                try:
+                    if delta:
+                        self.delta_refresh(conditional=conditional)
+                    else:
+                        self.refresh(conditional=conditional)
+                except Exception:  # pylint: disable=broad-except
+                    LOGGER.warning(
+                        "Failed to refresh FOLIO ontology: %s", traceback.format_exc()
+                    )
+
+        self._refresh_stop = threading.Event()
+        self._refresh_thread = threading.Thread(
+            target=refresh_loop, name="folio-refresh", daemon=True
         )
+        self._refresh_thread.start()
+        LOGGER.info("Started FOLIO auto refresh every %.2f seconds", interval)
+
+    def stop_auto_refresh(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop refreshing the FOLIO ontology on a background thread.
+
+        Args:
+            timeout (Optional[float]): The number of seconds to wait for an in-progress refresh
+                to finish; waits indefinitely if None.
+
+        Returns:
+            None
+        """
+        self._refresh_stop.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout)
+            self._refresh_thread = None
+        LOGGER.info("Stopped FOLIO auto refresh")
+
+    async def arefresh(
+        self, conditional: bool = False, executor: Optional[Executor] = None
+    ) -> bool:
+        """
+        Asynchronously refresh the FOLIO ontology without blocking the event loop.
+
+        The new ontology is parsed into a separate state in an executor and swapped in once
+        parsing is complete, so the current ontology remains usable until then. If another
+        refresh starts and publishes its state in the meantime, this refresh is discarded.
+
+        Args:
+            conditional (bool): If True and caching is enabled, revalidate the cached ontology with a
+                conditional request and only reload and reparse it if the source has changed.
+            executor (Optional[Executor]): The executor used to parse the ontology; defaults to the
+                event loop's default thread pool.
+
+        Returns:
+            bool: True if the ontology was reloaded, False if it was unchanged or superseded.
+        """
+        generation = self._begin_refresh()
+        start_time = time.time()
+        if conditional and self.use_cache:
+            # revalidate the cached ontology
+            LOGGER.info("Revalidating FOLIO ontology...")
+            owl_buffer = await FOLIO.aload_owl_if_modified(
+                cache_path=self.cache_path,
+                source_type=self.source_type,
+                http_url=self.http_url,
+                github_repo_owner=self.github_repo_owner,
+                github_repo_name=self.github_repo_name,
+                github_repo_branch=self.github_repo_branch,
+            )
+            if owl_buffer is None:
+                LOGGER.info("FOLIO ontology is unchanged")
+                return False
+        else:
+            # load the ontology
+            LOGGER.info("Refreshing FOLIO ontology with use_cache=False...")
+            owl_buffer, _ = await FOLIO.afetch_owl(
+                source_type=self.source_type,
+                http_url=self.http_url,
+                github_repo_owner=self.github_repo_owner,
+                github_repo_name=self.github_repo_name,
+                github_repo_branch=self.github_repo_branch,
+            )
         end_time = time.time()
         LOGGER.info("Refreshed FOLIO ontology in %.2f seconds", end_time - start_time)
 
-        # parse the ontology
+        # parse the ontology and swap in the new state
         LOGGER.info("Parsing FOLIO ontology...")
         start_time = time.time()
-        self.parse_owl(owl_buffer)
+        state = await FOLIO._aparse_owl_state(
+            owl_buffer,
+            executor,
+            self.streaming,
+            self.parse_workers,
+            self.lazy_classes,
+        )
         end_time = time.time()
         LOGGER.info("Parsed FOLIO ontology in %.2f seconds", end_time - start_time)
+        if not self._set_state(state, generation):
+            LOGGER.info("FOLIO refresh was superseded by a newer refresh")
+            return False
+
+        # replace the snapshot if the cache file was updated
+        if conditional and self.use_cache and self.use_snapshot:
+            await asyncio.to_thread(self._try_save_snapshot)
+
+        return True
 
     def search_by_prefix(
         self, prefix: str, case_sensitive: bool = False
@@ -1354,53 +4536,57 @@ class FOLIO:
 
     def _search_by_prefix_sensitive(self, prefix: str) -> List[OWLClass]:
         """Case-sensitive prefix search (original behavior)."""
-        if prefix in self._prefix_cache:
-            return self._prefix_cache[prefix]
+        state = self._state
+        prefix_cache = state._prefix_cache
+        if prefix in prefix_cache:
+            return prefix_cache[prefix]
 
         # sort: primary-label keys first (False < True), then by length
         if marisa_trie is not None:
             keys = sorted(
-                self._label_trie.keys(prefix),  # type: ignore[union-attr]
-                key=lambda k: (k not in self.label_to_index, len(k)),
+                state._label_trie.keys(prefix),  # type: ignore[union-attr]
+                key=lambda k: (k not in state.label_to_index, len(k)),
             )
         else:
             keys = sorted(
                 [
                     label
-                    for label in list(self.label_to_index.keys())
-                    + list(self.alt_label_to_index.keys())
+                    for label in list(state.label_to_index.keys())
+                    + list(state.alt_label_to_index.keys())
                     if label.startswith(prefix)
                 ],
-                key=lambda k: (k not in self.label_to_index, len(k)),
+                key=lambda k: (k not in state.label_to_index, len(k)),
             )
 
         # deduplicate by class index, label_to_index checked before alt_label_to_index
         seen: set = set()
         iri_list: list = []
         for key in keys:
-            for idx in self.label_to_index.get(key, []):  # type: ignore[arg-type]
+            for idx in state.label_to_index.get(key, []):  # type: ignore[arg-type]
                 if idx not in seen:
                     seen.add(idx)
                     iri_list.append(idx)
-            for idx in self.alt_label_to_index.get(key, []):  # type: ignore[arg-type]
+            for idx in state.alt_label_to_index.get(key, []):  # type: ignore[arg-type]
                 if idx not in seen:
                     seen.add(idx)
                     iri_list.append(idx)
 
-        classes = [self[index] for index in iri_list]
-        self._prefix_cache[prefix] = classes  # type: ignore[assignment]
+        classes = [state.classes[index] for index in iri_list]
+        prefix_cache[prefix] = classes  # type: ignore[assignment]
         return classes
 
     def _search_by_prefix_insensitive(self, prefix: str) -> List[OWLClass]:
         """Case-insensitive prefix search via parallel lowercase trie."""
+        state = self._state
         folded = prefix.casefold()
 
-        if folded in self._ci_prefix_cache:
-            return self._ci_prefix_cache[folded]
+        prefix_cache = state._ci_prefix_cache
+        if folded in prefix_cache:
+            return prefix_cache[folded]
 
-        if marisa_trie is not None and self._lowercase_label_trie is not None:
+        if marisa_trie is not None and state._lowercase_label_trie is not None:
             lowercase_keys = sorted(
-                self._lowercase_label_trie.keys(folded),  # type: ignore[union-attr]
+                state._lowercase_label_trie.keys(folded),  # type: ignore[union-attr]
                 key=len,
             )
             # resolve lowercase keys back to original-case labels;
@@ -1409,9 +4595,9 @@ class FOLIO:
                 [
                     orig
                     for lk in lowercase_keys
-                    for orig in self._lowercase_to_original.get(lk, [])
+                    for orig in state._lowercase_to_original.get(lk, [])
                 ],
-                key=lambda k: (k not in self.label_to_index, len(k)),
+                key=lambda k: (k not in state.label_to_index, len(k)),
             )
         else:
             # pure-Python fallback: case-insensitive prefix match
@@ -1419,64 +4605,68 @@ class FOLIO:
             original_keys = sorted(
                 [
                     label
-                    for label in list(self.label_to_index.keys())
-                    + list(self.alt_label_to_index.keys())
+                    for label in list(state.label_to_index.keys())
+                    + list(state.alt_label_to_index.keys())
                     if label.casefold().startswith(folded)
                 ],
-                key=lambda k: (k not in self.label_to_index, len(k)),
+                key=lambda k: (k not in state.label_to_index, len(k)),
             )
 
         # resolve to OWLClass with deduplication by index
         seen: set = set()
         iri_list: list = []
         for key in original_keys:
-            for idx in self.label_to_index.get(key, []):  # type: ignore[arg-type]
+            for idx in state.label_to_index.get(key, []):  # type: ignore[arg-type]
                 if idx not in seen:
                     seen.add(idx)
                     iri_list.append(idx)
-            for idx in self.alt_label_to_index.get(key, []):  # type: ignore[arg-type]
+            for idx in state.alt_label_to_index.get(key, []):  # type: ignore[arg-type]
                 if idx not in seen:
                     seen.add(idx)
                     iri_list.append(idx)
 
-        classes = [self[index] for index in iri_list]
-        self._ci_prefix_cache[folded] = classes  # type: ignore[assignment]
+        classes = [state.classes[index] for index in iri_list]
+        prefix_cache[folded] = classes  # type: ignore[assignment]
         return classes
 
     @staticmethod
-    @cache
     def _basic_search(
         query: str,
-        search_list: Tuple[str],
+        corpus: SearchCorpus,
         limit: int = 10,
         search_type: Literal["string", "token"] = "string",
-    ) -> List[Tuple[str, int | float, int]]:
+    ) -> List[Tuple[Any, int | float]]:
         """
-        Basic search function using rapidfuzz.
+        Basic search function using rapidfuzz over a preprocessed corpus.
 
         Args:
             query (str): The search query.
-            search_list (List[str]): The list of strings to search.
+            corpus (SearchCorpus): The corpus to search.
             limit (int): The maximum number of results to return.
             search_type (str): The type of search to perform. Either "string" or "token".
 
         Returns:
-            List[Tuple[str, int | float, int]]: The list of search results with
-                the string, the search score, and the index.
-        """
-        return sorted(
-            rapidfuzz.process.extract(  # type: ignore
-                query,
-                search_list,
-                scorer=rapidfuzz.fuzz.WRatio
-                if search_type == "string"
-                else rapidfuzz.fuzz.partial_token_set_ratio,
-                processor=rapidfuzz.utils.default_process,
-                limit=limit,
-            ),
-            # sort first by score, then by length of text
-            key=lambda x: (-x[1], len(x[0])),
+            List[Tuple[Any, int | float]]: The list of search results with
+                the corpus key and the search score.
+        """
+        # the corpus is preprocessed, so only the query needs default_process
+        results = rapidfuzz.process.extract(  # type: ignore
+            rapidfuzz.utils.default_process(query),
+            corpus.choices,
+            scorer=rapidfuzz.fuzz.WRatio
+            if search_type == "string"
+            else rapidfuzz.fuzz.partial_token_set_ratio,
+            processor=None,
+            limit=limit,
         )
+        return [
+            (corpus.keys[position], score)
+            for _, score, position in sorted(
+                results,
+                # sort first by score, then by length of text
+                key=lambda x: (-x[1], corpus.lengths[x[2]]),
+            )
+        ]
 
     def search_by_label(
         self, label: str, include_alt_labels: bool = True, limit: int = 10
@@ -1499,24 +4689,26 @@ class FOLIO:
                 "search extra must be installed to use search functions: pip install folio-python[search]"
             )
 
-        # get search labels
-        if not include_alt_labels:
-            search_labels = tuple(self.label_to_index.keys())
-        else:
-            search_labels = tuple(
-                list(self.label_to_index.keys()) + list(self.alt_label_to_index.keys())
-            )
+        # get the preprocessed search labels
+        state = self._state
+        search_corpus = (
+            state._all_label_search_corpus
+            if include_alt_labels
+            else state._label_search_corpus
+        )
 
         # use basic rapidfuzz convenience function for this
         results = []
         seen_classes = set()
-        for search_label, score, _ in self._basic_search(
-            label, search_labels, limit=limit, search_type="string"
+        for search_label, score in self._basic_search(
+            label, search_corpus, limit=limit, search_type="string"
         ):
-            label_classes = self.get_by_label(
-                search_label, include_alt_labels=include_alt_labels
-            )
-            for label_class in label_classes:
+            label_indices = state.label_to_index.get(search_label, [])
+            if include_alt_labels:
+                label_indices = label_indices + state.alt_label_to_index.get(
+                    search_label, []
+                )
+            for label_class in (state.classes[index] for index in label_indices):
                 if label_class.iri not in seen_classes:
                     seen_classes.add(label_class.iri)
                     results.append((label_class, score))
@@ -1546,21 +4738,13 @@ class FOLIO:
                 "search extra must be installed to use search functions: pip install folio-python[search]"
             )
 
-        # get definitions to search with zip pattern
-        class_index, class_definitions = zip(
-            *[
-                (i, c.definition)
-                for i, c in enumerate(self.classes)
-                if c.definition is not None
-            ]
-        )
-
         # use basic rapidfuzz convenience function for this
+        state = self._state
         results = []
-        for _, score, search_index in self._basic_search(
-            definition, class_definitions, limit=limit, search_type="token"
+        for class_index, score in self._basic_search(
+            definition, state._definition_search_corpus, limit=limit, search_type="token"
         ):
-            results.append((self.classes[class_index[search_index]], score))
+            results.append((state.classes[class_index], score))
             if len(results) >= limit:
                 break
 
@@ -1622,6 +4806,7 @@ class FOLIO:
             List[Tuple[OWLClass, int | float]]: The list of search results with
                 the OWL class and the search score.
         """
+        state = self._state
         # skip if we don't have llm
         if self.llm is None:
             raise RuntimeError(
@@ -1687,7 +4872,7 @@ class FOLIO:
             search_results = []
             for result in llm_results:
                 iri = result.get("iri", None)
-                if iri and iri not in seen_iris and iri in self.iri_to_index:
+                if iri and iri not in seen_iris and iri in state.iri_to_index:
                     seen_iris.add(iri)
                     if include_reason:
                         search_results.append(
@@ -1777,7 +4962,7 @@ class FOLIO:
         Returns:
             List[OWLObjectProperty]: A list of all OWL object properties.
         """
-        return self.object_properties.copy()
+        return self._state.object_properties.copy()
 
     def __len__(self) -> int:
         """
@@ -1786,7 +4971,7 @@ class FOLIO:
         Returns:
             int: The number of classes in the FOLIO ontology.
         """
-        return len(self.classes)
+        return len(self._state.classes)
 
     def __str__(self) -> str:
         """
@@ -1810,9 +4995,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of player actors.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.ACTOR_PLAYER], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.ACTOR_PLAYER, max_depth=max_depth)
 
     def get_areas_of_law(self, max_depth: int = DEFAULT_MAX_DEPTH) -> List[OWLClass]:
         """
@@ -1821,9 +5004,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of areas of law.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.AREA_OF_LAW], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.AREA_OF_LAW, max_depth=max_depth)
 
     def get_asset_types(self, max_depth: int = DEFAULT_MAX_DEPTH) -> List[OWLClass]:
         """
@@ -1832,9 +5013,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of asset types.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.ASSET_TYPE], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.ASSET_TYPE, max_depth=max_depth)
 
     def get_communication_modalities(
         self, max_depth: int = DEFAULT_MAX_DEPTH
@@ -1845,9 +5024,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of communication modalities.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.COMMUNICATION_MODALITY], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.COMMUNICATION_MODALITY, max_depth=max_depth)
 
     def get_folio_branches(
         self, max_depth: int = DEFAULT_MAX_DEPTH
@@ -1859,8 +5036,8 @@ class FOLIO:
             List[OWLClass]: The list of FOLIO branches.
         """
         return {
-            folio_type: self.get_children(folio_type_iri, max_depth=max_depth)
-            for folio_type, folio_type_iri in FOLIO_TYPE_IRIS.items()
+            folio_type: self.get_folio_branch(folio_type, max_depth=max_depth)
+            for folio_type in FOLIO_TYPE_IRIS
         }
 
     def get_currencies(self, max_depth: int = DEFAULT_MAX_DEPTH) -> List[OWLClass]:
@@ -1870,9 +5047,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of currencies.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.CURRENCY], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.CURRENCY, max_depth=max_depth)
 
     def get_data_formats(self, max_depth: int = DEFAULT_MAX_DEPTH) -> List[OWLClass]:
         """
@@ -1881,9 +5056,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of data formats.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.DATA_FORMAT], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.DATA_FORMAT, max_depth=max_depth)
 
     def get_document_artifacts(
         self, max_depth: int = DEFAULT_MAX_DEPTH
@@ -1894,9 +5067,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of document artifacts.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.DOCUMENT_ARTIFACT], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.DOCUMENT_ARTIFACT, max_depth=max_depth)
 
     def get_engagement_terms(
         self, max_depth: int = DEFAULT_MAX_DEPTH
@@ -1907,9 +5078,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of engagement terms.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.ENGAGEMENT_TERMS], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.ENGAGEMENT_TERMS, max_depth=max_depth)
 
     def get_events(self, max_depth: int = DEFAULT_MAX_DEPTH) -> List[OWLClass]:
         """
@@ -1918,7 +5087,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of events.
         """
-        return self.get_children(FOLIO_TYPE_IRIS[FOLIOTypes.EVENT], max_depth=max_depth)
+        return self.get_folio_branch(FOLIOTypes.EVENT, max_depth=max_depth)
 
     def get_forum_venues(self, max_depth: int = DEFAULT_MAX_DEPTH) -> List[OWLClass]:
         """
@@ -1927,9 +5096,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of forum venues.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.FORUMS_VENUES], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.FORUMS_VENUES, max_depth=max_depth)
 
     def get_governmental_bodies(
         self, max_depth: int = DEFAULT_MAX_DEPTH
@@ -1940,9 +5107,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of governmental bodies.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.GOVERNMENTAL_BODY], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.GOVERNMENTAL_BODY, max_depth=max_depth)
 
     def get_industries(self, max_depth: int = DEFAULT_MAX_DEPTH) -> List[OWLClass]:
         """
@@ -1951,9 +5116,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of industries.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.INDUSTRY], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.INDUSTRY, max_depth=max_depth)
 
     def get_languages(self, max_depth: int = DEFAULT_MAX_DEPTH) -> List[OWLClass]:
         """
@@ -1962,9 +5125,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of languages.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.LANGUAGE], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.LANGUAGE, max_depth=max_depth)
 
     def get_folio_types(self, max_depth: int = DEFAULT_MAX_DEPTH) -> List[OWLClass]:
         """
@@ -1973,9 +5134,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of FOLIO types.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.FOLIO_TYPE], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.FOLIO_TYPE, max_depth=max_depth)
 
     def get_legal_authorities(
         self, max_depth: int = DEFAULT_MAX_DEPTH
@@ -1986,9 +5145,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of legal authorities.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.LEGAL_AUTHORITIES], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.LEGAL_AUTHORITIES, max_depth=max_depth)
 
     def get_legal_entities(self, max_depth: int = DEFAULT_MAX_DEPTH) -> List[OWLClass]:
         """
@@ -1997,9 +5154,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of legal entities.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.LEGAL_ENTITY], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.LEGAL_ENTITY, max_depth=max_depth)
 
     def get_locations(self, max_depth: int = DEFAULT_MAX_DEPTH) -> List[OWLClass]:
         """
@@ -2008,9 +5163,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of locations.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.LOCATION], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.LOCATION, max_depth=max_depth)
 
     def get_matter_narratives(
         self, max_depth: int = DEFAULT_MAX_DEPTH
@@ -2021,9 +5174,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of matter narratives.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.MATTER_NARRATIVE], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.MATTER_NARRATIVE, max_depth=max_depth)
 
     def get_matter_narrative_formats(
         self, max_depth: int = DEFAULT_MAX_DEPTH
@@ -2034,9 +5185,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of matter narrative formats.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.MATTER_NARRATIVE_FORMAT], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.MATTER_NARRATIVE_FORMAT, max_depth=max_depth)
 
     def get_objectives(self, max_depth: int = DEFAULT_MAX_DEPTH) -> List[OWLClass]:
         """
@@ -2045,9 +5194,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of objectives.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.OBJECTIVES], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.OBJECTIVES, max_depth=max_depth)
 
     def get_services(self, max_depth: int = DEFAULT_MAX_DEPTH) -> List[OWLClass]:
         """
@@ -2056,9 +5203,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of services.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.SERVICE], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.SERVICE, max_depth=max_depth)
 
     def get_standards_compatibilities(
         self, max_depth: int = DEFAULT_MAX_DEPTH
@@ -2069,9 +5214,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of standards compatibilities.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.STANDARDS_COMPATIBILITY], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.STANDARDS_COMPATIBILITY, max_depth=max_depth)
 
     def get_statuses(self, max_depth: int = DEFAULT_MAX_DEPTH) -> List[OWLClass]:
         """
@@ -2080,9 +5223,7 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of statuses.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.STATUS], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.STATUS, max_depth=max_depth)
 
     def get_system_identifiers(
         self, max_depth: int = DEFAULT_MAX_DEPTH
@@ -2093,36 +5234,33 @@ class FOLIO:
         Returns:
             List[OWLClass]: The list of system identifiers.
         """
-        return self.get_children(
-            FOLIO_TYPE_IRIS[FOLIOTypes.SYSTEM_IDENTIFIERS], max_depth=max_depth
-        )
+        return self.get_folio_branch(FOLIOTypes.SYSTEM_IDENTIFIERS, max_depth=max_depth)
 
     @staticmethod
-    @cache
     def _filter_triples(
-        triples: Tuple[Tuple[str, str, str], ...],
+        triples: TripleStore,
         value: str,
         filter_by: str = "predicate",
     ) -> List[Tuple[str, str, str]]:
         """
-        Filter triples by predicate.
+        Filter triples by subject, predicate, or object.
 
         Args:
-            triples (Tuple[Tuple[str, str, str], ...]): The list of triples.
+            triples (TripleStore): The triples.
             value (str): The value to filter by.
-            predicate (str): The predicate to filter by.
+            filter_by (str): The position to filter on: "subject", "predicate", or "object".
 
         Returns:
             List[Tuple[str, str, str]]: The filtered list of triples.
         """
         if filter_by == "predicate":
-            return [triple for triple in triples if triple[1] == value]
+            return triples.find(predicate=value)
 
         if filter_by == "subject":
-            return [triple for triple in triples if triple[0] == value]
+            return triples.find(subject=value)
 
         if filter_by == "object":
-            return [triple for triple in triples if triple[2] == value]
+            return triples.find(obj=value)
 
         raise ValueError(
             "Invalid filter_by value. Must be 'predicate', 'subject', or 'object'."
@@ -2138,7 +5276,7 @@ class FOLIO:
         Returns:
             List[Tuple[str, str, str]]: The list of triples.
         """
-        return self._filter_triples(self._cached_triples, subject, filter_by="subject")
+        return self._filter_triples(self._state.triples, subject, filter_by="subject")
 
     def get_triples_by_predicate(self, predicate: str) -> List[Tuple[str, str, str]]:
         """
@@ -2150,9 +5288,7 @@ class FOLIO:
         Returns:
             List[Tuple[str, str, str]]: The list of triples.
         """
-        return self._filter_triples(
-            self._cached_triples, predicate, filter_by="predicate"
-        )
+        return self._filter_triples(self._state.triples, predicate, filter_by="predicate")
 
     def get_triples_by_object(self, obj: str) -> List[Tuple[str, str, str]]:
         """
@@ -2164,7 +5300,85 @@ class FOLIO:
         Returns:
             List[Tuple[str, str, str]]: The list of triples.
         """
-        return self._filter_triples(self._cached_triples, obj, filter_by="object")
+        return self._filter_triples(self._state.triples, obj, filter_by="object")
+
+    def match_triples(
+        self,
+        patterns: List[Tuple[str, str, str]],
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Match triple patterns with variables against the ontology triples.
+
+        Terms starting with "?" are variables shared across patterns; other terms are matched
+        exactly, as they appear in the triples (full IRIs for classes, prefixed names such as
+        "rdfs:subClassOf" for predicates).  For example, the subclasses of a class that also
+        refer to another class with rdfs:seeAlso:
+
+            folio.match_triples([
+                ("?class", "rdfs:subClassOf", parent_iri),
+                ("?class", "rdfs:seeAlso", see_also_iri),
+            ])
+
+        Args:
+            patterns (List[Tuple[str, str, str]]): The (subject, predicate, object) patterns.
+            limit (Optional[int]): The maximum number of solutions to return.
+
+        Returns:
+            List[Dict[str, str]]: The solutions, mapping each variable name (without the "?")
+                to its term.
+        """
+        return self._state.triples.match(patterns, limit=limit)
+
+    @staticmethod
+    def _score_fuzzy(
+        pattern: str, choices: Sequence[str], score_cutoff: float
+    ) -> Dict[int, float]:
+        """
+        Score a pattern against a corpus of strings in one batched rapidfuzz call.
+
+        Uses rapidfuzz.process.cdist on all cores when numpy is installed, and
+        rapidfuzz.process.extract otherwise.
+
+        Args:
+            pattern (str): The preprocessed pattern.
+            choices (Sequence[str]): The preprocessed strings to score.
+            score_cutoff (float): The minimum partial_ratio score of a match.
+
+        Returns:
+            Dict[int, float]: The score of each matching string, by position in choices.
+        """
+        if rapidfuzz is None:
+            raise RuntimeError("search extra required for fuzzy matching")
+        if not choices:
+            return {}
+
+        if numpy is not None:
+            scores = rapidfuzz.process.cdist(
+                [pattern],
+                choices,
+                scorer=rapidfuzz.fuzz.partial_ratio,
+                processor=None,
+                score_cutoff=score_cutoff,
+                dtype=numpy.float64,
+                workers=-1,
+            )[0]
+            return {
+                int(position): float(scores[position])
+                for position in numpy.flatnonzero(scores >= score_cutoff)
+            }
+
+        return {
+            position: score
+            for _, score, position in rapidfuzz.process.extract(
+                pattern,
+                choices,
+                scorer=rapidfuzz.fuzz.partial_ratio,
+                processor=None,
+                score_cutoff=score_cutoff,
+                limit=None,
+            )
+        }
 
     def query(
         self,
@@ -2180,7 +5394,9 @@ class FOLIO:
         country: Optional[str] = None,
         match_mode: str = "substring",
         limit: int = 20,
-    ) -> List[OWLClass]:
+        explain: bool = False,
+        score_cutoff: float = DEFAULT_FUZZY_SCORE_CUTOFF,
+    ) -> List[OWLClass] | QueryPlan:
         """
         Query classes with composable text and structural filters.
 
@@ -2201,38 +5417,23 @@ class FOLIO:
         Control:
             match_mode: "substring" (default), "exact", "regex", or "fuzzy".
             limit: Maximum results to return (default 20).
+            explain: If True, return a QueryPlan with the results, the candidate source
+                chosen by the planner, and the estimated and remaining candidates and time
+                of each stage.
+            score_cutoff: Minimum partial_ratio score of a fuzzy match (default 70).
+
+        Candidates are generated from whichever is estimated to be smaller: the classes
+        passing the structural filters, or the text index postings of the text patterns.
+        Fuzzy text filters instead score each pattern against the lowercase text of every
+        class in one batched rapidfuzz call per field.
 
         Returns:
-            List[OWLClass]: Matching classes, ordered by label.
+            List[OWLClass] | QueryPlan: Matching classes, ordered by label or, for fuzzy
+                text filters, by descending score, or the query plan if explain is True.
         """
         import re as _re
 
-        # Pre-compute branch set if branch filter specified
-        branch_iris: Optional[set] = None
-        if branch is not None:
-            # Try to resolve branch name to a FOLIOTypes enum
-            branch_type = None
-            for ft in FOLIOTypes:
-                if (
-                    ft.name.lower() == branch.lower()
-                    or ft.value.lower() == branch.lower()
-                ):
-                    branch_type = ft
-                    break
-            if branch_type is not None and branch_type in FOLIO_TYPE_IRIS:
-                branch_classes = self.get_children(
-                    FOLIO_TYPE_IRIS[branch_type], max_depth=DEFAULT_MAX_DEPTH
-                )
-                branch_iris = {c.iri for c in branch_classes}
-            else:
-                return []  # Unknown branch
-
-        # Pre-compute ancestor set if parent_iri filter specified
-        ancestor_iris: Optional[set] = None
-        if parent_iri is not None:
-            normalized = self.normalize_iri(parent_iri)
-            descendants = self.get_children(normalized, max_depth=DEFAULT_MAX_DEPTH)
-            ancestor_iris = {c.iri for c in descendants}
+        state = self._state
 
         def _text_match(text: Optional[str], pattern: str) -> bool:
             if text is None:
@@ -2247,28 +5448,242 @@ class FOLIO:
                 if rapidfuzz is None:
                     raise RuntimeError("search extra required for fuzzy matching")
                 score = rapidfuzz.fuzz.partial_ratio(pattern.lower(), text.lower())
-                return score >= 70
+                return score >= score_cutoff
             return False
 
         def _list_match(items: List[str], pattern: str) -> bool:
             return any(_text_match(item, pattern) for item in items)
 
+        def _lowered_match(
+            lowered: Tuple[Any, ...], fields: Tuple[int, ...], pattern: str
+        ) -> bool:
+            for field in fields:
+                value = lowered[field]
+                if value is None:
+                    continue
+                if isinstance(value, str):
+                    if pattern in value:
+                        return True
+                elif any(pattern in item for item in value):
+                    return True
+            return False
+
+        # lowercase substring patterns and the positions of the text fields they check
+        substring_filters = [
+            (tuple(TEXT_FIELDS.index(field) for field in fields), pattern.lower())
+            for fields, pattern in (
+                (("label",), label),
+                (("definition",), definition),
+                (("alternative_labels",), alt_label),
+                (("examples",), example),
+                (TEXT_FIELDS, any_text),
+            )
+            if pattern is not None
+        ]
+
+        # Record the plan stages when explaining
+        query_start = time.perf_counter()
+        stages: Optional[List[QueryStage]] = [] if explain else None
+
+        def _finish(
+            results: List[OWLClass], driver: str = "scan", num_visited: int = 0
+        ) -> List[OWLClass] | QueryPlan:
+            if stages is None:
+                return results
+            return QueryPlan(
+                driver=driver,
+                stages=stages,
+                num_visited=num_visited,
+                num_results=len(results),
+                seconds=time.perf_counter() - query_start,
+                results=results,
+            )
+
+        # Combine the structural filters as bitmaps over class indices
+        facets = state._class_facets
+        mask = facets.all
+
+        def _apply_facet(
+            name: str, bitmap: int, stage_start: float, detail: Optional[str] = None
+        ) -> None:
+            nonlocal mask
+            mask &= bitmap
+            if stages is not None:
+                stages.append(
+                    QueryStage(
+                        name=name,
+                        detail=detail,
+                        estimated=bitmap.bit_count(),
+                        candidates=mask.bit_count(),
+                        seconds=time.perf_counter() - stage_start,
+                    )
+                )
+
+        if not deprecated:
+            _apply_facet(
+                "not deprecated", facets.all & ~facets.deprecated, time.perf_counter()
+            )
+        if has_children is True:
+            _apply_facet("has children", facets.has_children, time.perf_counter())
+        elif has_children is False:
+            _apply_facet(
+                "no children", facets.all & ~facets.has_children, time.perf_counter()
+            )
+
+        if branch is not None:
+            stage_start = time.perf_counter()
+            # Try to resolve branch name to a FOLIOTypes enum
+            branch_type = None
+            for ft in FOLIOTypes:
+                if (
+                    ft.name.lower() == branch.lower()
+                    or ft.value.lower() == branch.lower()
+                ):
+                    branch_type = ft
+                    break
+            if branch_type is not None and branch_type in FOLIO_TYPE_IRIS:
+                branch_bitmap = facets.branches.get(branch_type.name)
+                if branch_bitmap is None:
+                    return _finish([])
+                _apply_facet("branch", branch_bitmap, stage_start, branch_type.name)
+            else:
+                return _finish([])  # Unknown branch
+
+        if parent_iri is not None:
+            stage_start = time.perf_counter()
+            parent_index = state.iri_to_index.get(self.normalize_iri(parent_iri))
+            if parent_index is None:
+                return _finish([])
+            _apply_facet(
+                "parent",
+                bitmap_from_indices(
+                    state._class_hierarchy.iter_descendants(parent_index), facets.size
+                ),
+                stage_start,
+                parent_iri,
+            )
+
+        if country is not None:
+            stage_start = time.perf_counter()
+            _apply_facet(
+                "country",
+                facets.match_countries(lambda value: _text_match(value, country)),
+                stage_start,
+                country,
+            )
+
+        surviving = BitmapView(mask, facets.size)
+        num_surviving = mask.bit_count()
+
+        # Score fuzzy text filters against the field corpora in batches, keeping the
+        # best score of each class per filter and its worst across filters; if the
+        # structural filters leave few classes, only their strings are scored
+        if match_mode == "fuzzy" and substring_filters:
+            stage_start = time.perf_counter()
+            scored_indices = (
+                surviving
+                if num_surviving < facets.size * FUZZY_SUBSET_FRACTION
+                else None
+            )
+            class_scores: Optional[Dict[int, float]] = None
+            for fields, pattern in substring_filters:
+                filter_scores: Dict[int, float] = {}
+                for field in fields:
+                    corpus, owners = state._text_index.get_corpus(field, scored_indices)
+                    for position, score in self._score_fuzzy(
+                        pattern, corpus, score_cutoff
+                    ).items():
+                        index = owners[position]
+                        if score > filter_scores.get(index, -1.0):
+                            filter_scores[index] = score
+                if class_scores is None:
+                    class_scores = filter_scores
+                else:
+                    class_scores = {
+                        index: min(score, filter_scores[index])
+                        for index, score in class_scores.items()
+                        if index in filter_scores
+                    }
+
+            scored = sorted(
+                (-score, index)
+                for index, score in (class_scores or {}).items()
+                if index in surviving
+            )
+            results = [state.classes[index] for _, index in scored[:limit]]
+            if stages is not None:
+                stages.append(
+                    QueryStage(
+                        name="fuzzy",
+                        detail=f"score >= {score_cutoff:g}",
+                        estimated=len(class_scores or {}),
+                        candidates=len(scored),
+                        seconds=time.perf_counter() - stage_start,
+                    )
+                )
+            return _finish(results, "fuzzy", len(scored))
+
+        # Drive candidate generation from the more selective of the text index postings
+        # and the surviving structural bitmap
+        stage_start = time.perf_counter()
+        text_patterns = (
+            [
+                pattern
+                for pattern in (label, definition, alt_label, example, any_text)
+                if pattern is not None
+            ]
+            if match_mode in ("substring", "exact")
+            else []
+        )
+        text_estimate = state._text_index.estimate_candidates(text_patterns)
+
+        candidate_indices: Iterable[int] = surviving
+        driver = "scan" if mask == facets.all else "facets"
+        if text_estimate is not None and text_estimate <= num_surviving:
+            driver = "text"
+            text_candidates = state._text_index.iter_candidates(text_patterns) or ()
+            candidate_indices = (
+                index for index in text_candidates if index in surviving
+            )
+        elif text_estimate is not None:
+            candidate_indices = (
+                state._text_index.iter_candidates(text_patterns, surviving) or surviving
+            )
+        if stages is not None:
+            stages.append(
+                QueryStage(
+                    name="plan",
+                    detail=driver,
+                    estimated=num_surviving
+                    if text_estimate is None
+                    else min(text_estimate, num_surviving),
+                    candidates=num_surviving,
+                    seconds=time.perf_counter() - stage_start,
+                )
+            )
+
+        # Check the text filters on each candidate until the limit is reached
+        stage_start = time.perf_counter()
+        num_visited = 0
         results = []
-        for cls in self.classes:
-            # Structural filters (fast rejection)
-            if not deprecated and cls.deprecated:
-                continue
-            if branch_iris is not None and cls.iri not in branch_iris:
-                continue
-            if ancestor_iris is not None and cls.iri not in ancestor_iris:
-                continue
-            if has_children is True and not cls.parent_class_of:
-                continue
-            if has_children is False and cls.parent_class_of:
-                continue
-            if country is not None and not _text_match(cls.country, country):
+        for index in candidate_indices:
+            num_visited += 1
+
+            # Substring filters run against the precomputed lowercase text
+            if match_mode == "substring":
+                lowered = state._text_index.get_lowered(index)
+                if not all(
+                    _lowered_match(lowered, fields, pattern)
+                    for fields, pattern in substring_filters
+                ):
+                    continue
+                results.append(state.classes[index])
+                if len(results) >= limit:
+                    break
                 continue
 
+            cls = state.classes[index]
+
             # Text filters (any specified filter must match)
             text_matched = True
 
@@ -2312,7 +5727,16 @@ class FOLIO:
             if len(results) >= limit:
                 break
 
-        return results
+        if stages is not None:
+            stages.append(
+                QueryStage(
+                    name="match",
+                    detail=match_mode,
+                    candidates=len(results),
+                    seconds=time.perf_counter() - stage_start,
+                )
+            )
+        return _finish(results, driver, num_visited)
 
     def query_properties(
         self,
@@ -2323,6 +5747,7 @@ class FOLIO:
         has_inverse: Optional[bool] = None,
         match_mode: str = "substring",
         limit: int = 20,
+        score_cutoff: float = DEFAULT_FUZZY_SCORE_CUTOFF,
     ) -> List[OWLObjectProperty]:
         """
         Query object properties with composable text and structural filters.
@@ -2339,12 +5764,16 @@ class FOLIO:
         Control:
             match_mode: "substring" (default), "exact", "regex", or "fuzzy".
             limit: Maximum results to return (default 20).
+            score_cutoff: Minimum partial_ratio score of a fuzzy match (default 70).
 
         Returns:
-            List[OWLObjectProperty]: Matching properties.
+            List[OWLObjectProperty]: Matching properties, ordered by descending score for
+                fuzzy text filters.
         """
         import re as _re
 
+        state = self._state
+
         # Normalize IRIs
         norm_domain = self.normalize_iri(domain_iri) if domain_iri else None
         norm_range = self.normalize_iri(range_iri) if range_iri else None
@@ -2362,11 +5791,14 @@ class FOLIO:
                 if rapidfuzz is None:
                     raise RuntimeError("search extra required for fuzzy matching")
                 score = rapidfuzz.fuzz.partial_ratio(pattern.lower(), text.lower())
-                return score >= 70
+                return score >= score_cutoff
             return False
 
+        fuzzy = match_mode == "fuzzy" and (label is not None or definition is not None)
+
         results = []
-        for prop in self.object_properties:
+        candidates = []
+        for prop in state.object_properties:
             # Structural filters
             if norm_domain is not None and norm_domain not in prop.domain:
                 continue
@@ -2377,6 +5809,11 @@ class FOLIO:
             if has_inverse is False and prop.inverse_of:
                 continue
 
+            # Fuzzy text filters are scored in batches below
+            if fuzzy:
+                candidates.append(prop)
+                continue
+
             # Text filters
             if label is not None and not _text_match(prop.label, label):
                 continue
@@ -2387,6 +5824,43 @@ class FOLIO:
             if len(results) >= limit:
                 break
 
+        if fuzzy:
+            # Score each text filter against the candidates' lowercase text in one
+            # batch, keeping the worst score of each candidate across filters
+            prop_scores: Optional[Dict[int, float]] = None
+            for field, pattern in (("label", label), ("definition", definition)):
+                if pattern is None:
+                    continue
+                positions = [
+                    position
+                    for position, prop in enumerate(candidates)
+                    if getattr(prop, field) is not None
+                ]
+                field_scores = {
+                    positions[choice]: score
+                    for choice, score in self._score_fuzzy(
+                        pattern.lower(),
+                        [
+                            getattr(candidates[position], field).lower()
+                            for position in positions
+                        ],
+                        score_cutoff,
+                    ).items()
+                }
+                if prop_scores is None:
+                    prop_scores = field_scores
+                else:
+                    prop_scores = {
+                        position: min(score, field_scores[position])
+                        for position, score in prop_scores.items()
+                        if position in field_scores
+                    }
+
+            scored = sorted(
+                (-score, position) for position, score in (prop_scores or {}).items()
+            )
+            results = [candidates[position] for _, position in scored[:limit]]
+
         return results
 
     def find_connections(
@@ -2412,6 +5886,7 @@ class FOLIO:
             List[Tuple[OWLClass, OWLObjectProperty, OWLClass]]: List of triples containing the
                                                                 subject class, property, and object class.
         """
+        state = self._state
         # Normalize inputs to IRIs
         subject_iri = (
             subject_class.iri
@@ -2447,25 +5922,22 @@ class FOLIO:
 
         # Find matching triples
         connections = []
-        for triple in self._cached_triples:
-            if triple[0] == subject_iri:
-                if property_label is None or triple[1] == property_label:
-                    if object_iri is None or triple[2] == object_iri:
-                        # Get actual instances
-                        subject = self[triple[0]]
-                        if subject is None:
-                            continue
-
-                        # Find the property by label
-                        properties = self.get_properties_by_label(triple[1])
-                        if not properties:
-                            continue
-
-                        object_class = self[triple[2]]
-                        if object_class is None:
-                            continue
-
-                        connections.append((subject, properties[0], object_class))
+        for triple in state.triples.find(subject_iri, property_label, object_iri):
+            # Get actual instances
+            subject = self[triple[0]]
+            if subject is None:
+                continue
+
+            # Find the property by label
+            properties = self.get_properties_by_label(triple[1])
+            if not properties:
+                continue
+
+            object_class = self[triple[2]]
+            if object_class is None:
+                continue
+
+            connections.append((subject, properties[0], object_class))
 
         return connections
 
@@ -2478,6 +5950,7 @@ class FOLIO:
         Returns:
             str: The new IRI.
         """
+        state = self._state
 
         for _ in range(MAX_IRI_ATTEMPTS):
             # generate a new base uuid4 value
@@ -2495,9 +5968,48 @@ class FOLIO:
             )
 
             # ensure it's unique
-            if base64_value in self.iri_to_index:
+            if base64_value in state.iri_to_index:
                 continue
 
             return f"https://folio.openlegalstandard.org/{base64_value}"
 
         raise RuntimeError("Failed to generate a unique IRI.")
+
+
+class _FOLIOPartitionParser(FOLIO):
+    """
+    FOLIO parser used by parallel parse workers.
+
+    Property edge triples are only added if no earlier triple matches them, but a worker only
+    sees the triples of its own partition, so it records the rows of the edge triples it adds
+    for the merge to drop those that an earlier partition already added.
+    """
+
+    def _reset_state(self, lazy_classes: bool = False) -> None:
+        """
+        Reset the parsed ontology state and the recorded property edge triple rows.
+
+        Args:
+            lazy_classes (bool): Whether to store classes in lazily-materialized columnar
+                storage instead of a list.
+
+        Returns:
+            None
+        """
+        super()._reset_state(lazy_classes=lazy_classes)
+        self.edge_rows: List[int] = []
+
+    def _add_property_edge_triples(self, owl_property: OWLObjectProperty) -> None:
+        """
+        Add the domain/range edge triples for an OWL object property that are not already
+        present in the partition, recording their rows.
+
+        Args:
+            owl_property (OWLObjectProperty): The OWL object property.
+
+        Returns:
+            None
+        """
+        for edge_triple in self._get_property_edge_triples(owl_property):
+            if self.triples.add(edge_triple):
+                self.edge_rows.append(len(self.triples) - 1)
@@ -0,0 +1,580 @@
+"""
+Class hierarchy labeling for the FOLIO (Federated Open Legal Information Ontology) Python
+library.
+
+Classes are numbered in depth-first pre-order over the subclass edges, so the descendants of a
+class reached through its spanning tree occupy a contiguous range of pre-order ranks.  Classes
+with more than one parent also reach descendants outside that range, so each class is labeled
+with the merged set of rank intervals covering all of its descendants.  Classes in a subclass
+cycle are descendants of each other, so each strongly connected component of the hierarchy is
+labeled as a unit with the intervals of all of its members.  Checking whether one class
+descends from another is then an integer comparison against a few intervals, and enumerating
+the descendants of a class is a scan over its intervals.
+
+The subclass edges themselves are stored as compressed sparse row arrays of class indices in
+both directions, so traversals follow integer offsets rather than IRIs.  Membership of classes
+in the top-level FOLIO branches is precomputed as a bitmask per class and an array of member
+class indices per branch.
+"""
+
+# annotations
+from __future__ import annotations
+
+# imports
+import importlib.util
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# array type code for class indices and pre-order ranks
+RANK_TYPECODE: str = "i"
+
+# ancestors of a class, mapped to their distance and the previous class on a shortest path
+Ancestors = Dict[int, Tuple[int, int]]
+
+
+def _merge_intervals(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Merge overlapping and adjacent closed intervals.
+
+    Args:
+        intervals (List[Tuple[int, int]]): The (start, end) intervals.
+
+    Returns:
+        List[Tuple[int, int]]: The merged intervals, sorted by start.
+    """
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _build_csr(neighbors: Sequence[Iterable[int]]) -> Tuple[array, array]:
+    """
+    Build compressed sparse row arrays from per-class neighbor lists.
+
+    Args:
+        neighbors (Sequence[Iterable[int]]): The neighbor class indices of each class index.
+
+    Returns:
+        Tuple[array, array]: The offsets (one more than the number of classes) and the
+            neighbor class indices of all classes, concatenated in class index order.
+    """
+    offsets = array(RANK_TYPECODE, [0])
+    targets = array(RANK_TYPECODE)
+    for neighbor_indices in neighbors:
+        targets.extend(neighbor_indices)
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+def trace_ancestor_path(ancestors: Ancestors, ancestor_index: int) -> List[int]:
+    """
+    Trace the shortest path from a class up to one of its ancestors.
+
+    Args:
+        ancestors (Ancestors): The ancestors of the class, as returned by
+            ClassAdjacency.get_ancestors().
+        ancestor_index (int): The ancestor class index.
+
+    Returns:
+        List[int]: The class indices from the class to the ancestor, inclusive.
+    """
+    path = [ancestor_index]
+    index = ancestor_index
+    while True:
+        previous_index = ancestors[index][1]
+        if previous_index == index:
+            break
+        path.append(previous_index)
+        index = previous_index
+    path.reverse()
+    return path
+
+
+class ClassAdjacency:
+    """
+    Compressed sparse row (CSR) adjacency of the class hierarchy, keyed by class index.
+
+    The children of class i are targets[offsets[i]:offsets[i + 1]] in the child arrays, and its
+    parents are the same slice of the parent arrays, each in the order of the class's
+    parent_class_of and sub_class_of fields.
+    """
+
+    def __init__(
+        self, children: Sequence[Iterable[int]], parents: Sequence[Iterable[int]]
+    ) -> None:
+        """
+        Build the adjacency arrays.
+
+        Args:
+            children (Sequence[Iterable[int]]): The child class indices of each class index.
+            parents (Sequence[Iterable[int]]): The parent class indices of each class index.
+
+        Returns:
+            None
+        """
+        if len(children) != len(parents):
+            raise ValueError("Child and parent lists must have the same length.")
+
+        self._child_offsets, self._child_targets = _build_csr(children)
+        self._parent_offsets, self._parent_targets = _build_csr(parents)
+
+    def __len__(self) -> int:
+        return len(self._child_offsets) - 1
+
+    def get_arrays(self, direction: str = "children") -> Tuple[array, array]:
+        """
+        Get the offset and target arrays for a direction.
+
+        Args:
+            direction (str): "children" for subclass edges or "parents" for superclass edges.
+
+        Returns:
+            Tuple[array, array]: The offsets and targets.
+        """
+        if direction == "children":
+            return self._child_offsets, self._child_targets
+        if direction == "parents":
+            return self._parent_offsets, self._parent_targets
+        raise ValueError(f"Unknown direction: {direction}")
+
+    def get_children(self, index: int) -> array:
+        """
+        Get the child class indices of a class.
+
+        Args:
+            index (int): The class index.
+
+        Returns:
+            array: The child class indices.
+        """
+        return self._child_targets[
+            self._child_offsets[index] : self._child_offsets[index + 1]
+        ]
+
+    def get_parents(self, index: int) -> array:
+        """
+        Get the parent class indices of a class.
+
+        Args:
+            index (int): The class index.
+
+        Returns:
+            array: The parent class indices.
+        """
+        return self._parent_targets[
+            self._parent_offsets[index] : self._parent_offsets[index + 1]
+        ]
+
+    def get_ancestors(self, index: int) -> Ancestors:
+        """
+        Find the ancestors of a class with a breadth-first traversal of its parents.
+
+        Args:
+            index (int): The class index.
+
+        Returns:
+            Ancestors: The class itself and each ancestor, mapped to its
+                distance from the class and the previous class on a shortest path from the
+                class (the class itself for the class).
+        """
+        ancestors: Ancestors = {index: (0, index)}
+        offsets, targets = self._parent_offsets, self._parent_targets
+        queue = [index]
+        distance = 0
+        while queue:
+            distance += 1
+            next_queue = []
+            for child_index in queue:
+                for position in range(offsets[child_index], offsets[child_index + 1]):
+                    parent_index = targets[position]
+                    if parent_index not in ancestors:
+                        ancestors[parent_index] = (distance, child_index)
+                        next_queue.append(parent_index)
+            queue = next_queue
+        return ancestors
+
+    def to_numpy(self, direction: str = "children") -> Tuple[Any, Any]:
+        """
+        Export the offset and target arrays for a direction as NumPy arrays.
+
+        The arrays share memory with the adjacency and are the indptr and indices of a
+        SciPy CSR matrix, e.g. scipy.sparse.csr_matrix((numpy.ones(len(indices)), indices,
+        indptr), shape=(len(adjacency), len(adjacency))).
+
+        Args:
+            direction (str): "children" for subclass edges or "parents" for superclass edges.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: The read-only indptr and indices arrays.
+        """
+        if importlib.util.find_spec("numpy") is None:
+            raise RuntimeError("numpy is required to export the class adjacency")
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        offsets, targets = self.get_arrays(direction)
+        return (
+            numpy.frombuffer(offsets, dtype=numpy.dtype(offsets.typecode)),
+            numpy.frombuffer(targets, dtype=numpy.dtype(targets.typecode)),
+        )
+
+
+class ClassHierarchy:
+    """
+    Pre-order interval labeling of the class hierarchy, keyed by class index.
+    """
+
+    def __init__(self, children: Sequence[Sequence[int]]) -> None:
+        """
+        Number the classes and label each class with the intervals covering its descendants.
+
+        Args:
+            children (Sequence[Sequence[int]]): The child class indices of each class index.
+
+        Returns:
+            None
+        """
+        num_classes = len(children)
+
+        # pre-order rank of each class, class at each rank, and last rank of each spanning tree
+        self._ranks: array = array(RANK_TYPECODE, [-1]) * num_classes
+        self._order: array = array(RANK_TYPECODE)
+        self._last: array = array(RANK_TYPECODE, [0]) * num_classes
+
+        # merged intervals of classes whose descendants are not a single contiguous range
+        self._intervals: Dict[int, Tuple[int, ...]] = {}
+
+        # start from the classes without parents, then any classes only reachable in cycles
+        has_parent = bytearray(num_classes)
+        for child_indices in children:
+            for child_index in child_indices:
+                has_parent[child_index] = 1
+        starts = [index for index in range(num_classes) if not has_parent[index]]
+        starts.extend(range(num_classes))
+
+        # number the classes with an iterative depth-first traversal, recording finish order,
+        # and collect the strongly connected components with Tarjan's algorithm; components
+        # are completed children first
+        finished: List[int] = []
+        components: List[List[int]] = []
+        low = array(RANK_TYPECODE, [0]) * num_classes
+        on_stack = bytearray(num_classes)
+        component_stack: List[int] = []
+        for root in starts:
+            if self._ranks[root] != -1:
+                continue
+            self._ranks[root] = low[root] = len(self._order)
+            self._order.append(root)
+            component_stack.append(root)
+            on_stack[root] = 1
+            stack = [(root, iter(children[root]))]
+            while stack:
+                index, child_iter = stack[-1]
+                for child_index in child_iter:
+                    if self._ranks[child_index] == -1:
+                        self._ranks[child_index] = low[child_index] = len(self._order)
+                        self._order.append(child_index)
+                        component_stack.append(child_index)
+                        on_stack[child_index] = 1
+                        stack.append((child_index, iter(children[child_index])))
+                        break
+                    if on_stack[child_index] and self._ranks[child_index] < low[index]:
+                        low[index] = self._ranks[child_index]
+                else:
+                    stack.pop()
+                    self._last[index] = len(self._order) - 1
+                    finished.append(index)
+                    if stack and low[index] < low[stack[-1][0]]:
+                        low[stack[-1][0]] = low[index]
+                    if low[index] == self._ranks[index]:
+                        component = []
+                        while True:
+                            member = component_stack.pop()
+                            on_stack[member] = 0
+                            component.append(member)
+                            if member == index:
+                                break
+                        components.append(component)
+
+        # longest-path depth of each class from a class without parents, parents first;
+        # edges back to a class that finishes later close a cycle and are skipped
+        self._depths: array = array(RANK_TYPECODE, [0]) * num_classes
+        position = array(RANK_TYPECODE, [0]) * num_classes
+        for finish_position, index in enumerate(finished):
+            position[index] = finish_position
+        for index in reversed(finished):
+            child_depth = self._depths[index] + 1
+            for child_index in children[index]:
+                if (
+                    position[child_index] < position[index]
+                    and self._depths[child_index] < child_depth
+                ):
+                    self._depths[child_index] = child_depth
+
+        # merge the intervals of the children of each component into the intervals of its
+        # members, children first; the members of a cycle share the same intervals
+        done = bytearray(num_classes)
+        for component in components:
+            intervals = [(self._ranks[index], self._last[index]) for index in component]
+            extended = len(component) > 1
+            for index in component:
+                for child_index in children[index]:
+                    if not done[child_index]:
+                        continue
+                    child_intervals = self.get_intervals(child_index)
+                    if (
+                        child_intervals[0][0] < intervals[0][0]
+                        or child_intervals[-1][1] > intervals[0][1]
+                        or len(child_intervals) > 1
+                    ):
+                        extended = True
+                    intervals.extend(child_intervals)
+            if extended:
+                merged = _merge_intervals(intervals)
+                bounds = tuple(bound for interval in merged for bound in interval)
+                for index in component:
+                    if len(merged) > 1 or merged[0] != (
+                        self._ranks[index],
+                        self._last[index],
+                    ):
+                        self._intervals[index] = bounds
+            for index in component:
+                done[index] = 1
+
+    def __len__(self) -> int:
+        return len(self._ranks)
+
+    def get_rank(self, index: int) -> int:
+        """
+        Get the pre-order rank of a class.
+
+        Args:
+            index (int): The class index.
+
+        Returns:
+            int: The pre-order rank.
+        """
+        return self._ranks[index]
+
+    def get_depth(self, index: int) -> int:
+        """
+        Get the depth of a class, the length of the longest subclass path down to it from a
+        class without parents.  A class is always deeper than its ancestors, except within
+        cycles.
+
+        Args:
+            index (int): The class index.
+
+        Returns:
+            int: The depth.
+        """
+        return self._depths[index]
+
+    def find_common_ancestor(
+        self,
+        ancestors: Ancestors,
+        other_ancestors: Ancestors,
+        lowest: bool = True,
+    ) -> Optional[int]:
+        """
+        Find a common ancestor of two classes from their ancestors.
+
+        Args:
+            ancestors (Ancestors): The ancestors of the first class, as
+                returned by ClassAdjacency.get_ancestors().
+            other_ancestors (Ancestors): The ancestors of the second class.
+            lowest (bool): Whether to find the deepest common ancestor, breaking ties by the
+                total distance from both classes, or the nearest one, breaking ties by depth.
+
+        Returns:
+            Optional[int]: The common ancestor class index, or None if the classes have no
+                common ancestor.  Remaining ties are broken by the smallest class index.
+        """
+        if len(other_ancestors) < len(ancestors):
+            ancestors, other_ancestors = other_ancestors, ancestors
+
+        best_key: Optional[Tuple[int, int, int]] = None
+        for index, (distance, _) in ancestors.items():
+            other = other_ancestors.get(index)
+            if other is None:
+                continue
+            total_distance = distance + other[0]
+            key = (
+                (-self._depths[index], total_distance, index)
+                if lowest
+                else (total_distance, -self._depths[index], index)
+            )
+            if best_key is None or key < best_key:
+                best_key = key
+        return None if best_key is None else best_key[2]
+
+    def get_intervals(self, index: int) -> List[Tuple[int, int]]:
+        """
+        Get the pre-order rank intervals covering a class and its descendants.
+
+        Args:
+            index (int): The class index.
+
+        Returns:
+            List[Tuple[int, int]]: The closed (start, end) rank intervals, sorted by start.
+        """
+        bounds = self._intervals.get(index)
+        if bounds is None:
+            return [(self._ranks[index], self._last[index])]
+        return list(zip(bounds[::2], bounds[1::2]))
+
+    def is_descendant(self, index: int, ancestor_index: int) -> bool:
+        """
+        Check if a class is a descendant of another class.
+
+        Args:
+            index (int): The class index.
+            ancestor_index (int): The ancestor class index.
+
+        Returns:
+            bool: True if the class is a transitive subclass of the ancestor, False otherwise
+                (including when the classes are the same).
+        """
+        if index == ancestor_index:
+            return False
+
+        rank = self._ranks[index]
+        bounds = self._intervals.get(ancestor_index)
+        if bounds is None:
+            return self._ranks[ancestor_index] <= rank <= self._last[ancestor_index]
+        return any(
+            start <= rank <= end for start, end in zip(bounds[::2], bounds[1::2])
+        )
+
+    def iter_descendants(self, ancestor_index: int) -> Iterator[int]:
+        """
+        Iterate over the descendants of a class, in pre-order rank order.
+
+        Args:
+            ancestor_index (int): The ancestor class index.
+
+        Yields:
+            int: The index of each descendant class, excluding the ancestor itself.
+        """
+        order = self._order
+        for start, end in self.get_intervals(ancestor_index):
+            for rank in range(start, end + 1):
+                index = order[rank]
+                if index != ancestor_index:
+                    yield index
+
+    def count_descendants(self, ancestor_index: int) -> int:
+        """
+        Count the descendants of a class.
+
+        Args:
+            ancestor_index (int): The ancestor class index.
+
+        Returns:
+            int: The number of descendant classes, excluding the ancestor itself.
+        """
+        return sum(end - start + 1 for start, end in self.get_intervals(ancestor_index)) - 1
+
+
+class BranchMembership:
+    """
+    Precomputed membership of classes in the top-level ontology branches.
+
+    Each class has a bitmask of the branches it belongs to at any depth, and the members of
+    each branch are stored as class index arrays for the traversal depths used by default, in
+    the order a traversal of the branch returns them.
+    """
+
+    def __init__(self, num_classes: int, branches: Sequence[str]) -> None:
+        """
+        Initialize an empty membership map.
+
+        Args:
+            num_classes (int): The number of classes.
+            branches (Sequence[str]): The branch names, at most 32.
+
+        Returns:
+            None
+        """
+        if len(branches) > 32:
+            raise ValueError("Branch membership supports at most 32 branches.")
+
+        self._branches: Tuple[str, ...] = tuple(branches)
+        self._bits: Dict[str, int] = {
+            branch: 1 << bit for bit, branch in enumerate(self._branches)
+        }
+        self._masks: array = array("I", [0]) * num_classes
+        self._members: Dict[Tuple[str, int], array] = {}
+
+    def add_members(self, branch: str, max_depth: int, indices: Iterable[int]) -> None:
+        """
+        Store the members of a branch for a traversal depth.
+
+        Members stored with a negative depth are the branch's full transitive membership and
+        also set the branch bit of each member class.
+
+        Args:
+            branch (str): The branch name.
+            max_depth (int): The traversal depth; negative for no limit.
+            indices (Iterable[int]): The member class indices, in traversal order.
+
+        Returns:
+            None
+        """
+        members = array(RANK_TYPECODE, indices)
+
+        # share identical arrays across depths
+        for (other_branch, _), other_members in self._members.items():
+            if other_branch == branch and other_members == members:
+                members = other_members
+                break
+        self._members[(branch, max_depth)] = members
+
+        if max_depth < 0:
+            bit = self._bits[branch]
+            for index in members:
+                self._masks[index] |= bit
+
+    def get_members(self, branch: str, max_depth: int) -> Optional[array]:
+        """
+        Get the stored members of a branch for a traversal depth.
+
+        Args:
+            branch (str): The branch name.
+            max_depth (int): The traversal depth; negative for no limit.
+
+        Returns:
+            Optional[array]: The member class indices in traversal order, or None if they were
+                not precomputed for this depth.
+        """
+        return self._members.get((branch, -1 if max_depth < 0 else max_depth))
+
+    def get_branches(self, index: int) -> List[str]:
+        """
+        Get the branches a class belongs to at any depth.
+
+        Args:
+            index (int): The class index.
+
+        Returns:
+            List[str]: The branch names, in branch order.
+        """
+        mask = self._masks[index]
+        return [branch for branch in self._branches if mask & self._bits[branch]]
+
+    def is_member(self, index: int, branch: str) -> bool:
+        """
+        Check if a class belongs to a branch at any depth.
+
+        Args:
+            index (int): The class index.
+            branch (str): The branch name.
+
+        Returns:
+            bool: True if the class is a descendant of the branch root, False otherwise.
+        """
+        return bool(self._masks[index] & self._bits.get(branch, 0))
@@ -549,3 +549,111 @@ class OWLClass(BaseModel):
             OWLClass: The OWL class created from the JSON string.
         """
         return cls.model_validate_json(json_string)
+
+
+class ChangeSet(BaseModel):
+    """
+    ChangeSet model for the FOLIO package, which lists the OWL classes and object properties
+    that were added, removed, or modified by an ontology refresh.
+    """
+
+    added_classes: List[str] = Field(
+        default_factory=list, description="IRIs of added OWL classes"
+    )
+    removed_classes: List[str] = Field(
+        default_factory=list, description="IRIs of removed OWL classes"
+    )
+    modified_classes: List[str] = Field(
+        default_factory=list, description="IRIs of modified OWL classes"
+    )
+    added_properties: List[str] = Field(
+        default_factory=list, description="IRIs of added OWL object properties"
+    )
+    removed_properties: List[str] = Field(
+        default_factory=list, description="IRIs of removed OWL object properties"
+    )
+    modified_properties: List[str] = Field(
+        default_factory=list, description="IRIs of modified OWL object properties"
+    )
+
+    def is_empty(self) -> bool:
+        """
+        Check if the change set is empty.
+
+        Returns:
+            bool: True if nothing was added, removed, or modified, False otherwise.
+        """
+        return not self.get_changed_iris()
+
+    def get_changed_iris(self) -> List[str]:
+        """
+        Get the IRIs of all added, removed, and modified classes and properties.
+
+        Returns:
+            List[str]: The changed IRIs.
+        """
+        return (
+            self.added_classes
+            + self.removed_classes
+            + self.modified_classes
+            + self.added_properties
+            + self.removed_properties
+            + self.modified_properties
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"ChangeSet(classes=+{len(self.added_classes)}/-{len(self.removed_classes)}"
+            f"/~{len(self.modified_classes)}, properties=+{len(self.added_properties)}"
+            f"/-{len(self.removed_properties)}/~{len(self.modified_properties)})"
+        )
+
+
+class QueryStage(BaseModel):
+    """
+    QueryStage model for the FOLIO package, which describes one stage of a class query plan.
+    """
+
+    name: str = Field(..., description="Stage name")
+    detail: Optional[str] = Field(
+        None, description="Filter value or candidate source of the stage"
+    )
+    estimated: Optional[int] = Field(
+        None, description="Estimated number of classes matching the stage on its own"
+    )
+    candidates: Optional[int] = Field(
+        None, description="Number of candidate classes remaining after the stage"
+    )
+    seconds: float = Field(0.0, description="Time spent in the stage, in seconds")
+
+
+class QueryPlan(BaseModel):
+    """
+    QueryPlan model for the FOLIO package, which reports how a class query was evaluated.
+    """
+
+    driver: str = Field(
+        ...,
+        description="Candidate source: 'text' (text index postings), 'facets' (structural "
+        "bitmaps), 'scan' (all classes), or 'fuzzy' (batched fuzzy scores)",
+    )
+    stages: List[QueryStage] = Field(default_factory=list, description="Plan stages")
+    num_visited: int = Field(0, description="Number of candidate classes checked")
+    num_results: int = Field(0, description="Number of results")
+    seconds: float = Field(0.0, description="Total query time, in seconds")
+    results: List[OWLClass] = Field(default_factory=list, description="Query results")
+
+    def __str__(self) -> str:
+        lines = [
+            f"QueryPlan(driver={self.driver}, visited={self.num_visited}, "
+            f"results={self.num_results}, {self.seconds * 1000:.3f}ms)"
+        ]
+        for stage in self.stages:
+            detail = f" [{stage.detail}]" if stage.detail is not None else ""
+            estimated = "-" if stage.estimated is None else stage.estimated
+            candidates = "-" if stage.candidates is None else stage.candidates
+            lines.append(
+                f"  {stage.name}{detail}: estimated={estimated}, "
+                f"candidates={candidates}, {stage.seconds * 1000:.3f}ms"
+            )
+        return "\n".join(lines)
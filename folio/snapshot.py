@@ -0,0 +1,220 @@
+"""
+Binary snapshots of the parsed FOLIO ontology state for warm starts.
+
+A snapshot file contains a short, versioned header followed by a pickle payload holding the
+fully-parsed in-memory state of a FOLIO instance.  The header records the schema version,
+library version, pydantic version, cache key, and the content digest of the OWL buffer the state
+was parsed from, so that stale or incompatible snapshots are rejected and the ontology is
+re-parsed instead.
+
+NOTE: snapshots are pickle files and must only be loaded from a trusted cache directory.
+"""
+
+# annotations
+from __future__ import annotations
+
+# imports
+import json
+import pickle
+import struct
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# packages
+import pydantic
+
+# project imports
+from folio.cache import atomic_write_bytes, get_digest, read_cache_metadata
+from folio.logger import get_logger
+
+# magic bytes at the start of every snapshot file
+SNAPSHOT_MAGIC: bytes = b"FOLIOSNP"
+
+# schema version for the snapshot payload; bump whenever the parsed state layout changes
+SNAPSHOT_SCHEMA_VERSION: int = 14
+
+# snapshot file extension
+SNAPSHOT_SUFFIX: str = ".snapshot"
+
+# header length prefix format (unsigned 32-bit, big-endian)
+_HEADER_LENGTH_FORMAT: str = ">I"
+
+# set up logger
+LOGGER = get_logger(__name__)
+
+
+def get_library_version() -> str:
+    """
+    Get the installed folio-python library version.
+
+    Returns:
+        str: The library version string.
+    """
+    # pylint: disable=import-outside-toplevel
+    from folio import __version__
+
+    return __version__
+
+
+def get_snapshot_path(cache_file_path: Path) -> Path:
+    """
+    Get the snapshot path for an OWL cache file.
+
+    The snapshot lives next to the OWL cache file and shares its blake2b cache key, with the
+    library and schema versions appended so that different versions never share a snapshot.
+
+    Args:
+        cache_file_path (Path): The path to the OWL cache file.
+
+    Returns:
+        Path: The snapshot file path.
+    """
+    return cache_file_path.with_name(
+        f"{cache_file_path.stem}-{get_library_version()}-s{SNAPSHOT_SCHEMA_VERSION}{SNAPSHOT_SUFFIX}"
+    )
+
+
+def _build_header(cache_key: str, source_digest: str) -> Dict[str, Any]:
+    """
+    Build the snapshot header for a cache key and OWL source.
+
+    Args:
+        cache_key (str): The unhashed cache key.
+        source_digest (str): The content digest of the OWL source.
+
+    Returns:
+        Dict[str, Any]: The snapshot header.
+    """
+    return {
+        "schema_version": SNAPSHOT_SCHEMA_VERSION,
+        "library_version": get_library_version(),
+        "pydantic_version": pydantic.VERSION,
+        "cache_key": cache_key,
+        "source_digest": source_digest,
+    }
+
+
+def _get_cache_file_digest(cache_file_path: Path) -> str:
+    """
+    Get the content digest of an OWL cache file, from its metadata sidecar if recorded.
+
+    Args:
+        cache_file_path (Path): The path to the OWL cache file.
+
+    Returns:
+        str: The blake2b hex digest.
+    """
+    metadata = read_cache_metadata(cache_file_path)
+    if metadata is not None and metadata.digest is not None:
+        return metadata.digest
+    return get_digest(cache_file_path)
+
+
+def write_snapshot(
+    state: Dict[str, Any], cache_key: str, cache_file_path: Path
+) -> Optional[Path]:
+    """
+    Write a snapshot of the parsed ontology state next to the OWL cache file.
+
+    The snapshot is keyed on the digest of the buffer the state was parsed from, not on the
+    current OWL cache file, so a state parsed before the cache file was replaced is never
+    restored for the new file.  The snapshot is written to a temporary file and atomically
+    renamed into place, and any snapshots for the same cache key from other library or schema
+    versions are removed.
+
+    Args:
+        state (Dict[str, Any]): The parsed ontology state.
+        cache_key (str): The unhashed cache key.
+        cache_file_path (Path): The path to the OWL cache file the state was parsed from.
+
+    Returns:
+        Path | None: The snapshot path, or None if the OWL cache file does not exist or the
+            state was not parsed from a buffer.
+    """
+    if not cache_file_path.exists():
+        LOGGER.info("Skipping snapshot; cache file does not exist: %s", cache_file_path)
+        return None
+    if state["_source_digest"] is None:
+        LOGGER.info("Skipping snapshot; state has no source digest")
+        return None
+
+    # serialize the header and payload
+    # a digest deferred since the parse is computed here, and only the digest is pickled
+    header = json.dumps(
+        _build_header(cache_key, state["_source_digest"].get())
+    ).encode("utf-8")
+    payload = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # write to a temporary file in the same directory, then rename into place
+    snapshot_path = get_snapshot_path(cache_file_path)
+    atomic_write_bytes(
+        snapshot_path,
+        b"".join(
+            (
+                SNAPSHOT_MAGIC,
+                struct.pack(_HEADER_LENGTH_FORMAT, len(header)),
+                header,
+                payload,
+            )
+        ),
+    )
+    LOGGER.info("Saved snapshot: %s", snapshot_path)
+
+    # remove snapshots for the same cache key from other versions
+    for stale_path in snapshot_path.parent.glob(
+        f"{cache_file_path.stem}-*{SNAPSHOT_SUFFIX}"
+    ):
+        if stale_path != snapshot_path:
+            stale_path.unlink(missing_ok=True)
+
+    return snapshot_path
+
+
+def read_snapshot(cache_key: str, cache_file_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read a snapshot of the parsed ontology state for an OWL cache file.
+
+    Args:
+        cache_key (str): The unhashed cache key.
+        cache_file_path (Path): The path to the OWL cache file the state was parsed from.
+
+    Returns:
+        Dict[str, Any] | None: The parsed ontology state, or None if the snapshot is missing,
+            stale, or incompatible with this library version.
+    """
+    snapshot_path = get_snapshot_path(cache_file_path)
+    if not snapshot_path.exists() or not cache_file_path.exists():
+        LOGGER.info("Snapshot does not exist: %s", snapshot_path)
+        return None
+
+    try:
+        with snapshot_path.open("rb") as input_file:
+            # check the magic bytes
+            if input_file.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                LOGGER.warning("Invalid snapshot file: %s", snapshot_path)
+                return None
+
+            # check the header against the current cache file and library
+            (header_length,) = struct.unpack(
+                _HEADER_LENGTH_FORMAT,
+                input_file.read(struct.calcsize(_HEADER_LENGTH_FORMAT)),
+            )
+            header = json.loads(input_file.read(header_length).decode("utf-8"))
+            if header != _build_header(
+                cache_key, _get_cache_file_digest(cache_file_path)
+            ):
+                LOGGER.info("Snapshot is stale: %s", snapshot_path)
+                return None
+
+            # load the state
+            state = pickle.load(input_file)
+    except Exception:  # pylint: disable=broad-except
+        LOGGER.warning("Failed to read snapshot: %s", snapshot_path, exc_info=True)
+        return None
+
+    if not isinstance(state, dict):
+        LOGGER.warning("Invalid snapshot payload: %s", snapshot_path)
+        return None
+
+    LOGGER.info("Loaded snapshot: %s", snapshot_path)
+    return state
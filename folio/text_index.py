@@ -0,0 +1,469 @@
+"""
+Inverted text index for class queries in the FOLIO (Federated Open Legal Information Ontology)
+Python library.
+
+The text fields of each class are lowercased once when the index is built, and every character
+trigram occurring in them is mapped to the sorted indices of the classes containing it.  A
+substring pattern can only occur in a class whose text contains all of the pattern's
+trigrams, so intersecting their posting lists narrows a query to a few candidate classes
+before the exact checks run against the precomputed lowercase text.
+
+The lowercase strings of each field are also kept as a flat corpus with the index of the
+class owning each string, so fuzzy matching can score a pattern against a whole field in a
+single batched rapidfuzz call.  Label and definition search use a SearchCorpus instead,
+holding the strings already preprocessed for the rapidfuzz scorers.
+"""
+
+# annotations
+from __future__ import annotations
+
+# imports
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+# OWLClass text fields covered by the index
+TEXT_FIELDS: Tuple[str, ...] = (
+    "label",
+    "definition",
+    "alternative_labels",
+    "examples",
+    "notes",
+    "comment",
+    "description",
+)
+
+# character n-gram length
+NGRAM_SIZE: int = 3
+
+# array type code for class indices in posting lists
+POSTING_TYPECODE: str = "i"
+
+
+def _iter_ngrams(text: str) -> Iterable[str]:
+    """
+    Iterate over the character n-grams of a string.
+
+    Args:
+        text (str): The string.
+
+    Returns:
+        Iterable[str]: The n-grams, possibly with duplicates.
+    """
+    return (
+        text[start : start + NGRAM_SIZE]
+        for start in range(len(text) - NGRAM_SIZE + 1)
+    )
+
+
+def _contains(posting: array, index: int) -> bool:
+    """
+    Check if a sorted posting list contains a class index.
+
+    Args:
+        posting (array): The sorted class indices.
+        index (int): The class index.
+
+    Returns:
+        bool: True if the posting list contains the index, False otherwise.
+    """
+    position = bisect_left(posting, index)
+    return position < len(posting) and posting[position] == index
+
+
+def _lower_values(values: Sequence[Any]) -> Tuple[Any, ...]:
+    """
+    Lowercase the text field values of a class.
+
+    Args:
+        values (Sequence[Any]): The values of the TEXT_FIELDS; each value is a string, a list
+            of strings, or None.
+
+    Returns:
+        Tuple[Any, ...]: The lowercased string, tuple of strings for list fields, or None for
+            each field.
+    """
+    lowered: List[Any] = []
+    for value in values:
+        if value is None:
+            lowered.append(None)
+        elif isinstance(value, str):
+            lowered.append(value.lower())
+        else:
+            # empty list elements are parsed as None items
+            lowered.append(tuple(item.lower() for item in value if item is not None))
+    return tuple(lowered)
+
+
+def _get_field_strings(lowered: Any) -> Tuple[str, ...]:
+    """
+    Get the strings of a lowercased text field value.
+
+    Args:
+        lowered (Any): The lowercased string, tuple of strings, or None.
+
+    Returns:
+        Tuple[str, ...]: The strings, one per item of list fields.
+    """
+    if lowered is None:
+        return ()
+    if isinstance(lowered, str):
+        return (lowered,)
+    return lowered
+
+
+def _get_class_ngrams(lowered: Tuple[Any, ...]) -> Set[str]:
+    """
+    Get the distinct n-grams of the lowercased text fields of a class.
+
+    Args:
+        lowered (Tuple[Any, ...]): The lowercased text field values.
+
+    Returns:
+        Set[str]: The n-grams.
+    """
+    # n-grams spanning two values only add candidates, which the exact checks reject
+    text = "\n".join(
+        string for value in lowered for string in _get_field_strings(value)
+    )
+    return {
+        text[start : start + NGRAM_SIZE] for start in range(len(text) - NGRAM_SIZE + 1)
+    }
+
+
+class TextIndex:
+    """
+    Character trigram inverted index over the lowercased text fields of the classes.
+    """
+
+    def __init__(self, texts: Iterable[Sequence[Any]] = ()) -> None:
+        """
+        Build the index.
+
+        Args:
+            texts (Iterable[Sequence[Any]]): The values of the TEXT_FIELDS of each class, in
+                class index order; each value is a string, a list of strings, or None.
+
+        Returns:
+            None
+        """
+        # lowercased field values of each class, aligned with TEXT_FIELDS
+        self._lowered: List[Tuple[Any, ...]] = []
+        postings: DefaultDict[str, List[int]] = defaultdict(list)
+        corpora: List[Tuple[List[str], List[int]]] = [([], []) for _ in TEXT_FIELDS]
+
+        for index, values in enumerate(texts):
+            lowered = _lower_values(values)
+            for (corpus, owners), value in zip(corpora, lowered):
+                if value is not None:
+                    field_strings = _get_field_strings(value)
+                    corpus.extend(field_strings)
+                    owners.extend([index] * len(field_strings))
+            self._lowered.append(lowered)
+            for ngram in _get_class_ngrams(lowered):
+                postings[ngram].append(index)
+
+        self._postings: Dict[str, array] = {
+            ngram: array(POSTING_TYPECODE, posting)
+            for ngram, posting in postings.items()
+        }
+
+        # lowercase strings of each field, aligned with TEXT_FIELDS, and their class indices
+        self._corpora: List[Tuple[List[str], array]] = [
+            (corpus, array(POSTING_TYPECODE, owners)) for corpus, owners in corpora
+        ]
+
+    def __len__(self) -> int:
+        return len(self._lowered)
+
+    def replace(self, texts: Mapping[int, Sequence[Any]], size: int) -> TextIndex:
+        """
+        Get a copy of the index with the text fields of some classes replaced.
+
+        Only the posting lists and corpus entries of the given classes are updated; the rest
+        are shared with this index.
+
+        Args:
+            texts (Mapping[int, Sequence[Any]]): The new values of the TEXT_FIELDS of each
+                changed class index, including every index from len(self) up to size.
+            size (int): The number of classes; classes at or after it are dropped.
+
+        Returns:
+            TextIndex: The new index.
+        """
+        old_size = len(self._lowered)
+        changed = sorted(set(texts).union(range(size, old_size)))
+        index = TextIndex.__new__(TextIndex)
+        index._lowered = self._lowered[:size]
+        index._lowered.extend([()] * (size - old_size))
+
+        # the n-grams each changed class leaves and enters
+        removals: DefaultDict[str, List[int]] = defaultdict(list)
+        additions: DefaultDict[str, List[int]] = defaultdict(list)
+        for class_index in changed:
+            old_ngrams = (
+                _get_class_ngrams(self._lowered[class_index])
+                if class_index < old_size
+                else set()
+            )
+            new_ngrams: Set[str] = set()
+            if class_index < size:
+                lowered = _lower_values(texts[class_index])
+                index._lowered[class_index] = lowered
+                new_ngrams = _get_class_ngrams(lowered)
+            for ngram in old_ngrams - new_ngrams:
+                removals[ngram].append(class_index)
+            for ngram in new_ngrams - old_ngrams:
+                additions[ngram].append(class_index)
+
+        index._postings = dict(self._postings)
+        for ngram in removals.keys() | additions.keys():
+            posting = index._postings.get(ngram)
+            posting = array(POSTING_TYPECODE) if posting is None else posting[:]
+            for class_index in removals.get(ngram, ()):
+                del posting[bisect_left(posting, class_index)]
+            for class_index in additions.get(ngram, ()):
+                posting.insert(bisect_left(posting, class_index), class_index)
+            if posting:
+                index._postings[ngram] = posting
+            else:
+                del index._postings[ngram]
+
+        # each class owns one contiguous run of each corpus
+        index._corpora = []
+        for field, (corpus, owners) in enumerate(self._corpora):
+            corpus = corpus.copy()
+            owners = owners[:]
+            for class_index in changed:
+                start = bisect_left(owners, class_index)
+                stop = bisect_right(owners, class_index, start)
+                field_strings = (
+                    _get_field_strings(index._lowered[class_index][field])
+                    if class_index < size
+                    else ()
+                )
+                corpus[start:stop] = field_strings
+                owners[start:stop] = array(
+                    POSTING_TYPECODE, [class_index] * len(field_strings)
+                )
+            index._corpora.append((corpus, owners))
+        return index
+
+    def get_lowered(self, index: int) -> Tuple[Any, ...]:
+        """
+        Get the lowercased text fields of a class.
+
+        Args:
+            index (int): The class index.
+
+        Returns:
+            Tuple[Any, ...]: The lowercased string, tuple of strings for list fields, or None
+                for each of the TEXT_FIELDS.
+        """
+        return self._lowered[index]
+
+    def get_corpus(
+        self, field: int, indices: Optional[Iterable[int]] = None
+    ) -> Tuple[List[str], array]:
+        """
+        Get the lowercased strings of a text field across all classes, or across some of them.
+
+        Args:
+            field (int): The position of the field in TEXT_FIELDS.
+            indices (Optional[Iterable[int]]): The ascending indices of the classes to include;
+                all classes if None.
+
+        Returns:
+            Tuple[List[str], array]: The strings, with one entry per item of list fields, and
+                the index of the class owning each string.
+        """
+        corpus, owners = self._corpora[field]
+        if indices is None:
+            return corpus, owners
+
+        # the corpus is ordered by class index, so each class owns one contiguous run
+        strings: List[str] = []
+        string_owners = array(POSTING_TYPECODE)
+        stop = 0
+        for index in indices:
+            start = bisect_left(owners, index, stop)
+            stop = bisect_right(owners, index, start)
+            strings.extend(corpus[start:stop])
+            string_owners.extend(owners[start:stop])
+        return strings, string_owners
+
+    def estimate_candidates(self, patterns: Sequence[str]) -> Optional[int]:
+        """
+        Estimate the number of classes whose text may contain every pattern, as the length of
+        the shortest posting list of their n-grams.
+
+        Args:
+            patterns (Sequence[str]): The patterns.
+
+        Returns:
+            Optional[int]: An upper bound on the number of candidates, or None if the patterns
+                are too short to narrow the classes down.
+        """
+        estimate: Optional[int] = None
+        for pattern in patterns:
+            for ngram in _iter_ngrams(pattern.lower()):
+                posting = self._postings.get(ngram)
+                length = 0 if posting is None else len(posting)
+                if estimate is None or length < estimate:
+                    estimate = length
+        return estimate
+
+    def iter_candidates(
+        self, patterns: Sequence[str], indices: Optional[Iterable[int]] = None
+    ) -> Optional[Iterator[int]]:
+        """
+        Lazily iterate over the classes whose text may contain every pattern, ignoring case.
+
+        Args:
+            patterns (Sequence[str]): The patterns.
+            indices (Optional[Iterable[int]]): The sorted class indices to restrict the
+                candidates to, if any.
+
+        Returns:
+            Optional[Iterator[int]]: The indices of the classes whose text contains every
+                n-gram of every pattern, in index order, or None if the patterns are too short
+                to narrow the classes down.
+        """
+        postings: List[array] = []
+        for pattern in patterns:
+            for ngram in set(_iter_ngrams(pattern.lower())):
+                posting = self._postings.get(ngram)
+                if posting is None:
+                    return iter(())
+                postings.append(posting)
+        if not postings:
+            return None
+
+        # scan the shortest posting list (or the given indices), searching the others
+        postings.sort(key=len)
+        if indices is None:
+            indices, postings = postings[0], postings[1:]
+        return (
+            index
+            for index in indices
+            if all(_contains(posting, index) for posting in postings)
+        )
+
+
+class SearchCorpus:
+    """
+    Strings preprocessed once for rapidfuzz scoring, with the key each string belongs to.
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[Any] = (),
+        strings: Iterable[str] = (),
+        processor: Optional[Callable[[str], str]] = None,
+    ) -> None:
+        """
+        Preprocess the strings.
+
+        Args:
+            keys (Iterable[Any]): The key of each string, such as the label itself or the
+                index of the class it belongs to.
+            strings (Iterable[str]): The strings, aligned with keys.
+            processor (Optional[Callable[[str], str]]): The preprocessing function, such as
+                rapidfuzz.utils.default_process, if any.
+
+        Returns:
+            None
+        """
+        self.keys: List[Any] = []
+        self.choices: List[str] = []
+        # length of each original string, for ordering results with equal scores
+        self.lengths: array = array(POSTING_TYPECODE)
+        for key, string in zip(keys, strings):
+            self.keys.append(key)
+            self.choices.append(processor(string) if processor is not None else string)
+            self.lengths.append(len(string))
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    def replace(
+        self,
+        strings: Mapping[int, Optional[str]],
+        processor: Optional[Callable[[str], str]] = None,
+    ) -> SearchCorpus:
+        """
+        Get a copy of a corpus keyed by ascending class indices with the strings of some
+        classes replaced.
+
+        Args:
+            strings (Mapping[int, Optional[str]]): The new string of each changed class index,
+                or None to remove the class from the corpus.
+            processor (Optional[Callable[[str], str]]): The preprocessing function, such as
+                rapidfuzz.utils.default_process, if any.
+
+        Returns:
+            SearchCorpus: The new corpus.
+        """
+        corpus = SearchCorpus()
+        corpus.keys = self.keys.copy()
+        corpus.choices = self.choices.copy()
+        corpus.lengths = self.lengths[:]
+        for key, string in strings.items():
+            position = bisect_left(corpus.keys, key)
+            if position < len(corpus.keys) and corpus.keys[position] == key:
+                del corpus.keys[position]
+                del corpus.choices[position]
+                del corpus.lengths[position]
+            if string is not None:
+                corpus.keys.insert(position, key)
+                corpus.choices.insert(
+                    position, processor(string) if processor is not None else string
+                )
+                corpus.lengths.insert(position, len(string))
+        return corpus
+
+    def rebuild(
+        self,
+        keys: Iterable[Any],
+        strings: Iterable[str],
+        processor: Optional[Callable[[str], str]] = None,
+    ) -> SearchCorpus:
+        """
+        Build a corpus from new keys and strings, reusing the preprocessed string of each key
+        already in this corpus; each reused key must have the same string in both.
+
+        Args:
+            keys (Iterable[Any]): The key of each string.
+            strings (Iterable[str]): The strings, aligned with keys.
+            processor (Optional[Callable[[str], str]]): The preprocessing function, such as
+                rapidfuzz.utils.default_process, if any.
+
+        Returns:
+            SearchCorpus: The new corpus.
+        """
+        choices = dict(zip(self.keys, self.choices))
+        corpus = SearchCorpus()
+        corpus.keys = list(keys)
+        strings = list(strings)
+        corpus.choices = [
+            choices[key]
+            if key in choices
+            else processor(string) if processor is not None else string
+            for key, string in zip(corpus.keys, strings)
+        ]
+        corpus.lengths = array(POSTING_TYPECODE, map(len, strings))
+        return corpus
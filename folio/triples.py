@@ -0,0 +1,819 @@
+"""
+Triple storage for the FOLIO (Federated Open Legal Information Ontology) Python library.
+
+Triples are dictionary-encoded: each distinct subject, predicate, or object string is stored
+once in a term dictionary and assigned an integer ID, and the triples themselves are kept in
+insertion order as three unsigned integer columns.  Triples are decoded back to string tuples
+on output.  Subject, predicate, and object indexes map each term ID to the rows it occurs in,
+so filters run in time proportional to the result instead of scanning every triple.
+Removing rows derives a new store that shares the index entries of terms occurring only
+before the first removed row, so small edits do not re-encode or re-index every triple.
+Membership checks use a hash set of encoded triples that is brought up to date lazily, so
+deduplicated inserts are O(1).
+
+Basic graph patterns -- lists of triple patterns whose terms may be "?name" variables -- are
+matched with index nested-loop joins, ordered so that the most selective pattern is evaluated
+first and each later pattern is looked up through the variables bound before it.
+"""
+
+# annotations
+from __future__ import annotations
+
+# imports
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from itertools import islice, repeat
+from operator import add, sub
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    overload,
+)
+
+# (subject, predicate, object) triple
+Triple = Tuple[str, str, str]
+
+# array type code for term IDs and row indices
+TERM_ID_TYPECODE: str = "I"
+
+# term ID -> rows containing the term, in insertion order
+TermIndex = Dict[int, array]
+
+# term dictionary, (subject, predicate, object) ID columns, and their term indexes
+EncodedTriples = Tuple[
+    List[str], Tuple[array, array, array], Tuple[TermIndex, TermIndex, TermIndex]
+]
+
+# prefix marking a variable in a triple pattern
+VARIABLE_PREFIX: str = "?"
+
+# encoded triple pattern term: a constant term ID or a variable name
+PatternTerm = Union[int, str]
+
+
+def is_variable(term: str) -> bool:
+    """
+    Check if a triple pattern term is a variable.
+
+    Args:
+        term (str): The term.
+
+    Returns:
+        bool: True if the term is a "?name" variable, False if it is a constant.
+    """
+    return len(term) > 1 and term.startswith(VARIABLE_PREFIX)
+
+
+class TripleStore(Sequence):
+    """
+    Insertion-ordered, dictionary-encoded store of (subject, predicate, object) triples.
+
+    The store behaves like a read-only list of triples, with append() and extend() for
+    unconditional inserts, add() for deduplicated inserts, and find() for filtering.  Once
+    freeze() is called, the store no longer accepts inserts; FOLIO freezes the triples of every
+    ontology state it publishes.  without_rows() derives a writable copy with some rows
+    removed, leaving the original store unchanged, and extend_store() appends another store
+    without re-encoding its triples.
+    """
+
+    def __init__(self, triples: Iterable[Triple] = ()) -> None:
+        """
+        Initialize the triple store.
+
+        Args:
+            triples (Iterable[Triple]): The initial triples, in order.
+
+        Returns:
+            None
+        """
+        self._terms: List[str] = []
+        self._term_ids: Dict[str, int] = {}
+        self._subjects: array = array(TERM_ID_TYPECODE)
+        self._predicates: array = array(TERM_ID_TYPECODE)
+        self._objects: array = array(TERM_ID_TYPECODE)
+        self._subject_index: TermIndex = {}
+        self._predicate_index: TermIndex = {}
+        self._object_index: TermIndex = {}
+        self._members: Set[int] = set()
+        self._num_members: int = 0
+        self._frozen: bool = False
+        # ids of index entries shared with the store this one was derived from
+        self._shared_rows: Set[int] = set()
+        self.extend(triples)
+
+    def _encode_term(self, term: str) -> int:
+        """
+        Get the ID of a term, adding it to the term dictionary if necessary.
+
+        Args:
+            term (str): The term.
+
+        Returns:
+            int: The term ID.
+        """
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            term_id = len(self._terms)
+            self._terms.append(term)
+            self._term_ids[term] = term_id
+        return term_id
+
+    def get_term_id(self, term: str) -> Optional[int]:
+        """
+        Get the ID of a term without adding it to the term dictionary.
+
+        Args:
+            term (str): The term.
+
+        Returns:
+            Optional[int]: The term ID, or None if the term is not in the term dictionary.
+        """
+        return self._term_ids.get(term)
+
+    def get_term(self, term_id: int) -> str:
+        """
+        Get the term for a term ID.
+
+        Args:
+            term_id (int): The term ID.
+
+        Returns:
+            str: The term.
+        """
+        return self._terms[term_id]
+
+    @property
+    def num_terms(self) -> int:
+        """
+        Get the number of distinct terms.
+
+        Returns:
+            int: The number of terms in the term dictionary.
+        """
+        return len(self._terms)
+
+    @property
+    def frozen(self) -> bool:
+        """
+        Check if the store is read-only.
+
+        Returns:
+            bool: True if freeze() was called, False otherwise.
+        """
+        return self._frozen
+
+    def freeze(self) -> None:
+        """
+        Make the store read-only, so that append(), extend(), and add() raise TypeError.
+
+        Returns:
+            None
+        """
+        self._frozen = True
+
+    def _check_writable(self) -> None:
+        """
+        Check that the store accepts inserts, raising TypeError if it is frozen.
+
+        Returns:
+            None
+        """
+        if self._frozen:
+            raise TypeError("Cannot modify a frozen TripleStore.")
+
+    @staticmethod
+    def _pack(subject_id: int, predicate_id: int, object_id: int) -> int:
+        """
+        Pack the term IDs of a triple into a single integer membership key.
+
+        Args:
+            subject_id (int): The subject ID.
+            predicate_id (int): The predicate ID.
+            object_id (int): The object ID.
+
+        Returns:
+            int: The membership key.
+        """
+        return (subject_id << 64) | (predicate_id << 32) | object_id
+
+    @staticmethod
+    def _index_row(index: TermIndex, term_id: int, row: int) -> None:
+        """
+        Add a row to the entry for a term ID in a term index.
+
+        Args:
+            index (TermIndex): The term index.
+            term_id (int): The term ID.
+            row (int): The row index.
+
+        Returns:
+            None
+        """
+        rows = index.get(term_id)
+        if rows is None:
+            index[term_id] = array(TERM_ID_TYPECODE, (row,))
+        else:
+            rows.append(row)
+
+    def _unshare_rows(self, subject_id: int, predicate_id: int, object_id: int) -> None:
+        """
+        Copy the index entries of a triple's terms that are shared with another store, so that
+        appending to them does not change the other store.
+
+        Args:
+            subject_id (int): The subject ID.
+            predicate_id (int): The predicate ID.
+            object_id (int): The object ID.
+
+        Returns:
+            None
+        """
+        for index, term_id in (
+            (self._subject_index, subject_id),
+            (self._predicate_index, predicate_id),
+            (self._object_index, object_id),
+        ):
+            rows = index.get(term_id)
+            if rows is not None and id(rows) in self._shared_rows:
+                self._shared_rows.discard(id(rows))
+                index[term_id] = rows[:]
+
+    def _build_indexes(self) -> None:
+        """
+        Rebuild the subject, predicate, and object indexes from the term ID columns.
+
+        Returns:
+            None
+        """
+        for index, column in (
+            (self._subject_index, self._subjects),
+            (self._predicate_index, self._predicates),
+            (self._object_index, self._objects),
+        ):
+            index.clear()
+            for row, term_id in enumerate(column):
+                self._index_row(index, term_id, row)
+
+    def _sync_members(self) -> None:
+        """
+        Add any triples appended since the last membership check to the membership set.
+
+        Returns:
+            None
+        """
+        if self._num_members < len(self._subjects):
+            start = self._num_members
+            self._members.update(
+                map(
+                    self._pack,
+                    self._subjects[start:],
+                    self._predicates[start:],
+                    self._objects[start:],
+                )
+            )
+            self._num_members = len(self._subjects)
+
+    def append(self, triple: Triple) -> None:
+        """
+        Append a triple, even if it is already present.
+
+        Args:
+            triple (Triple): The triple.
+
+        Returns:
+            None
+        """
+        self._check_writable()
+        subject, predicate, obj = triple
+        row = len(self._subjects)
+        subject_id = self._encode_term(subject)
+        predicate_id = self._encode_term(predicate)
+        object_id = self._encode_term(obj)
+        self._subjects.append(subject_id)
+        self._predicates.append(predicate_id)
+        self._objects.append(object_id)
+        if self._shared_rows:
+            self._unshare_rows(subject_id, predicate_id, object_id)
+        self._index_row(self._subject_index, subject_id, row)
+        self._index_row(self._predicate_index, predicate_id, row)
+        self._index_row(self._object_index, object_id, row)
+
+    def extend(self, triples: Iterable[Triple]) -> None:
+        """
+        Append triples in order, even if they are already present.
+
+        Args:
+            triples (Iterable[Triple]): The triples.
+
+        Returns:
+            None
+        """
+        for triple in triples:
+            self.append(triple)
+
+    def extend_store(self, other: TripleStore) -> None:
+        """
+        Append the triples of another store in order, even if they are already present.
+
+        The other store's term IDs are mapped onto this store's term dictionary once per
+        distinct term, and its index entries are shifted past the existing rows and appended,
+        so its triples are neither decoded nor re-indexed one at a time.
+
+        Args:
+            other (TripleStore): The store whose triples to append.
+
+        Returns:
+            None
+        """
+        self._check_writable()
+        offset = len(self._subjects)
+
+        # add the terms new to this store in the order of the other term dictionary
+        start = len(self._terms)
+        term_ids = self._term_ids
+        new_terms = [term for term in other._terms if term not in term_ids]
+        term_ids.update(zip(new_terms, range(start, start + len(new_terms))))
+        self._terms.extend(new_terms)
+        term_map = array(TERM_ID_TYPECODE, map(term_ids.__getitem__, other._terms))
+        for name, index_name in (
+            ("_subjects", "_subject_index"),
+            ("_predicates", "_predicate_index"),
+            ("_objects", "_object_index"),
+        ):
+            getattr(self, name).extend(map(term_map.__getitem__, getattr(other, name)))
+            index: TermIndex = getattr(self, index_name)
+            for term_id, rows in getattr(other, index_name).items():
+                shifted = array(TERM_ID_TYPECODE, map(add, rows, repeat(offset)))
+                target_id = term_map[term_id]
+                current = index.get(target_id)
+                if current is None:
+                    index[target_id] = shifted
+                elif id(current) in self._shared_rows:
+                    self._shared_rows.discard(id(current))
+                    index[target_id] = current + shifted
+                else:
+                    current.extend(shifted)
+
+    def to_encoded(self) -> EncodedTriples:
+        """
+        Get the term dictionary, term ID columns, and term indexes of the store, to rebuild it
+        with from_encoded() without re-encoding or re-indexing its triples.
+
+        Returns:
+            EncodedTriples: The encoded store.
+        """
+        return (
+            self._terms,
+            (self._subjects, self._predicates, self._objects),
+            (self._subject_index, self._predicate_index, self._object_index),
+        )
+
+    @classmethod
+    def from_encoded(cls, encoded: EncodedTriples) -> TripleStore:
+        """
+        Build a writable store from the output of to_encoded().
+
+        Args:
+            encoded (EncodedTriples): The encoded store.
+
+        Returns:
+            TripleStore: The new store, which takes ownership of the encoded columns and
+                indexes.
+        """
+        terms, columns, indexes = encoded
+        store = cls.__new__(cls)
+        store._terms = terms
+        store._term_ids = dict(zip(terms, range(len(terms))))
+        store._subjects, store._predicates, store._objects = columns
+        store._subject_index, store._predicate_index, store._object_index = indexes
+        store._members = set()
+        store._num_members = 0
+        store._frozen = False
+        store._shared_rows = set()
+        return store
+
+    def add(self, triple: Triple) -> bool:
+        """
+        Append a triple only if it is not already present.
+
+        Args:
+            triple (Triple): The triple.
+
+        Returns:
+            bool: True if the triple was added, False if it was already present.
+        """
+        self._check_writable()
+        self._sync_members()
+        key = self._pack(*map(self._encode_term, triple))
+        if key in self._members:
+            return False
+
+        self.append(triple)
+        self._members.add(key)
+        self._num_members += 1
+        return True
+
+    @staticmethod
+    def _remove_index_rows(rows: array, removed: List[int]) -> array:
+        """
+        Remove rows from an index entry and renumber the rows after them.
+
+        Args:
+            rows (array): The ascending rows of the index entry.
+            removed (List[int]): The ascending rows to remove.
+
+        Returns:
+            array: The remaining rows, each lowered by the number of removed rows before it.
+        """
+        kept = rows[: bisect_left(rows, removed[0])]
+        for shift, row in enumerate(removed, 1):
+            start = bisect_right(rows, row)
+            stop = (
+                bisect_left(rows, removed[shift], start)
+                if shift < len(removed)
+                else len(rows)
+            )
+            if start < stop:
+                kept.extend(map(sub, rows[start:stop], repeat(shift)))
+        return kept
+
+    def without_rows(self, rows: Iterable[int]) -> TripleStore:
+        """
+        Get a writable copy of the store with some rows removed, keeping the order of the
+        remaining triples.
+
+        Only the index entries of terms occurring at or after the first removed row are
+        renumbered; the others are shared with this store until the copy appends to them.  The
+        term dictionary keeps the terms of the removed triples.
+
+        Args:
+            rows (Iterable[int]): The row indices to remove.
+
+        Returns:
+            TripleStore: The new store.
+        """
+        removed = sorted(set(rows))
+        if removed and not 0 <= removed[0] <= removed[-1] < len(self._subjects):
+            raise IndexError("triple index out of range")
+
+        store = TripleStore.__new__(TripleStore)
+        store._terms = self._terms.copy()
+        store._term_ids = self._term_ids.copy()
+        store._members = set()
+        store._num_members = 0
+        store._frozen = False
+        store._shared_rows = set()
+        for name, index_name in (
+            ("_subjects", "_subject_index"),
+            ("_predicates", "_predicate_index"),
+            ("_objects", "_object_index"),
+        ):
+            column: array = getattr(self, name)
+            index: TermIndex = dict(getattr(self, index_name))
+            store._shared_rows.update(map(id, index.values()))
+            if not removed:
+                setattr(store, name, column[:])
+                setattr(store, index_name, index)
+                continue
+
+            # cut the removed rows out of the column
+            kept = column[: removed[0]]
+            for start, stop in zip(removed, removed[1:] + [len(column)]):
+                kept.extend(column[start + 1 : stop])
+            setattr(store, name, kept)
+
+            # renumber the entries of the terms occurring at or after the first removed row
+            for term_id in set(column[removed[0] :]):
+                term_rows = self._remove_index_rows(index[term_id], removed)
+                if term_rows:
+                    index[term_id] = term_rows
+                else:
+                    del index[term_id]
+            setattr(store, index_name, index)
+        return store
+
+    def _decode(self, index: int) -> Triple:
+        """
+        Decode the triple at a row index.
+
+        Args:
+            index (int): The row index.
+
+        Returns:
+            Triple: The triple.
+        """
+        terms = self._terms
+        return (
+            terms[self._subjects[index]],
+            terms[self._predicates[index]],
+            terms[self._objects[index]],
+        )
+
+    def find(
+        self,
+        subject: Optional[str] = None,
+        predicate: Optional[str] = None,
+        obj: Optional[str] = None,
+    ) -> List[Triple]:
+        """
+        Find the triples matching a subject, predicate, and/or object, in insertion order.
+
+        Args:
+            subject (Optional[str]): The subject to match, or None to match any subject.
+            predicate (Optional[str]): The predicate to match, or None to match any predicate.
+            obj (Optional[str]): The object to match, or None to match any object.
+
+        Returns:
+            List[Triple]: The matching triples.
+        """
+        decode = self._decode
+        return [decode(row) for row in self.find_rows(subject, predicate, obj)]
+
+    def find_rows(
+        self,
+        subject: Optional[str] = None,
+        predicate: Optional[str] = None,
+        obj: Optional[str] = None,
+    ) -> Iterable[int]:
+        """
+        Find the row indices of the triples matching a subject, predicate, and/or object, in
+        insertion order.
+
+        Args:
+            subject (Optional[str]): The subject to match, or None to match any subject.
+            predicate (Optional[str]): The predicate to match, or None to match any predicate.
+            obj (Optional[str]): The object to match, or None to match any object.
+
+        Returns:
+            Iterable[int]: The matching row indices.
+        """
+        term_ids: List[Optional[int]] = []
+        for term in (subject, predicate, obj):
+            if term is None:
+                term_ids.append(None)
+                continue
+
+            # terms that never occur cannot match
+            term_id = self._term_ids.get(term)
+            if term_id is None:
+                return ()
+            term_ids.append(term_id)
+
+        return self._match_rows(*term_ids)
+
+    def _match_rows(
+        self,
+        subject_id: Optional[int],
+        predicate_id: Optional[int],
+        object_id: Optional[int],
+    ) -> Iterable[int]:
+        """
+        Get the rows matching a subject, predicate, and/or object term ID, in insertion order.
+
+        Args:
+            subject_id (Optional[int]): The subject ID, or None to match any subject.
+            predicate_id (Optional[int]): The predicate ID, or None to match any predicate.
+            object_id (Optional[int]): The object ID, or None to match any object.
+
+        Returns:
+            Iterable[int]: The matching row indices.
+        """
+        # look up the rows for each given term
+        constraints: List[Tuple[array, array, int]] = []
+        for index, column, term_id in (
+            (self._subject_index, self._subjects, subject_id),
+            (self._predicate_index, self._predicates, predicate_id),
+            (self._object_index, self._objects, object_id),
+        ):
+            if term_id is None:
+                continue
+
+            # terms that never occur in this position cannot match
+            rows = index.get(term_id)
+            if rows is None:
+                return ()
+            constraints.append((rows, column, term_id))
+
+        if not constraints:
+            return range(len(self._subjects))
+
+        # start from the fewest rows and check the other terms on each row
+        constraints.sort(key=lambda constraint: len(constraint[0]))
+        rows = constraints[0][0]
+        if len(constraints) == 1:
+            return rows
+        return [
+            row
+            for row in rows
+            if all(column[row] == term_id for _, column, term_id in constraints[1:])
+        ]
+
+    def _estimate_rows(
+        self, pattern: Tuple[PatternTerm, PatternTerm, PatternTerm], bound: Set[str]
+    ) -> float:
+        """
+        Estimate the number of rows a triple pattern matches for each solution of the
+        patterns evaluated before it.
+
+        Args:
+            pattern (Tuple[PatternTerm, PatternTerm, PatternTerm]): The encoded pattern.
+            bound (Set[str]): The variables bound by the patterns evaluated before it.
+
+        Returns:
+            float: The estimated number of matching rows.
+        """
+        estimate = float(len(self._subjects))
+        for index, term in zip(
+            (self._subject_index, self._predicate_index, self._object_index), pattern
+        ):
+            if isinstance(term, int):
+                estimate = min(estimate, len(index.get(term, ())))
+            elif term in bound:
+                # a bound variable matches the average number of rows per term
+                estimate = min(estimate, len(self._subjects) / max(len(index), 1))
+        return estimate
+
+    def _solve(
+        self,
+        plan: List[Tuple[PatternTerm, PatternTerm, PatternTerm]],
+        depth: int,
+        binding: Dict[str, int],
+    ) -> Iterator[Dict[str, int]]:
+        """
+        Generate the solutions of the remaining patterns in a join plan.
+
+        Args:
+            plan (List[Tuple[PatternTerm, PatternTerm, PatternTerm]]): The encoded patterns,
+                in evaluation order.
+            depth (int): The index of the next pattern to evaluate.
+            binding (Dict[str, int]): The variable bindings so far.
+
+        Yields:
+            Dict[str, int]: The variable bindings of each solution, as term IDs.
+        """
+        if depth == len(plan):
+            yield binding
+            return
+
+        pattern = plan[depth]
+        term_ids = [
+            term if isinstance(term, int) else binding.get(term) for term in pattern
+        ]
+        columns = (self._subjects, self._predicates, self._objects)
+        for row in self._match_rows(*term_ids):
+            solution = binding
+            for term, column in zip(pattern, columns):
+                if isinstance(term, int):
+                    continue
+                value = column[row]
+                current = solution.get(term)
+                if current is None:
+                    if solution is binding:
+                        solution = dict(binding)
+                    solution[term] = value
+                elif current != value:
+                    # a variable repeated within the pattern bound to different terms
+                    break
+            else:
+                yield from self._solve(plan, depth + 1, solution)
+
+    def match(
+        self, patterns: Iterable[Triple], limit: Optional[int] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Match a basic graph pattern: find every assignment of terms to variables that makes
+        all of the triple patterns triples in the store.
+
+        Terms starting with "?" are variables, and any other term must match exactly.  The
+        patterns are evaluated one at a time, starting from the one matching the fewest rows
+        and then always choosing the most selective remaining pattern given the variables
+        already bound, and each pattern is looked up through the term indexes.
+
+        Args:
+            patterns (Iterable[Triple]): The (subject, predicate, object) triple patterns.
+            limit (Optional[int]): The maximum number of solutions to return.
+
+        Returns:
+            List[Dict[str, str]]: The solutions, mapping each variable name (without the "?")
+                to its term.
+        """
+        # encode the patterns; a constant that never occurs matches nothing
+        encoded: List[Tuple[PatternTerm, PatternTerm, PatternTerm]] = []
+        for pattern in patterns:
+            if len(pattern) != 3:
+                raise ValueError(
+                    f"Triple patterns must have a subject, predicate, and object: {pattern}"
+                )
+            encoded_pattern: List[PatternTerm] = []
+            for term in pattern:
+                if is_variable(term):
+                    encoded_pattern.append(term[1:])
+                    continue
+                term_id = self._term_ids.get(term)
+                if term_id is None:
+                    return []
+                encoded_pattern.append(term_id)
+            encoded.append(tuple(encoded_pattern))  # type: ignore[arg-type]
+
+        if not encoded:
+            raise ValueError("At least one triple pattern is required.")
+
+        # order the patterns greedily by estimated selectivity
+        plan: List[Tuple[PatternTerm, PatternTerm, PatternTerm]] = []
+        bound: Set[str] = set()
+        while encoded:
+            pattern = min(
+                encoded, key=lambda candidate: self._estimate_rows(candidate, bound)
+            )
+            encoded.remove(pattern)
+            plan.append(pattern)
+            bound.update(term for term in pattern if isinstance(term, str))
+
+        terms = self._terms
+        return [
+            {name: terms[term_id] for name, term_id in solution.items()}
+            for solution in islice(self._solve(plan, 0, {}), limit)
+        ]
+
+    def __contains__(self, triple: Any) -> bool:
+        try:
+            subject, predicate, obj = triple
+        except (TypeError, ValueError):
+            return False
+
+        term_ids = [self._term_ids.get(term) for term in (subject, predicate, obj)]
+        if None in term_ids:
+            return False
+
+        self._sync_members()
+        return self._pack(*term_ids) in self._members
+
+    def __len__(self) -> int:
+        return len(self._subjects)
+
+    def __iter__(self) -> Iterator[Triple]:
+        terms = self._terms
+        for subject_id, predicate_id, object_id in zip(
+            self._subjects, self._predicates, self._objects
+        ):
+            yield terms[subject_id], terms[predicate_id], terms[object_id]
+
+    @overload
+    def __getitem__(self, index: int) -> Triple: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Triple]: ...
+
+    def __getitem__(self, index: int | slice) -> Triple | List[Triple]:
+        if isinstance(index, slice):
+            return [self._decode(row) for row in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("triple index out of range")
+        return self._decode(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (TripleStore, list, tuple)):
+            return len(self) == len(other) and all(
+                left == right for left, right in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TripleStore({len(self)} triples, {len(self._terms)} terms)"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the term ID lookup and term indexes are rebuilt on load, and the membership set
+        # on demand
+        return {
+            "terms": self._terms,
+            "subjects": self._subjects,
+            "predicates": self._predicates,
+            "objects": self._objects,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._terms = state["terms"]
+        self._term_ids = {term: term_id for term_id, term in enumerate(self._terms)}
+        self._subjects = state["subjects"]
+        self._predicates = state["predicates"]
+        self._objects = state["objects"]
+        self._subject_index = {}
+        self._predicate_index = {}
+        self._object_index = {}
+        self._build_indexes()
+        self._members = set()
+        self._num_members = 0
+        self._frozen = False
+        self._shared_rows = set()
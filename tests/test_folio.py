@@ -1,12 +1,31 @@
 # imports
+import pickle
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 
 # packages
+import lxml.etree
 import pytest
 
 # project imports
+import folio.cache
 import folio.graph
-from folio import FOLIO, FOLIOTypes, FOLIO_TYPE_IRIS, OWLClass
+from folio import (
+    FOLIO,
+    FOLIOTypes,
+    FOLIO_TYPE_IRIS,
+    ClassColumns,
+    OWLClass,
+    QueryPlan,
+    TripleStore,
+)
+from folio.graph import DEFAULT_MAX_DEPTH, DEFAULT_SEARCH_MAX_DEPTH
+from folio.facets import BitmapView, ClassFacets, bitmap_from_indices
+from folio.hierarchy import ClassHierarchy
+from folio.text_index import TextIndex
+from folio.models import NSMAP
+from folio.cache import CacheStore, SourceDigest, get_digest, read_cache_metadata
 
 
 # set up a re-usable fixture for the FOLIO class
@@ -72,6 +91,372 @@ def test_load_refresh():
     assert len(ontology) > 0
 
 
+def test_refresh_swaps_state():
+    """
+    Test that refresh() swaps in a complete new state without duplicating properties, and
+    that concurrent readers never see a partial ontology.
+    """
+    ontology = FOLIO(use_cache=True)
+    num_classes = len(ontology)
+    num_properties = len(ontology.object_properties)
+    property_labels = dict(ontology.property_label_to_index)
+
+    # read the ontology continuously while refreshing
+    partial_reads = []
+    stop = threading.Event()
+
+    def read_ontology():
+        while not stop.is_set():
+            if len(ontology) != num_classes or not ontology.triples:
+                partial_reads.append(len(ontology))
+
+    reader = threading.Thread(target=read_ontology)
+    reader.start()
+    try:
+        assert ontology.refresh()
+    finally:
+        stop.set()
+        reader.join()
+
+    assert not partial_reads
+    assert len(ontology.object_properties) == num_properties
+    assert ontology.property_label_to_index == property_labels
+
+
+def test_set_state_generations():
+    """
+    Test that published states are read-only, that swaps keep the instance settings, and
+    that a state built by a superseded refresh is discarded.
+    """
+    ontology = FOLIO()
+    state = ontology._state
+    llm = ontology.llm
+    with pytest.raises(AttributeError):
+        state.title = "FOLIO"
+    with pytest.raises(TypeError):
+        ontology.triples.append(("a", "p", "b"))
+
+    # a refresh that started first but finishes last is discarded
+    generation = ontology._begin_refresh()
+    assert ontology._set_state(ontology._get_state())
+    newer_state = ontology._state
+    assert not ontology._set_state(state.to_dict(), generation)
+    assert ontology._state is newer_state
+    assert newer_state is not state
+
+    # the instance settings survive the swap, and old readers keep a complete state
+    assert ontology.llm is llm
+    assert len(ontology) == len(state.classes)
+    assert ontology.search_by_prefix("Mich")
+
+
+def test_auto_refresh(tmp_path):
+    """
+    Test starting and stopping the background refresh thread.
+    """
+    ontology = FOLIO(cache_path=tmp_path)
+    with pytest.raises(ValueError):
+        ontology.start_auto_refresh(0)
+
+    ontology.start_auto_refresh(0.1)
+    with pytest.raises(RuntimeError):
+        ontology.start_auto_refresh(0.1)
+    ontology.stop_auto_refresh()
+    assert len(ontology) > 0
+
+
+def test_parse_owl_delta():
+    """
+    Test that a delta refresh reports the changed classes and matches a full parse.
+    """
+    owl_buffer = FOLIO.load_owl()
+    ontology = FOLIO(use_snapshot=False)
+
+    # the first delta records fingerprints and finds no changes
+    assert ontology.parse_owl_delta(owl_buffer).is_empty()
+    assert ontology.parse_owl_delta(owl_buffer).is_empty()
+
+    # relabel one class, remove another, and add a new child of the first
+    tree = lxml.etree.fromstring(owl_buffer.encode("utf-8"))
+    class_nodes = tree.findall(f"{{{NSMAP['owl']}}}Class")
+    modified_iri = ontology.get_areas_of_law()[0].iri
+    removed_iri = ontology.get_areas_of_law()[1].iri
+    added_iri = modified_iri + "DeltaTest"
+    for node in class_nodes:
+        about = node.get(f"{{{NSMAP['rdf']}}}about")
+        if about == modified_iri:
+            node.find(f"{{{NSMAP['rdfs']}}}label").text = "Delta Test Label"
+        elif about == removed_iri:
+            tree.remove(node)
+    added_node = lxml.etree.SubElement(tree, f"{{{NSMAP['owl']}}}Class")
+    added_node.set(f"{{{NSMAP['rdf']}}}about", added_iri)
+    lxml.etree.SubElement(added_node, f"{{{NSMAP['rdfs']}}}label").text = "Delta Test"
+    lxml.etree.SubElement(added_node, f"{{{NSMAP['rdfs']}}}subClassOf").set(
+        f"{{{NSMAP['rdf']}}}resource", modified_iri
+    )
+    new_buffer = lxml.etree.tostring(tree, encoding="unicode")
+
+    change_set = ontology.parse_owl_delta(new_buffer)
+    assert change_set.added_classes == [added_iri]
+    assert change_set.removed_classes == [removed_iri]
+    assert change_set.modified_classes == [modified_iri]
+
+    # compare with a full parse
+    reference = FOLIO(use_snapshot=False)
+    reference.parse_owl_delta(new_buffer)
+    assert len(ontology) == len(reference)
+    assert set(ontology.triples) == set(reference.triples)
+    assert ontology.get_by_label("Delta Test Label")[0].iri == modified_iri
+    assert removed_iri not in ontology
+    assert added_iri in ontology[modified_iri].parent_class_of
+    assert ontology.search_by_prefix("Delta Test")
+    for owl_class in reference.classes:
+        assert ontology[owl_class.iri].model_dump(
+            exclude={"parent_class_of"}
+        ) == owl_class.model_dump(exclude={"parent_class_of"})
+        assert sorted(ontology[owl_class.iri].parent_class_of) == sorted(
+            owl_class.parent_class_of
+        )
+
+
+def test_parse_owl_delta_label():
+    """
+    Test that a label-only delta reuses the class hierarchy and reindexes the changed class.
+    """
+    owl_buffer = FOLIO.load_owl()
+    ontology = FOLIO(use_snapshot=False)
+    assert ontology.parse_owl_delta(owl_buffer).is_empty()
+    class_adjacency = ontology.class_adjacency
+    class_hierarchy = ontology._class_hierarchy
+    branch_membership = ontology._branch_membership
+
+    modified_iri = ontology.get_areas_of_law()[0].iri
+    old_label = ontology[modified_iri].label
+    tree = lxml.etree.fromstring(owl_buffer.encode("utf-8"))
+    for node in tree.findall(f"{{{NSMAP['owl']}}}Class"):
+        if node.get(f"{{{NSMAP['rdf']}}}about") == modified_iri:
+            node.find(f"{{{NSMAP['rdfs']}}}label").text = "Delta Label Only"
+    new_buffer = lxml.etree.tostring(tree, encoding="unicode")
+
+    assert ontology.parse_owl_delta(new_buffer).modified_classes == [modified_iri]
+    assert ontology.class_adjacency is class_adjacency
+    assert ontology._class_hierarchy is class_hierarchy
+    assert ontology._branch_membership is branch_membership
+    assert [c.iri for c in ontology.query(label="Delta Label Only")] == [modified_iri]
+    assert (modified_iri, "rdfs:label", "Delta Label Only") in ontology.triples
+    assert (modified_iri, "rdfs:label", old_label) not in ontology.triples
+    assert modified_iri in [c.iri for c in ontology.get_areas_of_law()]
+
+
+def test_parse_owl_delta_whitespace():
+    """
+    Test that whitespace changes between nodes are not reported as modified classes.
+    """
+    owl_buffer = FOLIO.load_owl()
+    ontology = FOLIO(use_snapshot=False)
+    assert ontology.parse_owl_delta(owl_buffer).is_empty()
+
+    # reformat the text between the top-level nodes
+    tree = lxml.etree.fromstring(owl_buffer.encode("utf-8"))
+    for node in tree.iterchildren():
+        node.tail = "\n\n    "
+    new_buffer = lxml.etree.tostring(tree, encoding="unicode")
+
+    assert ontology.parse_owl_delta(new_buffer).is_empty()
+    assert ontology._source_digest.get() == get_digest(new_buffer)
+
+
+def test_parse_owl_streaming(folio_graph):
+    """
+    Test that the streaming parser matches the tree parser without retaining the tree.
+    """
+    ontology = FOLIO(use_snapshot=False, streaming=True)
+    assert ontology.tree is None
+    assert ontology.title == folio_graph.title
+    assert len(ontology) == len(folio_graph)
+    assert ontology.triples == folio_graph.triples
+    assert ontology.class_edges == folio_graph.class_edges
+    for owl_class in folio_graph.classes:
+        assert ontology[owl_class.iri] == owl_class
+
+    # the tree can also be released after a full parse
+    assert FOLIO(use_snapshot=False, retain_tree=False).tree is None
+
+
+def test_parse_owl_tag_handlers():
+    """
+    Test that class and property child elements are dispatched to the right fields and triples.
+    """
+    ontology = FOLIO.__new__(FOLIO)
+    ontology._reset_state()
+    ontology.parse_owl(
+        f"""<rdf:RDF xmlns:rdf="{NSMAP['rdf']}" xmlns:rdfs="{NSMAP['rdfs']}"
+            xmlns:owl="{NSMAP['owl']}" xmlns:skos="{NSMAP['skos']}">
+          <owl:Class rdf:about="https://example.org/A">
+            <rdfs:label>A</rdfs:label>
+            <skos:prefLabel>Preferred A</skos:prefLabel>
+            <skos:altLabel xml:lang="de">Ah</skos:altLabel>
+            <skos:hiddenLabel>Hidden A</skos:hiddenLabel>
+            <rdfs:seeAlso>See also text</rdfs:seeAlso>
+            <skos:note>First</skos:note>
+            <skos:note>Second</skos:note>
+          </owl:Class>
+          <owl:ObjectProperty rdf:about="https://example.org/p">
+            <rdfs:label>p</rdfs:label>
+            <rdfs:domain rdf:resource="https://example.org/A"/>
+            <owl:inverseOf>https://example.org/q</owl:inverseOf>
+          </owl:ObjectProperty>
+          <owl:NamedIndividual rdf:about="https://example.org/i"/>
+        </rdf:RDF>"""
+    )
+
+    owl_class = ontology["https://example.org/A"]
+    assert owl_class.preferred_label == "Preferred A"
+    assert owl_class.translations == {"de": "Ah"}
+    assert owl_class.alternative_labels == ["Ah", "Hidden A"]
+    assert owl_class.see_also == ["See also text"]
+    assert owl_class.notes == ["First", "Second"]
+    owl_property = ontology.object_properties[0]
+    assert owl_property.domain == ["https://example.org/A"]
+    assert owl_property.inverse_of == "https://example.org/q"
+    assert ("https://example.org/A", "rdfs:label", "A") in ontology.triples
+    assert ("https://example.org/A", "skos:prefLabel", "Preferred A") not in ontology.triples
+    assert ("https://example.org/p", "owl:inverseOf", "https://example.org/q") in ontology.triples
+    assert len(ontology) == 1
+
+
+def test_parse_owl_empty_list_elements():
+    """
+    Test that empty list elements parse and do not break the text index.
+    """
+    ontology = FOLIO.__new__(FOLIO)
+    ontology._reset_state()
+    ontology.parse_owl(
+        f"""<rdf:RDF xmlns:rdf="{NSMAP['rdf']}" xmlns:rdfs="{NSMAP['rdfs']}"
+            xmlns:owl="{NSMAP['owl']}" xmlns:skos="{NSMAP['skos']}">
+          <owl:Class rdf:about="https://example.org/A">
+            <rdfs:label>Alpha</rdfs:label>
+            <skos:altLabel/>
+            <skos:example/>
+            <skos:note/>
+          </owl:Class>
+        </rdf:RDF>"""
+    )
+
+    assert [c.iri for c in ontology.query(label="alp")] == ["https://example.org/A"]
+    assert [c.iri for c in ontology.query(any_text="alp")] == ["https://example.org/A"]
+
+
+def test_parse_owl_parallel(folio_graph):
+    """
+    Test that a parallel parse merges into the same state as a serial parse.
+    """
+    assert folio.graph._get_parse_pool_context().get_start_method() != "fork"
+    ontology = FOLIO(use_snapshot=False, parse_workers=2)
+    assert ontology.tree is None
+    assert ontology.title == folio_graph.title
+    assert ontology.description == folio_graph.description
+    assert ontology.classes == folio_graph.classes
+    assert ontology.object_properties == folio_graph.object_properties
+    assert ontology.iri_to_index == folio_graph.iri_to_index
+    assert ontology.label_to_index == folio_graph.label_to_index
+    assert ontology.alt_label_to_index == folio_graph.alt_label_to_index
+    assert ontology.property_label_to_index == folio_graph.property_label_to_index
+    assert ontology.triples == folio_graph.triples
+
+
+def test_parse_owl_parallel_partitions():
+    """
+    Test that partitions merge like a serial parse, including edge triples added by an earlier
+    partition.
+    """
+    edge_property = """
+          <owl:ObjectProperty rdf:about="https://example.org/{name}">
+            <rdfs:label>relates</rdfs:label>
+            <skos:prefLabel>relates</skos:prefLabel>
+            <rdfs:domain rdf:resource="https://example.org/C0"/>
+            <rdfs:range rdf:resource="https://example.org/C1"/>
+          </owl:ObjectProperty>"""
+    classes = "".join(
+        f"""
+          <owl:Class rdf:about="https://example.org/C{index}">
+            <rdfs:label>Class {index % 5}</rdfs:label>
+            <skos:altLabel>Alt {index % 3}</skos:altLabel>
+          </owl:Class>"""
+        for index in range(20)
+    )
+    buffer = f"""<rdf:RDF xmlns:rdf="{NSMAP['rdf']}" xmlns:rdfs="{NSMAP['rdfs']}"
+            xmlns:owl="{NSMAP['owl']}" xmlns:skos="{NSMAP['skos']}">
+          {edge_property.format(name="p")}{classes}{edge_property.format(name="q")}
+        </rdf:RDF>"""
+
+    serial = FOLIO._parse_owl_state(buffer)
+    for lazy_classes in (False, True):
+        parallel = FOLIO._parse_owl_state(
+            buffer, parse_workers=3, lazy_classes=lazy_classes
+        )
+        for name in (
+            "classes",
+            "object_properties",
+            "iri_to_index",
+            "iri_to_property_index",
+            "label_to_index",
+            "alt_label_to_index",
+            "property_label_to_index",
+            "class_edges",
+            "triples",
+        ):
+            assert parallel[name] == serial[name], name
+        edge_triple = ("https://example.org/C0", "relates", "https://example.org/C1")
+        assert parallel["triples"].find(*edge_triple) == [edge_triple]
+
+
+def test_lazy_classes(folio_graph):
+    """
+    Test that lazy classes are only materialized on access and match an eager parse.
+    """
+    ontology = FOLIO(use_snapshot=False, lazy_classes=True)
+    assert isinstance(ontology.classes, ClassColumns)
+    assert ontology.classes.num_materialized() == 0
+    assert ontology.iri_to_index == folio_graph.iri_to_index
+    assert ontology.class_edges == folio_graph.class_edges
+
+    # indexing constructs and caches the model
+    owl_class = ontology["R8CdMpOM0RmyrgCCvbpiLS0"]
+    assert owl_class == folio_graph["R8CdMpOM0RmyrgCCvbpiLS0"]
+    assert owl_class is ontology["R8CdMpOM0RmyrgCCvbpiLS0"]
+    assert ontology.classes.num_materialized() == 1
+
+    # iterating materializes the rest
+    assert ontology.classes == folio_graph.classes
+    assert ontology.classes.num_materialized() == len(folio_graph.classes)
+
+
+def test_lazy_classes_concurrent(folio_graph):
+    """
+    Test that threads reading lazy classes for the first time share complete models.
+    """
+    ontology = FOLIO(use_snapshot=False, lazy_classes=True)
+    barrier = threading.Barrier(4)
+    seen = [[] for _ in range(4)]
+
+    def read_classes(thread_index):
+        barrier.wait()
+        seen[thread_index] = list(ontology.classes)
+
+    threads = [threading.Thread(target=read_classes, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert ontology.classes == folio_graph.classes
+    for thread_classes in seen:
+        assert all(
+            left is right for left, right in zip(thread_classes, ontology.classes)
+        )
+
+
 def test_load_owl_github():
     """
     Test the load_owl method of the FOLIO class with the default GitHub repository.
@@ -154,6 +539,153 @@ def test_load_owl():
     assert "owl:Ontology" in ontology
 
 
+def test_load_owl_if_modified(tmp_path):
+    """
+    Test conditional revalidation of the cached ontology.
+    """
+    # the first request downloads the ontology and stores its validators
+    ontology = FOLIO.load_owl_if_modified(cache_path=tmp_path)
+    assert ontology is not None
+    assert b"owl:Ontology" in ontology
+
+    metadata = read_cache_metadata(FOLIO.get_cache_file_path(cache_path=tmp_path))
+    assert metadata is not None
+    assert metadata.etag is not None or metadata.last_modified is not None
+
+    # the second request is conditional and reports the cache as current
+    assert FOLIO.load_owl_if_modified(cache_path=tmp_path) is None
+
+
+def test_load_owl_if_modified_http(tmp_path):
+    """
+    Test conditional revalidation of the cached ontology from an HTTP URL.
+    """
+    http_url = "https://github.com/alea-institute/FOLIO/raw/main/FOLIO.owl"
+    ontology = FOLIO.load_owl_if_modified(
+        cache_path=tmp_path, source_type="http", http_url=http_url
+    )
+    assert ontology is not None
+    assert b"owl:Ontology" in ontology
+
+    assert (
+        FOLIO.load_owl_if_modified(
+            cache_path=tmp_path, source_type="http", http_url=http_url
+        )
+        is None
+    )
+
+
+def test_load_owl_cache_path(tmp_path):
+    """
+    Test loading the ontology into a custom cache directory without rewriting it on a hit.
+    """
+    ontology = FOLIO.load_owl(cache_path=tmp_path)
+    assert "owl:Ontology" in ontology
+
+    cache_file_path = FOLIO.get_cache_file_path(cache_path=tmp_path)
+    assert cache_file_path.exists()
+    mtime_ns = cache_file_path.stat().st_mtime_ns
+
+    # a cache hit does not rewrite the file
+    assert FOLIO.load_owl(cache_path=tmp_path) == ontology
+    assert cache_file_path.stat().st_mtime_ns == mtime_ns
+
+
+def test_cache_store_write(tmp_path):
+    """
+    Test that cache store writes record a digest and skip unchanged content.
+    """
+    cache_store = CacheStore(tmp_path)
+    cache_file_path = cache_store.get_path("http", "https://example.com/FOLIO.owl")
+    assert cache_file_path.parent == tmp_path / "http"
+
+    # the first write stores the buffer and its digest
+    assert cache_store.write(cache_file_path, b"<rdf:RDF/>")
+    assert cache_store.read(cache_file_path) == b"<rdf:RDF/>"
+    assert read_cache_metadata(cache_file_path).digest is not None
+
+    # unchanged content is not rewritten
+    mtime_ns = cache_file_path.stat().st_mtime_ns
+    assert not cache_store.write(cache_file_path, b"<rdf:RDF/>")
+    assert cache_file_path.stat().st_mtime_ns == mtime_ns
+
+    # changed content is rewritten
+    assert cache_store.write(cache_file_path, b"<rdf:RDF></rdf:RDF>")
+    assert cache_store.read(cache_file_path) == b"<rdf:RDF></rdf:RDF>"
+
+    # the cache file can be memory-mapped
+    with cache_store.open(cache_file_path) as mapped:
+        assert mapped[:] == b"<rdf:RDF></rdf:RDF>"
+
+
+def test_cache_store_open_unmapped(tmp_path, monkeypatch):
+    """
+    Test that cache files are read instead of mapped where mapped files cannot be replaced.
+    """
+    monkeypatch.setattr(folio.cache, "MAP_CACHE_FILES", False)
+    cache_store = CacheStore(tmp_path)
+    cache_file_path = cache_store.get_path("http", "https://example.com/FOLIO.owl")
+    cache_store.write(cache_file_path, b"<rdf:RDF/>")
+
+    # the cache file can be replaced while it is open
+    with cache_store.open(cache_file_path) as data:
+        assert data == b"<rdf:RDF/>"
+        assert cache_store.write(cache_file_path, b"<rdf:RDF></rdf:RDF>")
+        assert data == b"<rdf:RDF/>"
+
+
+def test_source_digest(tmp_path):
+    """
+    Test that strings and files are digested in chunks like their bytes, and that deferred
+    digests are computed on first use and pickled as the digest alone.
+    """
+    owl_bytes = FOLIO.load_owl().encode("utf-8")
+    owl_path = tmp_path / "FOLIO.owl"
+    owl_path.write_bytes(owl_bytes)
+    assert get_digest(owl_path) == get_digest(owl_bytes)
+    assert get_digest(owl_bytes.decode("utf-8")) == get_digest(owl_bytes)
+
+    digest = SourceDigest(buffer=owl_bytes)
+    assert pickle.loads(pickle.dumps(digest)).get() == get_digest(owl_bytes)
+    assert digest == SourceDigest(get_digest(owl_bytes))
+
+    # the digest verified by the cache is reused for the parsed state
+    cache_store = CacheStore(tmp_path)
+    cache_file_path = cache_store.get_path("http", "https://example.com/FOLIO.owl")
+    cache_store.write(cache_file_path, owl_bytes)
+    with cache_store.open_verified(cache_file_path) as (mapped, verified_digest):
+        assert verified_digest == get_digest(owl_bytes)
+        assert mapped[:] == owl_bytes
+    assert cache_store.read_or_fetch_verified(cache_file_path, lambda: None) == (
+        owl_bytes,
+        get_digest(owl_bytes),
+    )
+
+
+def test_cache_store_digest_mismatch(tmp_path):
+    """
+    Test that a corrupted cache file is treated as a cache miss.
+    """
+    cache_store = CacheStore(tmp_path)
+    cache_file_path = cache_store.get_path("http", "https://example.com/FOLIO.owl")
+    cache_store.write(cache_file_path, b"<rdf:RDF/>")
+
+    # corrupt the cache file
+    cache_file_path.write_text("<rdf:RDF", encoding="utf-8")
+    assert cache_store.read(cache_file_path) is None
+    with cache_store.open(cache_file_path) as mapped:
+        assert mapped is None
+
+    # read_or_fetch refetches and repairs the cache
+    assert (
+        cache_store.read_or_fetch(
+            cache_file_path, lambda: (b"<rdf:RDF/>", read_cache_metadata(cache_file_path))
+        )
+        == b"<rdf:RDF/>"
+    )
+    assert cache_store.read(cache_file_path) == b"<rdf:RDF/>"
+
+
 def test_load_owl_bad_source():
     """
     Test the load_owl method of the FOLIO class with the default HTTP URL.
@@ -163,6 +695,73 @@ def test_load_owl_bad_source():
         FOLIO.load_owl("bad")
 
 
+@pytest.mark.asyncio
+async def test_aload(folio_graph):
+    """
+    Test that the async loader parses the same ontology as the synchronous constructor.
+    """
+    ontology = await FOLIO.aload(use_snapshot=False)
+    assert len(ontology) == len(folio_graph)
+    assert ontology.iri_to_index == folio_graph.iri_to_index
+    assert ontology.triples == folio_graph.triples
+    assert ontology.search_by_prefix("Mich") == folio_graph.search_by_prefix("Mich")
+
+
+@pytest.mark.asyncio
+async def test_aload_process_executor(folio_graph):
+    """
+    Test that the async loader can parse the ontology in a separate process.
+    """
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        ontology = await FOLIO.aload(use_snapshot=False, executor=executor)
+    assert len(ontology) == len(folio_graph)
+    assert ontology.class_edges == folio_graph.class_edges
+
+
+@pytest.mark.asyncio
+async def test_arefresh(tmp_path):
+    """
+    Test async refreshes, including a conditional refresh of an unchanged ontology.
+    """
+    ontology = await FOLIO.aload(cache_path=tmp_path)
+    num_classes = len(ontology)
+
+    assert await ontology.arefresh()
+    assert len(ontology) == num_classes
+
+    assert not await ontology.arefresh(conditional=True)
+    assert len(ontology) == num_classes
+
+
+def test_snapshot_round_trip(folio_graph, tmp_path):
+    """Snapshots restore the parsed state and are rejected once the OWL cache changes."""
+    # write an OWL cache file and a snapshot into a temporary cache directory
+    owl_buffer = FOLIO.load_owl()
+    FOLIO.save_cache(owl_buffer, cache_path=tmp_path)
+    snapshot_path = folio_graph.save_snapshot(cache_path=tmp_path)
+    assert snapshot_path is not None
+    assert snapshot_path.exists()
+
+    # restore the snapshot into another instance
+    ontology = FOLIO(use_snapshot=False)
+    assert ontology.load_snapshot(cache_path=tmp_path)
+    assert len(ontology) == len(folio_graph)
+    assert ontology.iri_to_index == folio_graph.iri_to_index
+    assert ontology.triples == folio_graph.triples
+    assert ontology.search_by_prefix("Mich") == folio_graph.search_by_prefix("Mich")
+
+    # rewriting the OWL cache file invalidates the snapshot
+    FOLIO.save_cache(owl_buffer + "\n", cache_path=tmp_path)
+    assert not ontology.load_snapshot(cache_path=tmp_path)
+
+    # a state parsed before the cache file was rewritten is not keyed on the new file
+    assert ontology.save_snapshot(cache_path=tmp_path) is not None
+    assert not ontology.load_snapshot(cache_path=tmp_path)
+    ontology.parse_owl(owl_buffer + "\n")
+    ontology.save_snapshot(cache_path=tmp_path)
+    assert ontology.load_snapshot(cache_path=tmp_path)
+
+
 def test_title_description(folio_graph):
     # check that we have a title and description
     assert folio_graph.title is not None
@@ -364,6 +963,28 @@ def test_search_definitions(folio_graph):
         assert "air" in c.definition
 
 
+def test_search_corpora(folio_graph):
+    """Label and definition search corpora should be preprocessed once at parse time."""
+    rapidfuzz = pytest.importorskip("rapidfuzz")
+    corpus = folio_graph._all_label_search_corpus
+    labels = list(folio_graph.label_to_index) + list(folio_graph.alt_label_to_index)
+    assert corpus.keys == labels
+    assert corpus.choices == [rapidfuzz.utils.default_process(label) for label in labels]
+    assert len(folio_graph._label_search_corpus) == len(folio_graph.label_to_index)
+
+    definitions = folio_graph._definition_search_corpus
+    for class_index, choice in zip(definitions.keys, definitions.choices):
+        assert choice == rapidfuzz.utils.default_process(
+            folio_graph.classes[class_index].definition
+        )
+
+    results = folio_graph.search_by_label("Georgia", include_alt_labels=False, limit=3)
+    assert 0 < len(results) <= 3
+    assert [score for _, score in results] == sorted(
+        (score for _, score in results), reverse=True
+    )
+
+
 def test_get_types(folio_graph):
     assert len(folio_graph.get_player_actors()) > 0
     assert len(folio_graph.get_areas_of_law()) > 0
@@ -413,6 +1034,109 @@ def test_triples(folio_graph):
     )
 
 
+def test_triple_store():
+    """
+    Test that the triple store keeps insertion order, only deduplicates on add(), and
+    decodes dictionary-encoded triples.
+    """
+    triples = TripleStore([("a", "p", "b")])
+    triples.append(("a", "p", "b"))
+    assert triples.add(("b", "p", "c"))
+    assert not triples.add(("a", "p", "b"))
+    assert triples == [("a", "p", "b"), ("a", "p", "b"), ("b", "p", "c")]
+    assert ("b", "p", "c") in triples
+    assert ("c", "p", "d") not in triples
+
+    # terms are stored once and triples are decoded on output
+    triples.extend([("c", "p", "d")])
+    assert triples.num_terms == 5
+    assert triples.get_term(triples.get_term_id("p")) == "p"
+    assert triples[-1] == ("c", "p", "d")
+    assert triples[1:] == [("a", "p", "b"), ("b", "p", "c"), ("c", "p", "d")]
+    assert triples.find(subject="a") == [("a", "p", "b"), ("a", "p", "b")]
+    assert triples.find(predicate="p", obj="d") == [("c", "p", "d")]
+    assert triples.find(subject="d") == []
+
+    # membership and term indexes survive pickling
+    restored = pickle.loads(pickle.dumps(triples))
+    assert restored == triples
+    assert not restored.add(("c", "p", "d"))
+    assert restored.find(predicate="p", obj="b") == [("a", "p", "b"), ("a", "p", "b")]
+    assert restored.find(subject="b", obj="b") == []
+
+    # removing rows keeps the order of the rest and leaves the original store unchanged
+    remaining = triples.without_rows(triples.find_rows(subject="a"))
+    assert remaining == [("b", "p", "c"), ("c", "p", "d")]
+    assert remaining.find(predicate="p") == [("b", "p", "c"), ("c", "p", "d")]
+    remaining.append(("c", "p", "e"))
+    assert remaining.find(subject="c") == [("c", "p", "d"), ("c", "p", "e")]
+    assert triples.find(subject="c") == [("c", "p", "d")]
+    assert len(triples) == 4
+
+    # appending an encoded store matches appending its triples one at a time
+    encoded = TripleStore([("e", "q", "a"), ("b", "p", "e")]).to_encoded()
+    other = TripleStore.from_encoded(pickle.loads(pickle.dumps(encoded)))
+    expected = list(remaining) + list(other)
+    remaining.extend_store(other)
+    assert remaining == expected
+    assert remaining == TripleStore(expected)
+    assert remaining.find(subject="b") == [("b", "p", "c"), ("b", "p", "e")]
+    assert remaining.find(obj="a") == [("e", "q", "a")]
+    assert ("e", "q", "a") in remaining
+    assert triples.find(subject="b") == [("b", "p", "c")]
+
+    # frozen stores reject inserts
+    triples.freeze()
+    with pytest.raises(TypeError):
+        triples.append(("d", "p", "e"))
+    with pytest.raises(TypeError):
+        triples.add(("d", "p", "e"))
+    assert triples.num_terms == 5
+    assert not pickle.loads(pickle.dumps(triples)).frozen
+
+
+def test_triple_store_match():
+    """
+    Test matching triple patterns with shared variables against the triple store.
+    """
+    triples = TripleStore(
+        [
+            ("a", "subClassOf", "x"),
+            ("b", "subClassOf", "x"),
+            ("c", "subClassOf", "y"),
+            ("a", "seeAlso", "z"),
+            ("c", "seeAlso", "z"),
+            ("x", "subClassOf", "y"),
+            ("d", "sameAs", "d"),
+        ]
+    )
+    assert triples.match(
+        [("?class", "subClassOf", "x"), ("?class", "seeAlso", "z")]
+    ) == [{"class": "a"}]
+    assert triples.match(
+        [("?class", "subClassOf", "?parent"), ("?parent", "subClassOf", "y")]
+    ) == [{"class": "a", "parent": "x"}, {"class": "b", "parent": "x"}]
+    assert triples.match([("?s", "?p", "?s")]) == [{"s": "d", "p": "sameAs"}]
+    assert len(triples.match([("?s", "subClassOf", "?o")], limit=2)) == 2
+    assert triples.match([("?s", "subClassOf", "missing")]) == []
+    with pytest.raises(ValueError):
+        triples.match([])
+
+
+def test_match_triples(folio_graph):
+    """
+    Test matching triple patterns against the ontology triples.
+    """
+    solutions = folio_graph.match_triples(
+        [("?class", "rdfs:subClassOf", "?parent"), ("?class", "rdfs:label", "?label")],
+        limit=10,
+    )
+    assert len(solutions) == 10
+    for solution in solutions:
+        assert solution["parent"] in folio_graph[solution["class"]].sub_class_of
+        assert folio_graph[solution["class"]].label == solution["label"]
+
+
 def test_object_properties(folio_graph):
     """Test that object properties are properly parsed from the OWL file."""
     # Check that we have object properties
@@ -636,6 +1360,239 @@ def test_query_by_parent_iri(folio_graph):
         assert cls.iri in area_of_law_iris
 
 
+def test_iter_subgraph(folio_graph):
+    """
+    Test that subgraph traversal visits each class once and reports its depth.
+    """
+    aol_iri = "RSYBzf149Mi5KE0YtmpUmr"
+    traversal = list(folio_graph.iter_subgraph(aol_iri, max_depth=2))
+    assert traversal[0] == (folio_graph[aol_iri], 0)
+    assert all(0 <= depth <= 2 for _, depth in traversal)
+    iris = [owl_class.iri for owl_class, _ in traversal]
+    assert len(iris) == len(set(iris))
+    assert [c.iri for c in folio_graph.get_subgraph(aol_iri, max_depth=2)] == iris
+    assert [c.iri for c in folio_graph.get_children(aol_iri, max_depth=2)] == iris[1:]
+
+    # breadth-first traversal reaches the same classes in order of depth
+    breadth_first = list(
+        folio_graph.iter_subgraph(aol_iri, max_depth=2, breadth_first=True)
+    )
+    assert {c.iri for c, _ in breadth_first} == set(iris)
+    depths = [depth for _, depth in breadth_first]
+    assert depths == sorted(depths)
+
+    # parents are traversed upwards, starting with the class itself
+    child = folio_graph.get_children(aol_iri, max_depth=1)[0]
+    parents = list(folio_graph.iter_subgraph(child.iri, direction="parents"))
+    assert parents[0] == (child, 0)
+    assert (folio_graph[aol_iri], 1) in parents
+    assert list(folio_graph.iter_subgraph("missing")) == []
+
+
+def test_class_hierarchy():
+    """
+    Test interval labeling of a class hierarchy with multiple parents.
+    """
+    # 0 -> 1 -> 3, 0 -> 2 -> 3 -> 4, and 5 -> 2
+    hierarchy = ClassHierarchy([[1, 2], [3], [3], [4], [], [2]])
+    assert sorted(hierarchy.iter_descendants(0)) == [1, 2, 3, 4]
+    assert sorted(hierarchy.iter_descendants(5)) == [2, 3, 4]
+    assert hierarchy.count_descendants(5) == 3
+    assert hierarchy.is_descendant(4, 5)
+    assert not hierarchy.is_descendant(1, 5)
+    assert not hierarchy.is_descendant(0, 0)
+    assert list(hierarchy.iter_descendants(4)) == []
+
+
+def test_class_hierarchy_cycles():
+    """
+    Test that classes in a subclass cycle are labeled with the descendants of the whole cycle.
+    """
+    # 0 -> 1 -> 2 -> 3, 2 -> 1, and 4 -> 4
+    hierarchy = ClassHierarchy([[1], [2], [1, 3], [], [4]])
+    assert sorted(hierarchy.iter_descendants(0)) == [1, 2, 3]
+    assert sorted(hierarchy.iter_descendants(1)) == [2, 3]
+    assert sorted(hierarchy.iter_descendants(2)) == [1, 3]
+    assert hierarchy.count_descendants(2) == 2
+    assert hierarchy.is_descendant(1, 2)
+    assert hierarchy.is_descendant(2, 1)
+    assert not hierarchy.is_descendant(0, 2)
+    assert not hierarchy.is_descendant(4, 4)
+    assert hierarchy.count_descendants(4) == 0
+
+
+def test_is_descendant(folio_graph):
+    """
+    Test ancestor/descendant checks against the class hierarchy.
+    """
+    aol_iri = "RSYBzf149Mi5KE0YtmpUmr"
+    for cls in folio_graph.get_areas_of_law()[:20]:
+        assert folio_graph.is_descendant(cls.iri, aol_iri)
+        assert not folio_graph.is_descendant(aol_iri, cls.iri)
+    assert not folio_graph.is_descendant(aol_iri, aol_iri)
+    assert not folio_graph.is_descendant("missing", aol_iri)
+
+
+def test_class_adjacency(folio_graph):
+    """
+    Test the CSR adjacency against the parent_class_of and sub_class_of fields.
+    """
+    adjacency = folio_graph.class_adjacency
+    assert len(adjacency) == len(folio_graph.classes)
+
+    aol_index = folio_graph.iri_to_index[
+        folio_graph.normalize_iri(FOLIO_TYPE_IRIS[FOLIOTypes.AREA_OF_LAW])
+    ]
+    aol = folio_graph.classes[aol_index]
+    assert [
+        folio_graph.classes[index].iri for index in adjacency.get_children(aol_index)
+    ] == aol.parent_class_of
+    for child_index in adjacency.get_children(aol_index):
+        assert aol_index in adjacency.get_parents(child_index)
+
+    offsets, targets = adjacency.get_arrays("parents")
+    assert len(offsets) == len(adjacency) + 1 and offsets[-1] == len(targets)
+    with pytest.raises(ValueError):
+        adjacency.get_arrays("siblings")
+
+    numpy = pytest.importorskip("numpy")
+    indptr, indices = adjacency.to_numpy()
+    assert numpy.array_equal(
+        indices[indptr[aol_index] : indptr[aol_index + 1]],
+        adjacency.get_children(aol_index),
+    )
+
+
+def test_lowest_common_ancestor(folio_graph):
+    """
+    Test lowest common ancestor and shortest path queries.
+    """
+    aol_iri = folio_graph.normalize_iri(FOLIO_TYPE_IRIS[FOLIOTypes.AREA_OF_LAW])
+    children = folio_graph.get_children(aol_iri, max_depth=1)
+    first, second = children[0], children[1]
+
+    assert folio_graph.get_lowest_common_ancestor(first.iri, second.iri).iri == aol_iri
+    assert folio_graph.get_lowest_common_ancestor(first.iri, aol_iri).iri == aol_iri
+    assert folio_graph.get_lowest_common_ancestor(first.iri, "missing") is None
+
+    path = folio_graph.get_shortest_path(first.iri, second.iri)
+    assert [cls.iri for cls in path] == [first.iri, aol_iri, second.iri]
+    assert folio_graph.get_shortest_path(first.iri, first.iri) == [first]
+    assert folio_graph.get_shortest_path("missing", first.iri) == []
+
+    pairs = [(first.iri, second.iri), (second.iri, aol_iri), ("missing", aol_iri)]
+    assert folio_graph.get_lowest_common_ancestors(pairs) == [
+        folio_graph.get_lowest_common_ancestor(iri, other_iri)
+        for iri, other_iri in pairs
+    ]
+    assert [len(path) for path in folio_graph.get_shortest_paths(pairs)] == [3, 2, 0]
+
+
+def test_branch_membership(folio_graph):
+    """
+    Test the precomputed branch membership against hierarchy traversal.
+    """
+    aol_iri = FOLIO_TYPE_IRIS[FOLIOTypes.AREA_OF_LAW]
+    for max_depth in (DEFAULT_MAX_DEPTH, DEFAULT_SEARCH_MAX_DEPTH, 3, -1):
+        assert folio_graph.get_folio_branch(
+            FOLIOTypes.AREA_OF_LAW, max_depth=max_depth
+        ) == folio_graph.get_children(aol_iri, max_depth=max_depth)
+
+    for cls in folio_graph.get_areas_of_law()[:20]:
+        assert FOLIOTypes.AREA_OF_LAW in folio_graph.get_class_branches(cls.iri)
+    assert FOLIOTypes.AREA_OF_LAW not in folio_graph.get_class_branches(aol_iri)
+    assert folio_graph.get_class_branches("missing") == []
+
+
+def test_text_index():
+    """
+    Test trigram candidate generation in the text index.
+    """
+    index = TextIndex(
+        [
+            ("Contract Law", None, ["Agreements"], [], [], None, None),
+            ("Tax Law", "Taxation of income.", [], [], [], None, None),
+            ("Court", None, [], [], ["Law courts"], None, None),
+        ]
+    )
+    assert len(index) == 3
+    assert index.get_lowered(0)[:3] == ("contract law", None, ("agreements",))
+    assert list(index.iter_candidates(["LAW"])) == [0, 1, 2]
+    assert list(index.iter_candidates(["law", "tax"])) == [1]
+    assert list(index.iter_candidates(["law"], [0, 2])) == [0, 2]
+    assert list(index.iter_candidates(["xyz"])) == []
+    assert index.iter_candidates(["la"]) is None
+
+
+def test_class_facets():
+    """
+    Test facet bitmaps and bitmap views.
+    """
+    facets = ClassFacets(
+        10,
+        deprecated=[1, 8],
+        has_children=[0, 1, 2],
+        branches={"AREA_OF_LAW": [2, 3, 9]},
+        countries={"US": [3, 4], "United Kingdom": [9]},
+    )
+    assert facets.all == (1 << 10) - 1
+    assert facets.deprecated == bitmap_from_indices([8, 1], 10)
+    assert facets.match_countries(lambda country: country.startswith("U")) == (
+        bitmap_from_indices([3, 4, 9], 10)
+    )
+
+    mask = facets.all & ~facets.deprecated & ~facets.has_children
+    view = BitmapView(mask & facets.branches["AREA_OF_LAW"], facets.size)
+    assert list(view) == [3, 9]
+    assert 9 in view and 2 not in view
+    assert list(BitmapView(0, 0)) == []
+
+
+def test_query_explain(folio_graph):
+    """query(explain=True) should report the plan along with the same results."""
+    kwargs = {"any_text": "securities", "branch": "AREA_OF_LAW", "limit": 5}
+    plan = folio_graph.query(explain=True, **kwargs)
+    assert isinstance(plan, QueryPlan)
+    assert plan.results == folio_graph.query(**kwargs)
+    assert plan.num_results == len(plan.results)
+    assert plan.driver in ("text", "facets")
+    assert [stage.name for stage in plan.stages] == [
+        "not deprecated",
+        "branch",
+        "plan",
+        "match",
+    ]
+    assert plan.stages[1].candidates <= plan.stages[0].candidates
+    assert "QueryPlan(driver=" in str(plan)
+
+    assert folio_graph.query(has_children=True, explain=True).driver == "facets"
+    assert folio_graph.query(branch="unknown", explain=True).results == []
+
+
+def test_query_text_index(folio_graph):
+    """query() should return the same classes with and without the text index."""
+    results = folio_graph.query(any_text="securities", limit=1000)
+    assert len(results) > 0
+    expected = [
+        cls
+        for cls in folio_graph.classes
+        if not cls.deprecated
+        and any(
+            "securities" in text.lower()
+            for text in [
+                cls.label or "",
+                cls.definition or "",
+                cls.comment or "",
+                cls.description or "",
+                *cls.alternative_labels,
+                *cls.examples,
+                *cls.notes,
+            ]
+        )
+    ][:1000]
+    assert results == expected
+
+
 def test_query_deprecated_excluded_by_default(folio_graph):
     """query() should exclude deprecated classes by default."""
     all_results = folio_graph.query(limit=100)
@@ -667,6 +1624,35 @@ def test_query_fuzzy_mode(folio_graph):
     assert len(results) > 0
 
 
+def test_query_fuzzy_score_cutoff(folio_graph):
+    """Fuzzy query() results should be ordered by score and honor the score cutoff."""
+    rapidfuzz = pytest.importorskip("rapidfuzz")
+    results = folio_graph.query(label="securities", match_mode="fuzzy", limit=50)
+    assert len(results) > 0
+    scores = [
+        rapidfuzz.fuzz.partial_ratio("securities", cls.label.lower()) for cls in results
+    ]
+    assert scores == sorted(scores, reverse=True)
+    assert all(score >= 70 for score in scores)
+
+    strict = folio_graph.query(
+        label="securities", match_mode="fuzzy", limit=1000, score_cutoff=100
+    )
+    assert all("securities" in cls.label.lower() for cls in strict)
+
+
+def test_query_fuzzy_facets(folio_graph, monkeypatch):
+    """Fuzzy query() should score only the filtered classes without changing the results."""
+    pytest.importorskip("rapidfuzz")
+    query = dict(label="law", branch="AREA_OF_LAW", match_mode="fuzzy", limit=1000)
+    results = folio_graph.query(**query)
+    assert results
+
+    # score the whole field corpora and filter afterwards
+    monkeypatch.setattr(folio.graph, "FUZZY_SUBSET_FRACTION", 0.0)
+    assert folio_graph.query(**query) == results
+
+
 def test_query_properties_by_label(folio_graph):
     """query_properties() should find properties by label substring."""
     results = folio_graph.query_properties(label="has", limit=10)